@@ -0,0 +1,53 @@
+"""
+Command line of the benchmark suite.
+
+    python -m benchmarks run [-o results.json] [--shapes flat wide] [--sizes small medium]
+    python -m benchmarks compare baseline.json current.json [--threshold 0.1]
+
+`compare` exits with status 1 when a case got slower than the threshold allows.
+"""
+import argparse
+import sys
+
+from benchmarks import suite
+from benchmarks.generators import SHAPES
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog='python -m benchmarks', description="Parser benchmark suite")
+    commands = parser.add_subparsers(dest='command')
+
+    run = commands.add_parser('run', help="run the suite and write the results as JSON")
+    run.add_argument('-o', '--output', default='benchmark-results.json', help="the JSON results file")
+    run.add_argument('--shapes', nargs='+', choices=list(SHAPES), default=list(SHAPES))
+    run.add_argument('--sizes', nargs='+', choices=['small', 'medium', 'large'],
+                     default=['small', 'medium', 'large'])
+    run.add_argument('--repeat', type=int, default=suite.DEFAULT_REPEAT)
+    run.add_argument('--min-time', type=float, default=suite.DEFAULT_MIN_TIME,
+                     help="the minimum duration of one sample, in seconds")
+
+    compare = commands.add_parser('compare', help="compare two JSON results files")
+    compare.add_argument('baseline')
+    compare.add_argument('current')
+    compare.add_argument('--threshold', type=float, default=suite.DEFAULT_THRESHOLD,
+                         help="the relative slowdown reported as a regression")
+
+    args = parser.parse_args()
+    if args.command == 'compare':
+        comparison = suite.compare(suite.load(args.baseline), suite.load(args.current), args.threshold)
+        for entry in comparison:
+            print(suite.format_comparison(entry))
+        return 1 if any(entry['status'] == 'regression' for entry in comparison) else 0
+    if args.command != 'run':
+        parser.print_help()
+        return 2
+
+    results = suite.run(args.shapes, args.sizes, args.repeat, args.min_time,
+                        report=lambda result: print(suite.format_result(result), flush=True))
+    suite.write(results, args.output)
+    print(f"Results written to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
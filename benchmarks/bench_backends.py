@@ -0,0 +1,42 @@
+"""
+Compares the installed JSON backends on the parsing and encoding side of the library, for a single
+product document and for a DummyJson document of many products.
+
+Run with: python -m benchmarks.bench_backends
+"""
+import json
+import timeit
+
+from benchmarks.models import DummyJson, Product, dummy_payload, product_payload
+from object_serializer.serializer.json_parser import Parser
+from object_serializer.utils.json_backend import available_backends
+
+
+PRODUCTS = 1000
+REPEAT = 5
+
+
+def measure(function, number: int) -> float:
+    return min(timeit.repeat(function, repeat=REPEAT, number=number)) / number * 1e6
+
+
+def report(label: str, cls, payload, number: int) -> None:
+    text = json.dumps(payload)
+    data = text.encode('utf-8')
+    instance = Parser.validate_and_parse(cls, text)
+    print(f"{label} ({len(data)} bytes)")
+    for name in available_backends():
+        parse = measure(lambda: Parser.validate_and_parse(cls, text, backend=name), number)
+        parse_bytes = measure(lambda: Parser.validate_and_parse_many(cls, [data], backend=name), number)
+        dumps = measure(lambda: Parser.dumps(instance, backend=name), number)
+        print(f"  {name:8} parse str {parse:10.2f} us   parse bytes {parse_bytes:10.2f} us   "
+              f"dumps {dumps:10.2f} us")
+
+
+def main():
+    report("Product", Product, product_payload(0), 2000)
+    report(f"DummyJson, {PRODUCTS} products", DummyJson, dummy_payload(PRODUCTS), 5)
+
+
+if __name__ == "__main__":
+    main()
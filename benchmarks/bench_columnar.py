@@ -0,0 +1,48 @@
+"""
+Compares decoding the reviews of many products into Reviews instances with decoding them into
+columns (`Parser.validate_columns`), in time and in memory held by the result.
+
+Run with: python -m benchmarks.bench_columnar [reviews]
+"""
+import gc
+import sys
+import time
+import tracemalloc
+
+from benchmarks.models import Reviews, product_payload
+from object_serializer.serializer.json_parser import Parser
+
+
+REVIEWS = 100000
+
+
+def measure(function):
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = function()
+    elapsed = time.perf_counter() - start
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, size
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else REVIEWS
+    records = product_payload(0, reviews=count)['reviews']
+    for index, record in enumerate(records):
+        record['comment'] = f"comment {index}"
+
+    cases = [
+        ("instances", lambda: Parser.validate_and_parse_many(Reviews, records).values),
+        ("columns", lambda: Parser.validate_columns(Reviews, records)),
+        ("columns (array)", lambda: Parser.validate_columns(Reviews, records, numeric_lists='array')),
+    ]
+    for label, function in cases:
+        result, elapsed, size = measure(function)
+        print(f"{label:16} {elapsed * 1e3:9.1f} ms   {size / 2 ** 20:8.2f} MiB held")
+        del result
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,33 @@
+"""
+Compares the generic `Parser.validate_and_parse` path with the generated decoder of `Parser.compile`
+on the Product/Reviews model of `examples/complex_json.py`.
+
+Run with: python -m benchmarks.bench_compile
+"""
+import timeit
+
+from benchmarks.models import DummyJson, dummy_payload
+from object_serializer.serializer.json_parser import Parser
+
+
+PRODUCTS = 1000
+REPEAT = 5
+NUMBER = 10
+
+
+def main():
+    data = dummy_payload(PRODUCTS)
+    decoder = Parser.compile(DummyJson)
+    assert decoder(data) == Parser.validate_and_parse(DummyJson, data)
+
+    generic = min(timeit.repeat(lambda: Parser.validate_and_parse(DummyJson, data),
+                                repeat=REPEAT, number=NUMBER)) / NUMBER
+    compiled = min(timeit.repeat(lambda: decoder(data), repeat=REPEAT, number=NUMBER)) / NUMBER
+
+    print(f"validate_and_parse: {generic / PRODUCTS * 1e6:8.2f} us/product")
+    print(f"compiled decoder:   {compiled / PRODUCTS * 1e6:8.2f} us/product")
+    print(f"speedup:            {generic / compiled:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
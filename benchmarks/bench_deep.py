@@ -0,0 +1,68 @@
+"""
+Measures the decoding of deeply nested documents, a thread of replies and a balanced tree, with the
+recursive validation, the compiled decoder and the iterative (explicit stack) decoder, and checks
+that only the iterative one handles nesting deeper than the recursion limit.
+
+Run with: python -m benchmarks.bench_deep
+"""
+import sys
+import timeit
+from dataclasses import dataclass, field
+from typing import List
+
+from object_serializer.serializer.json_parser import Parser
+
+
+@dataclass
+class Reply:
+    author: str
+    score: int
+    replies: List['Reply'] = field(default_factory=list)
+
+
+REPEAT = 5
+
+
+def thread(depth: int) -> dict:
+    root = node = {'author': "a", 'score': 0}
+    for index in range(depth):
+        child = {'author': "a", 'score': index}
+        node['replies'] = [child]
+        node = child
+    return root
+
+
+def tree(depth: int, width: int = 2) -> dict:
+    node = {'author': "a", 'score': depth}
+    if depth:
+        node['replies'] = [tree(depth - 1, width) for _ in range(width)]
+    return node
+
+
+def measure(name: str, data: dict, nodes: int) -> None:
+    compiled = Parser.compile(Reply)
+    decoders = {
+        'recursive': lambda: Parser.validate_and_parse(Reply, data),
+        'compiled': lambda: compiled(data),
+        'iterative': lambda: Parser.validate_and_parse(Reply, data, iterative=True),
+    }
+    for decoder, decode in decoders.items():
+        try:
+            elapsed = min(timeit.repeat(decode, repeat=REPEAT, number=1))
+        except RecursionError:
+            print(f"{name:24} {decoder:10} RecursionError")
+            continue
+        print(f"{name:24} {decoder:10} {elapsed / nodes * 1e6:8.3f} us/node")
+
+
+def main():
+    limit = sys.getrecursionlimit()
+    # the recursive validation spends several Python frames per level of a thread
+    measure('thread depth 150', thread(150), 151)
+    measure(f"thread depth {limit // 2}", thread(limit // 2), limit // 2 + 1)
+    measure('tree depth 14', tree(14), 2 ** 15 - 1)
+    measure(f"thread depth {limit * 20}", thread(limit * 20), limit * 20 + 1)
+
+
+if __name__ == "__main__":
+    main()
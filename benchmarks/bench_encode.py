@@ -0,0 +1,35 @@
+"""
+Compares `dataclasses.asdict` + `json.dumps`, as done in `examples/complex_json.py`, with
+`Parser.dump` / `Parser.dumps`.
+
+Run with: python -m benchmarks.bench_encode
+"""
+import json
+import timeit
+from dataclasses import asdict
+
+from benchmarks.models import DummyJson, dummy_payload
+from object_serializer.serializer.json_parser import Parser
+
+
+PRODUCTS = 1000
+REPEAT = 5
+NUMBER = 10
+
+
+def measure(function) -> float:
+    return min(timeit.repeat(function, repeat=REPEAT, number=NUMBER)) / NUMBER / PRODUCTS * 1e6
+
+
+def main():
+    dummy = Parser.validate_and_parse(DummyJson, dummy_payload(PRODUCTS))
+    assert Parser.dump(dummy) == asdict(dummy)
+
+    print(f"asdict:              {measure(lambda: asdict(dummy)):8.2f} us/product")
+    print(f"Parser.dump:         {measure(lambda: Parser.dump(dummy)):8.2f} us/product")
+    print(f"asdict + json.dumps: {measure(lambda: json.dumps(asdict(dummy))):8.2f} us/product")
+    print(f"Parser.dumps:        {measure(lambda: Parser.dumps(dummy)):8.2f} us/product")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""
+Measures the peak memory and the time of decoding a large DummyJson document given as a string,
+as the bytes read from a file, and as the path of the file (memory-mapped), with every installed
+JSON backend.
+
+Run with: python -m benchmarks.bench_input
+"""
+import json
+import os
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from benchmarks.models import DummyJson, dummy_payload
+from object_serializer.serializer.json_parser import Parser
+from object_serializer.utils.json_backend import available_backends
+
+
+PRODUCTS = 20000
+
+
+def measure(decode) -> tuple:
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = decode()
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    del result
+    return elapsed, peak
+
+
+def main():
+    text = json.dumps(dummy_payload(PRODUCTS))
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / 'dummy.json'
+        path.write_text(text, encoding='utf-8')
+        print(f"DummyJson, {PRODUCTS} products ({os.path.getsize(path)} bytes)")
+        for name in available_backends():
+            inputs = {
+                'read str': lambda: Parser.validate_and_parse(DummyJson, path.read_text('utf-8'), backend=name),
+                'read bytes': lambda: Parser.validate_and_parse(DummyJson, path.read_bytes(), backend=name),
+                'path (mmap)': lambda: Parser.validate_and_parse(DummyJson, path, backend=name),
+            }
+            for label, decode in inputs.items():
+                elapsed, peak = measure(decode)
+                print(f"  {name:8} {label:12} {elapsed * 1e3:10.1f} ms   peak {peak / 2 ** 20:8.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,32 @@
+"""
+Compares eager and lazy decoding (`Parser.validate_and_parse(..., lazy=True)`) of a DummyJson document
+when only `id` and `price` of every product are read.
+
+Run with: python -m benchmarks.bench_lazy
+"""
+import timeit
+
+from benchmarks.models import DummyJson, dummy_payload
+from object_serializer.serializer.json_parser import Parser
+
+
+PRODUCTS = 1000
+REPEAT = 5
+NUMBER = 10
+
+
+def partial_read(lazy: bool, data) -> float:
+    dummy = Parser.validate_and_parse(DummyJson, data, lazy=lazy)
+    return sum(product.id + product.price for product in dummy.products)
+
+
+def main():
+    data = dummy_payload(PRODUCTS)
+    assert partial_read(True, data) == partial_read(False, data)
+    for lazy in (False, True):
+        elapsed = min(timeit.repeat(lambda: partial_read(lazy, data), repeat=REPEAT, number=NUMBER)) / NUMBER
+        print(f"lazy={str(lazy):5}  {elapsed / PRODUCTS * 1e6:8.2f} us/product")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""
+Compares plain lists with the numeric_lists='array' and 'numpy' options on a record holding a long
+List[float] (an embedding) and a List[int].
+
+Run with: python -m benchmarks.bench_numeric [length]
+"""
+import sys
+import timeit
+from dataclasses import dataclass
+from typing import List
+
+from object_serializer.serializer.json_parser import Parser
+
+
+LENGTH = 10000
+REPEAT = 5
+NUMBER = 20
+
+
+@dataclass
+class Embedding:
+    name: str
+    vector: List[float]
+    counts: List[int]
+
+
+def main():
+    length = int(sys.argv[1]) if len(sys.argv) > 1 else LENGTH
+    data = {'name': "e", 'vector': [i / 7 for i in range(length)], 'counts': list(range(length))}
+    modes = [None, 'array']
+    try:
+        import numpy  # noqa: F401
+        modes.append('numpy')
+    except ImportError:
+        print("NumPy is not installed, skipping numeric_lists='numpy'")
+
+    for mode in modes:
+        decoder = Parser.compile(Embedding, numeric_lists=mode)
+        generic = min(timeit.repeat(lambda: Parser.validate_and_parse(Embedding, data, numeric_lists=mode),
+                                    repeat=REPEAT, number=NUMBER)) / NUMBER
+        compiled = min(timeit.repeat(lambda: decoder(data), repeat=REPEAT, number=NUMBER)) / NUMBER
+        print(f"numeric_lists={str(mode):6} validate_and_parse {generic * 1e6:10.1f} us   "
+              f"compiled {compiled * 1e6:10.1f} us")
+
+
+if __name__ == "__main__":
+    main()
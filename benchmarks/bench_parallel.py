@@ -0,0 +1,46 @@
+"""
+Measures how `Parser.validate_and_parse_parallel` scales from 1 to N worker processes on JSON
+strings shaped like the products of `examples/complex_json.py`, against the single-process
+`Parser.validate_and_parse_many`.
+
+Run with: python -m benchmarks.bench_parallel [records] [max workers]
+"""
+import json
+import os
+import sys
+import time
+
+from benchmarks.models import Product, product_payload
+from object_serializer.serializer.json_parser import Parser
+
+
+RECORDS = 20000
+CHUNK_SIZE = 500
+
+
+def measure(function) -> float:
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+
+def main():
+    records = int(sys.argv[1]) if len(sys.argv) > 1 else RECORDS
+    max_workers = int(sys.argv[2]) if len(sys.argv) > 2 else (os.cpu_count() or 1)
+    payload = [json.dumps(product_payload(i)) for i in range(records)]
+
+    baseline = measure(lambda: Parser.validate_and_parse_many(Product, payload))
+    print(f"validate_and_parse_many: {baseline:7.3f} s")
+
+    workers = 1
+    while True:
+        elapsed = measure(lambda: Parser.validate_and_parse_parallel(Product, payload, max_workers=workers,
+                                                                     chunk_size=CHUNK_SIZE))
+        print(f"{workers:3d} worker(s):            {elapsed:7.3f} s  ({baseline / elapsed:5.2f}x)")
+        if workers >= max_workers:
+            break
+        workers = min(workers * 2, max_workers)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+Measures the rejection path: validating invalid records inside try/except, as done when filtering
+untrusted input, with the generic validation and with the compiled decoder.
+
+Run with: python -m benchmarks.bench_rejection
+"""
+import timeit
+from dataclasses import dataclass
+from typing import List, Optional
+
+from object_serializer.exceptions import TypeValueMismatchError, UnresolvedAttributeError
+from object_serializer.serializer.json_parser import Parser
+
+
+@dataclass
+class Review:
+    rating: int
+    comment: str
+
+
+@dataclass
+class Event:
+    id: int
+    name: str
+    score: float
+    tags: List[str]
+    review: Optional[Review]
+
+
+RECORDS = 10000
+REPEAT = 5
+
+INVALID = [
+    {'id': "1", 'name': "n", 'score': 1.0, 'tags': [], 'review': None},
+    {'id': 1, 'name': "n", 'score': 1.0, 'tags': ["a", 2], 'review': None},
+    {'id': 1, 'name': "n", 'score': 1.0, 'tags': [], 'review': {'rating': 1, 'comment': None}},
+    {'id': 1, 'name': "n", 'tags': [], 'review': None},
+]
+
+
+def reject(decode, records) -> int:
+    rejected = 0
+    for record in records:
+        try:
+            decode(record)
+        except (TypeValueMismatchError, UnresolvedAttributeError):
+            rejected += 1
+    return rejected
+
+
+def main():
+    records = [INVALID[index % len(INVALID)] for index in range(RECORDS)]
+    decoders = {
+        'validate_and_parse': lambda record: Parser.validate_and_parse(Event, record),
+        'compiled decoder': Parser.compile(Event),
+    }
+    for name, decode in decoders.items():
+        assert reject(decode, records) == RECORDS
+        elapsed = min(timeit.repeat(lambda: reject(decode, records), repeat=REPEAT, number=1))
+        print(f"{name:20} {elapsed / RECORDS * 1e6:8.2f} us/rejected record")
+
+
+if __name__ == "__main__":
+    main()
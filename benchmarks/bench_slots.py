@@ -0,0 +1,37 @@
+"""
+Compares decoding many Reviews records into the dataclass itself and into its slotted mirror
+(`Parser.slotted`), in time and in memory held by the decoded instances.
+
+Run with: python -m benchmarks.bench_slots [records]
+"""
+import gc
+import sys
+import time
+import tracemalloc
+
+from benchmarks.models import Reviews, product_payload
+from object_serializer.serializer.json_parser import Parser
+
+
+RECORDS = 200000
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else RECORDS
+    records = product_payload(0, reviews=count)['reviews']
+    for cls in (Reviews, Parser.slotted(Reviews)):
+        decode = Parser.compile(cls)
+        gc.collect()
+        tracemalloc.start()
+        start = time.perf_counter()
+        values = [decode(record) for record in records]
+        elapsed = time.perf_counter() - start
+        size, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        label = 'slotted mirror' if cls is not Reviews else 'dataclass'
+        print(f"{label:15} {elapsed * 1e3:9.1f} ms   {size / count:7.1f} bytes/instance")
+        del values
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""
+Synthetic dataclass models and payloads for the benchmark suite.
+
+Every generator takes a size and returns the root dataclass together with a matching payload
+dictionary. The meaning of the size depends on the shape:
+
+- flat: the number of records of eight primitive fields held by the root;
+- nested: the depth of a chain of nested dataclasses;
+- wide: the number of fields of a single dataclass;
+- list_heavy: the length of the lists of primitives and of nested lists;
+- optional_heavy: the number of records of sixteen optional fields (every other one null).
+
+Models are built once per size with `dataclasses.make_dataclass` and kept, so repeated runs reuse
+the same classes (and the same compiled plans).
+"""
+from dataclasses import make_dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+Case = Tuple[type, Dict[str, Any]]
+
+_PRIMITIVES = (int, str, float, bool)
+_models: Dict[Tuple[str, int], type] = {}
+
+
+def _primitive_value(tp: type, index: int) -> Any:
+    if tp is int:
+        return index
+    if tp is float:
+        return index + 0.5
+    if tp is bool:
+        return index % 2 == 0
+    return f"value {index}"
+
+
+def _model(shape: str, size: int, build: Callable[[], type]) -> type:
+    key = (shape, size)
+    cls = _models.get(key)
+    if cls is None:
+        cls = _models[key] = build()
+    return cls
+
+
+def flat(size: int) -> Case:
+    def build() -> type:
+        record = make_dataclass(f"FlatRecord{size}",
+                                [(f"f{i}", _PRIMITIVES[i % 4]) for i in range(8)])
+        return make_dataclass(f"Flat{size}", [('records', List[record])])
+
+    cls = _model('flat', size, build)
+    records = [{f"f{i}": _primitive_value(_PRIMITIVES[i % 4], n + i) for i in range(8)} for n in range(size)]
+    return cls, {'records': records}
+
+
+def nested(size: int) -> Case:
+    def build() -> type:
+        cls = make_dataclass(f"Nested{size}_0", [('id', int), ('name', str)])
+        for depth in range(1, size):
+            cls = make_dataclass(f"Nested{size}_{depth}", [('id', int), ('name', str), ('child', cls)])
+        return cls
+
+    cls = _model('nested', size, build)
+    payload: Dict[str, Any] = {'id': 0, 'name': "leaf"}
+    for depth in range(1, size):
+        payload = {'id': depth, 'name': f"node {depth}", 'child': payload}
+    return cls, payload
+
+
+def wide(size: int) -> Case:
+    def build() -> type:
+        return make_dataclass(f"Wide{size}", [(f"f{i}", _PRIMITIVES[i % 4]) for i in range(size)])
+
+    cls = _model('wide', size, build)
+    return cls, {f"f{i}": _primitive_value(_PRIMITIVES[i % 4], i) for i in range(size)}
+
+
+def list_heavy(size: int) -> Case:
+    def build() -> type:
+        item = make_dataclass(f"ListItem{size}", [('id', int), ('label', str)])
+        return make_dataclass(f"ListHeavy{size}", [
+            ('ints', List[int]),
+            ('strings', List[str]),
+            ('matrix', List[List[float]]),
+            ('items', List[item]),
+        ])
+
+    cls = _model('list_heavy', size, build)
+    return cls, {
+        'ints': list(range(size)),
+        'strings': [f"s{i}" for i in range(size)],
+        'matrix': [[float(i), i + 0.5, i + 0.25] for i in range(size)],
+        'items': [{'id': i, 'label': f"item {i}"} for i in range(size)],
+    }
+
+
+def optional_heavy(size: int) -> Case:
+    def build() -> type:
+        inner = make_dataclass(f"OptionalInner{size}", [('value', int)])
+        types = (*_PRIMITIVES, inner)
+        record = make_dataclass(f"OptionalRecord{size}",
+                                [(f"o{i}", Optional[types[i % len(types)]]) for i in range(16)])
+        return make_dataclass(f"OptionalHeavy{size}", [('summary', Optional[inner]), ('records', List[record])])
+
+    def value(i: int, n: int) -> Any:
+        if (i + n) % 2:
+            return None
+        if i % 5 == 4:
+            return {'value': n}
+        return _primitive_value(_PRIMITIVES[i % 5], n)
+
+    cls = _model('optional_heavy', size, build)
+    records = [{f"o{i}": value(i, n) for i in range(16)} for n in range(size)]
+    return cls, {'summary': {'value': size}, 'records': records}
+
+
+SHAPES: Dict[str, Callable[[int], Case]] = {
+    'flat': flat,
+    'nested': nested,
+    'wide': wide,
+    'list_heavy': list_heavy,
+    'optional_heavy': optional_heavy,
+}
+
+SIZES: Dict[str, Dict[str, int]] = {
+    'flat': {'small': 10, 'medium': 100, 'large': 1000},
+    'nested': {'small': 4, 'medium': 16, 'large': 64},
+    'wide': {'small': 16, 'medium': 64, 'large': 256},
+    'list_heavy': {'small': 10, 'medium': 100, 'large': 1000},
+    'optional_heavy': {'small': 10, 'medium': 100, 'large': 1000},
+}
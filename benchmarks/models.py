@@ -0,0 +1,91 @@
+from dataclasses import dataclass
+from typing import Any, Dict, List
+
+
+@dataclass
+class Meta:
+    createdAt: str
+    updatedAt: str
+    barcode: str
+    qrCode: str
+
+
+@dataclass
+class Reviews:
+    rating: int
+    comment: str
+    date: str
+    reviewerName: str
+    reviewerEmail: str
+
+
+@dataclass
+class Dimensions:
+    width: float
+    height: float
+    depth: float
+
+
+@dataclass
+class Product:
+    id: int
+    title: str
+    description: str
+    category: str
+    price: float
+    discountPercentage: float
+    rating: float
+    stock: int
+    tags: List[str]
+    dimensions: Dimensions
+    reviews: List[Reviews]
+    meta: Meta
+    availabilityStatus: str
+
+
+@dataclass
+class DummyJson:
+    products: List[Product]
+
+
+def product_payload(index: int, reviews: int = 3) -> Dict[str, Any]:
+    """
+    Builds an offline product dictionary shaped like the dummyjson.com products used in
+    `examples/complex_json.py`.
+    """
+    return {
+        'id': index,
+        'title': f"Product {index}",
+        'description': "An offline product used for benchmarking.",
+        'category': "beauty",
+        'price': 9.99 + index,
+        'discountPercentage': 7.17,
+        'rating': 4.94,
+        'stock': 5 + index % 7,
+        'tags': ["beauty", "mascara"],
+        'dimensions': {'width': 23.17, 'height': 14.43, 'depth': 28.01},
+        'reviews': [
+            {
+                'rating': 2 + i % 4,
+                'comment': "Very satisfied!",
+                'date': "2024-05-23T08:56:21.618Z",
+                'reviewerName': "John Doe",
+                'reviewerEmail': "john.doe@x.dummyjson.com"
+            }
+            for i in range(reviews)
+        ],
+        'meta': {
+            'createdAt': "2024-05-23T08:56:21.618Z",
+            'updatedAt': "2024-05-23T08:56:21.618Z",
+            'barcode': "9164035109868",
+            'qrCode': "https://assets.dummyjson.com/public/qr-code.png"
+        },
+        'availabilityStatus': "Low Stock"
+    }
+
+
+def dummy_payload(products: int) -> Dict[str, Any]:
+    """
+    Builds an offline DummyJson dictionary holding the given number of products.
+    """
+    return {'products': [product_payload(i) for i in range(products)]}
@@ -0,0 +1,184 @@
+"""
+Offline benchmark suite of the parser hot paths.
+
+For every synthetic shape and size of `benchmarks.generators` the suite times:
+
+- validate_and_parse: `Parser.validate_and_parse` on the payload dictionary;
+- validate_and_parse_json: `Parser.validate_and_parse` on the payload as a JSON string;
+- compiled: the decoder generated by `Parser.compile`;
+- serialize: `serialize` on the root dataclass;
+- validate_list_type / validate_optional_type: the validation of the first list (optional) field
+  of the root, when it has one;
+- validate_json: `Validator.validate_json` on the JSON string;
+- dumps: `Parser.dumps` of the decoded instance.
+
+Results are written as JSON, so two runs (e.g. of two commits) can be compared with `compare`.
+"""
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import timeit
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from benchmarks.generators import SHAPES, SIZES
+from object_serializer import VERSION
+from object_serializer.serializer.dataclass_serializer import serialize
+from object_serializer.serializer.json_parser import Parser
+from object_serializer.utils.json_backend import get_backend
+from object_serializer.utils.validations import Validator
+
+
+DEFAULT_REPEAT = 5
+DEFAULT_MIN_TIME = 0.05
+DEFAULT_THRESHOLD = 0.10
+
+
+def time_operation(function: Callable[[], Any], repeat: int, min_time: float) -> Dict[str, Any]:
+    """
+    Times a callable the way `timeit` does: the number of calls per sample is calibrated so that one
+    sample lasts at least `min_time` seconds, then `repeat` samples are taken.
+
+    :return: The number of calls per sample and the best and median time of one call, in microseconds.
+    """
+    timer = timeit.Timer(function)
+    number = 1
+    while True:
+        if timer.timeit(number) >= min_time:
+            break
+        number *= 10
+    samples = [elapsed / number * 1e6 for elapsed in timer.repeat(repeat=repeat, number=number)]
+    return {'number': number, 'best_us': min(samples), 'median_us': statistics.median(samples)}
+
+
+def operations(cls: type, payload: Dict[str, Any]) -> Dict[str, Callable[[], Any]]:
+    """
+    Builds the timed operations of one case.
+    """
+    text = json.dumps(payload)
+    instance = Parser.validate_and_parse(cls, payload)
+    decoder = Parser.compile(cls)
+    ops = {
+        'validate_and_parse': lambda: Parser.validate_and_parse(cls, payload),
+        'validate_and_parse_json': lambda: Parser.validate_and_parse(cls, text),
+        'compiled': lambda: decoder(payload),
+        'serialize': lambda: serialize(cls),
+    }
+    for name, tp in serialize(cls).items():
+        if 'validate_list_type' not in ops and Validator.is_lst(tp):
+            ops['validate_list_type'] = lambda name=name, tp=tp: Parser.validate_list_type(name, tp, payload[name])
+        if 'validate_optional_type' not in ops and Validator.is_optional(tp):
+            ops['validate_optional_type'] = (
+                lambda name=name, tp=tp: Parser.validate_optional_type(name, tp, payload[name]))
+    ops['validate_json'] = lambda: Validator.validate_json(text)
+    ops['dumps'] = lambda: Parser.dumps(instance)
+    return ops
+
+
+def _commit() -> Optional[str]:
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(shapes: Iterable[str] = tuple(SHAPES), sizes: Iterable[str] = ('small', 'medium', 'large'),
+        repeat: int = DEFAULT_REPEAT, min_time: float = DEFAULT_MIN_TIME,
+        report: Optional[Callable[[Dict[str, Any]], None]] = None) -> Dict[str, Any]:
+    """
+    Runs the suite.
+
+    :param shapes: The names of the shapes to run, see `benchmarks.generators.SHAPES`.
+    :param sizes: The size labels to run (small, medium, large).
+    :param repeat: The number of samples of every operation.
+    :param min_time: The minimum duration of one sample, in seconds.
+    :param report: Called with every result as soon as it is measured.
+    :return: The JSON-compatible results, with the environment they were measured in.
+    """
+    results: List[Dict[str, Any]] = []
+    for shape in shapes:
+        for label in sizes:
+            size = SIZES[shape][label]
+            cls, payload = SHAPES[shape](size)
+            for operation, function in operations(cls, payload).items():
+                result = {'shape': shape, 'size': label, 'scale': size, 'operation': operation}
+                result.update(time_operation(function, repeat, min_time))
+                results.append(result)
+                if report is not None:
+                    report(result)
+    return {
+        'meta': {
+            'commit': _commit(),
+            'version': VERSION,
+            'python': platform.python_version(),
+            'implementation': platform.python_implementation(),
+            'platform': platform.platform(),
+            'json_backend': get_backend().name,
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+            'repeat': repeat,
+            'min_time': min_time,
+        },
+        'results': results,
+    }
+
+
+def compare(baseline: Dict[str, Any], current: Dict[str, Any],
+            threshold: float = DEFAULT_THRESHOLD) -> List[Dict[str, Any]]:
+    """
+    Compares the best times of two runs, case by case.
+
+    :param baseline: The results of the reference run.
+    :param current: The results of the new run.
+    :param threshold: The relative slowdown above which a case is flagged as a regression (and the
+                      relative speedup above which it is flagged as an improvement).
+    :return: One entry per case measured in both runs, with the ratio current / baseline and a status
+             (regression, improvement or unchanged).
+    """
+    def key(result: Dict[str, Any]) -> Any:
+        return result['shape'], result['size'], result['operation']
+
+    reference = {key(result): result for result in baseline['results']}
+    comparison = []
+    for result in current['results']:
+        previous = reference.get(key(result))
+        if previous is None:
+            continue
+        ratio = result['best_us'] / previous['best_us']
+        if ratio > 1 + threshold:
+            status = 'regression'
+        elif ratio < 1 - threshold:
+            status = 'improvement'
+        else:
+            status = 'unchanged'
+        comparison.append({'shape': result['shape'], 'size': result['size'], 'operation': result['operation'],
+                           'baseline_us': previous['best_us'], 'current_us': result['best_us'],
+                           'ratio': ratio, 'status': status})
+    return comparison
+
+
+def format_result(result: Dict[str, Any]) -> str:
+    return (f"{result['shape']:15} {result['size']:7} {result['operation']:24} "
+            f"{result['best_us']:12.2f} us  (median {result['median_us']:.2f} us)")
+
+
+def format_comparison(entry: Dict[str, Any]) -> str:
+    return (f"{entry['shape']:15} {entry['size']:7} {entry['operation']:24} "
+            f"{entry['baseline_us']:12.2f} -> {entry['current_us']:12.2f} us  x{entry['ratio']:.2f}  {entry['status']}")
+
+
+def write(results: Dict[str, Any], path: str) -> None:
+    with open(path, 'w') as fp:
+        json.dump(results, fp, indent=2)
+        fp.write('\n')
+
+
+def load(path: str) -> Dict[str, Any]:
+    with open(path) as fp:
+        return json.load(fp)
+
+
+if __name__ == "__main__":
+    sys.exit("Run the suite with: python -m benchmarks")
@@ -1,7 +1,14 @@
 from object_serializer.serializer.dataclass_serializer import serialize, gen_dataclass_instance
 from object_serializer.serializer.json_parser import Parser
-from object_serializer.exceptions import NotAJsonError, NotADataclassError
+from object_serializer.serializer.batch import BatchResult, RecordError
+from object_serializer.serializer.report import FieldError, ValidationReport
+from object_serializer.serializer.stats import ParserStats
+from object_serializer.serializer.columnar import Columns
+from object_serializer.serializer.projection import EXCLUDED
+from object_serializer.exceptions import NotAJsonError, NotADataclassError, StreamDecodeError
 from object_serializer.utils.validations import Validator
+from object_serializer.utils.type_registry import register_scalar, unregister_scalar
+from object_serializer.utils.tagged_union import TaggedUnion
 
 VERSION = "0.1.0"
 
@@ -9,7 +16,18 @@ __all__ = [
     'Validator',
     'NotAJsonError',
     'NotADataclassError',
+    'StreamDecodeError',
     'serialize',
     'gen_dataclass_instance',
-    'Parser'
+    'Parser',
+    'BatchResult',
+    'RecordError',
+    'FieldError',
+    'ValidationReport',
+    'ParserStats',
+    'Columns',
+    'EXCLUDED',
+    'TaggedUnion',
+    'register_scalar',
+    'unregister_scalar'
 ]
\ No newline at end of file
@@ -1,23 +1,48 @@
-from dataclasses import field
 from typing import Any, Dict, Optional
 
 
+JSON_EXCERPT_LENGTH = 80
+"""The number of characters of a JSON payload quoted in the message of a NotAJsonError."""
+
+
+def _excerpt(json: Any) -> str:
+    if isinstance(json, (bytes, bytearray, memoryview)):
+        text, unit = bytes(json[:JSON_EXCERPT_LENGTH]).decode('utf-8', 'replace'), 'bytes'
+    else:
+        text, unit = (json if isinstance(json, str) else repr(json))[:JSON_EXCERPT_LENGTH], 'characters'
+    if len(json) > JSON_EXCERPT_LENGTH:
+        return f"{text}... ({len(json)} {unit})"
+    return text
+
+
 class NotADataclassError(Exception):
     """
     An error that indicates that the provided class is not a dataclass
     """
     def __init__(self, cls: Any):
         self.cls = cls
-        super().__init__(f"The class {cls.__name__} is not a dataclass.")
+        super().__init__(f"The class {getattr(cls, '__name__', repr(cls))} is not a dataclass.")
+
+    def __reduce__(self):
+        return type(self), (self.cls,)
 
 
 class NotAJsonError(Exception):
     """
     An error that indicates that the provided json cannot be parsed into a dictionary
+
+    The message quotes the first JSON_EXCERPT_LENGTH characters of the payload only and is built
+    when the error is printed.
     """
     def __init__(self, json: str):
         self.json = json
-        super().__init__(f"The provided JSON string is not valid: {json}")
+        super().__init__()
+
+    def __str__(self) -> str:
+        return f"The provided JSON string is not valid: {_excerpt(self.json)}"
+
+    def __reduce__(self):
+        return type(self), (self.json,)
 
 
 class InvalidDataTypeError(Exception):
@@ -28,24 +53,88 @@ class InvalidDataTypeError(Exception):
         self.cls = cls
         super().__init__(msg)
 
+    def __reduce__(self):
+        return type(self), (self.cls, self.args[0])
+
 
 class UnresolvedAttributeError(Exception):
     """
     An error that indicates that a MANDATORY FIELD is not found inside a json or dictionary
+
+    Without msg, the message is built from the class and field name when the error is printed.
     """
-    def __init__(self, cls: Optional[Any], data: Dict[str, Any], field_name, msg: str):
+    def __init__(self, cls: Optional[Any], data: Dict[str, Any], field_name, msg: Optional[str] = None):
         self.cls = cls
         self.data = data
         self.field_name = field_name
-        super().__init__(msg)
+        self._msg = msg
+        super().__init__(cls, field_name)
+
+    def __str__(self) -> str:
+        if self._msg is None:
+            if self.cls is None:
+                self._msg = f"Missing mandatory field {self.field_name}"
+            else:
+                self._msg = f"Missing mandatory field {self.field_name} in class {self.cls.__name__}"
+        return self._msg
+
+    def __reduce__(self):
+        return type(self), (self.cls, self.data, self.field_name, str(self))
 
 
 class TypeValueMismatchError(Exception):
     """
     An error that indicates when a json field and a serialized dataclass has a type value mismatch
+
+    The message is built when the error is printed, either from msg or from one of the templates
+    below, formatted with field_name, cls_type, json_type and the keyword arguments of the error, so
+    that raising (and catching) the error on untrusted input formats nothing.
     """
-    def __init__(self, field_name: str, cls_type: Any, json_type: any, msg: str):
+    EXPECTED_TYPE = "Expected type {cls_type} at field {field_name}, found {json_type} instead"
+    EXPECTED_LIST = "Expected a list at field {field_name}, found {json_type.__name__} instead"
+    EXPECTED_OBJECT = "Expected a new object at field {field_name}, found {json_type.__name__} instead"
+    EXPECTED_INNER_TYPE = "Expected type {expected} at field {field_name}, found {json_type.__name__} instead"
+    LIST_ITEMS = "List items at field {field_name} do not match the expected type"
+    LIST_ITEM = ("List items at field {field_name} do not match the expected type: item {index} is "
+                 "{item_type.__name__}, expected {expected.__name__}")
+    DICT_KEY = "Keys at field {field_name} must be strings, found {item_type.__name__}"
+    DICT_VALUE = ("Values at field {field_name} do not match the expected type: key {index!r} is "
+                  "{item_type.__name__}, expected {expected.__name__}")
+    TUPLE_LENGTH = "Expected {expected} items at field {field_name}, found {count} instead"
+    UNKNOWN_TAG = "Unknown {tag_field} {tag!r} at field {field_name}, expected one of {expected}"
+
+    def __init__(self, field_name: str, cls_type: Any, json_type: any, msg: Optional[str] = None,
+                 template: str = EXPECTED_TYPE, **context: Any):
         self.field_name = field_name
         self.cls_type = cls_type
         self.json_type = json_type
-        super().__init__(msg)
\ No newline at end of file
+        self.context = context
+        self._msg = msg
+        self._template = template
+        super().__init__(field_name, cls_type, json_type)
+
+    def __str__(self) -> str:
+        if self._msg is None:
+            self._msg = self._template.format(field_name=self.field_name, cls_type=self.cls_type,
+                                              json_type=self.json_type, **self.context)
+        return self._msg
+
+    def __reduce__(self):
+        return type(self), (self.field_name, self.cls_type, self.json_type, str(self))
+
+
+class StreamDecodeError(Exception):
+    """
+    An error that indicates that a record of a JSON stream could not be decoded, locating it in the input
+    """
+    def __init__(self, line: int, offset: int, error: Exception):
+        self.line = line
+        self.offset = offset
+        self.error = error
+        super().__init__(line, offset, error)
+
+    def __str__(self) -> str:
+        return f"Invalid record at line {self.line}, offset {self.offset}: {self.error}"
+
+    def __reduce__(self):
+        return type(self), (self.line, self.offset, self.error)
@@ -0,0 +1,99 @@
+import asyncio
+import json
+from concurrent.futures import Executor
+from functools import partial
+from itertools import islice
+from typing import Any, AsyncIterable, AsyncIterator, Callable, Dict, Iterable, Optional, Union
+
+from object_serializer.serializer.batch import BatchResult, RecordError
+from object_serializer.exceptions import StreamDecodeError, TypeValueMismatchError, UnresolvedAttributeError
+
+
+DEFAULT_ASYNC_CHUNK_SIZE = 256
+
+_RECORD_ERRORS = (TypeValueMismatchError, UnresolvedAttributeError, json.JSONDecodeError)
+
+
+async def run_in_executor(executor: Optional[Executor], function: Callable[..., Any], *args: Any) -> Any:
+    """
+    Runs a blocking function on an executor (the loop default executor if None) and awaits its result.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(executor, partial(function, *args))
+
+
+async def validate_many_in_chunks(validate_many: Callable[..., BatchResult], cls: Any, records: Iterable[Any],
+                                  fail_fast: bool, chunk_size: int, executor: Optional[Executor]) -> BatchResult:
+    """
+    Validates a batch chunk by chunk on an executor, returning to the event loop between two chunks.
+
+    :param validate_many: The synchronous batch routine (`Parser.validate_and_parse_many`).
+    :return: A BatchResult merging the results of every chunk, with indexes relative to the whole batch.
+    """
+    if chunk_size < 1:
+        raise ValueError('chunk_size must be a positive integer')
+    result = BatchResult()
+    iterator = iter(records)
+    start = 0
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            return result
+        partial_result = await run_in_executor(executor, validate_many, cls, chunk, fail_fast)
+        result.values.extend(partial_result.values)
+        result.errors.extend(RecordError(start + error.index, error.error) for error in partial_result.errors)
+        start += len(chunk)
+
+
+async def _iter_lines(stream: AsyncIterable[Union[bytes, str]]) -> AsyncIterator[Union[bytes, str]]:
+    pending = []
+    newline = None
+    async for chunk in stream:
+        if newline is None:
+            newline = '\n' if isinstance(chunk, str) else b'\n'
+        start = 0
+        while True:
+            end = chunk.find(newline, start)
+            if end < 0:
+                if start < len(chunk):
+                    pending.append(chunk[start:])
+                break
+            pending.append(chunk[start:end + 1])
+            yield chunk[:0].join(pending)
+            pending.clear()
+            start = end + 1
+    if pending:
+        yield pending[0][:0].join(pending)
+
+
+async def aiter_ndjson(decode: Callable[[Dict[str, Any]], Any], stream: AsyncIterable[Union[bytes, str]],
+                       yield_every: int = DEFAULT_ASYNC_CHUNK_SIZE,
+                       loads: Callable[[Any], Any] = json.loads) -> AsyncIterator[Any]:
+    """
+    Decodes a JSON Lines (NDJSON) async stream of bytes (or str) chunks, one line at a time.
+
+    Chunks may cut lines anywhere. Every yield_every records control is given back to the event loop,
+    so a consumer that never awaits anything else does not starve the other tasks.
+
+    :param decode: The decoder turning one JSON object into a dataclass instance.
+    :param stream: An async iterable of bytes or str chunks, e.g. `response.content.iter_any()`.
+    :param yield_every: The number of records decoded between two returns to the event loop.
+    :param loads: The function parsing one line.
+    :return: An async generator of decoded instances.
+    :raises StreamDecodeError: If a line is not valid JSON or does not match the dataclass.
+    """
+    offset = 0
+    line_number = 0
+    decoded = 0
+    async for line in _iter_lines(stream):
+        line_number += 1
+        if line.strip():
+            try:
+                value = decode(loads(line))
+            except _RECORD_ERRORS as e:
+                raise StreamDecodeError(line_number, offset, e) from e
+            yield value
+            decoded += 1
+            if decoded % yield_every == 0:
+                await asyncio.sleep(0)
+        offset += len(line)
@@ -0,0 +1,58 @@
+from dataclasses import dataclass, field
+from typing import Any, Generic, List, Optional, TypeVar
+
+
+T = TypeVar('T')
+
+
+@dataclass
+class RecordError:
+    """
+    A record of a batch that could not be decoded.
+
+    :ivar index: The position of the record in the input iterable.
+    :ivar error: The exception raised while decoding it (TypeValueMismatchError,
+                 UnresolvedAttributeError or JSONDecodeError).
+    """
+    index: int
+    error: Exception
+
+    @property
+    def field_name(self) -> Optional[str]:
+        """
+        The field reported by the error, if the error carries one.
+        """
+        return getattr(self.error, 'field_name', None)
+
+    @property
+    def expected(self) -> Any:
+        """
+        The type the field was expected to have, for type mismatches.
+        """
+        return getattr(self.error, 'cls_type', None)
+
+    @property
+    def actual(self) -> Any:
+        """
+        The type the field was found with, for type mismatches.
+        """
+        return getattr(self.error, 'json_type', None)
+
+
+@dataclass
+class BatchResult(Generic[T]):
+    """
+    The outcome of `Parser.validate_and_parse_many`.
+
+    :ivar values: The decoded instances, in input order, of every record that was valid.
+    :ivar errors: One RecordError per invalid record, in input order.
+    """
+    values: List[T] = field(default_factory=list)
+    errors: List[RecordError] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        """
+        Whether every record of the batch was decoded.
+        """
+        return not self.errors
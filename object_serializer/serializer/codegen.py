@@ -0,0 +1,254 @@
+import re
+from dataclasses import MISSING
+from typing import Any, Callable, Dict, List
+
+from object_serializer.serializer.decoder_plan import FieldPlan, TypePlan, PlanKind
+
+
+Fallback = Callable[[str, TypePlan, Any], Any]
+MissingField = Callable[[TypePlan, FieldPlan, Dict[str, Any]], Any]
+
+
+class _DecoderBuilder:
+    """
+    Generates the source of the decoder functions of every dataclass reachable from a plan.
+
+    Each dataclass gets its own function; the functions of one compilation share a single
+    namespace, so nested (and mutually recursive) decoders are looked up by name at call time.
+    Every check is emitted inline for the happy path only: on a mismatch the generated code hands
+    the value to the generic Parser validation (`fallback`), which raises the usual error.
+    Missing fields are resolved inline from their defaults; a missing required field is handed to
+    `missing`, which raises. A tagged union picks the function of its member from a dictionary keyed
+    by tag value, filled in once the functions are defined.
+    """
+    def __init__(self, fallback: Fallback, missing: MissingField):
+        self.namespace: Dict[str, Any] = {'_validate': fallback, '_missing_field': missing, '_MISSING': MISSING}
+        self.lines: List[str] = []
+        self.functions: Dict[TypePlan, str] = {}
+        self.pending: List[TypePlan] = []
+        self.tag_tables: Dict[TypePlan, str] = {}
+        self.counter = 0
+
+    def unique(self, prefix: str) -> str:
+        self.counter += 1
+        return f"{prefix}{self.counter}"
+
+    def constant(self, value: Any, prefix: str) -> str:
+        name = self.unique(prefix)
+        self.namespace[name] = value
+        return name
+
+    def function_for(self, plan: TypePlan) -> str:
+        name = self.functions.get(plan)
+        if name is not None:
+            return name
+        if plan.decoder is not None:
+            name = self.constant(plan.decoder, '_decode_')
+        else:
+            name = self.unique(f"_decode_{re.sub(r'[^0-9A-Za-z_]', '_', plan.tp.__name__)}_")
+            self.pending.append(plan)
+        self.functions[plan] = name
+        return name
+
+    def tag_table_for(self, plan: TypePlan) -> str:
+        name = self.tag_tables.get(plan)
+        if name is None:
+            for member in plan.members:
+                self.function_for(member)
+            name = self.tag_tables[plan] = self.unique('_tags')
+        return name
+
+    def emit(self, plan: TypePlan, key: str, src: str, dst: str, indent: str, fail: TypePlan,
+             lenient: bool) -> None:
+        """
+        Emits the statements validating the variable `src` against `plan`, storing the decoded
+        value into `dst`.
+
+        :param fail: The plan the generic validation is called with when a check fails.
+        :param lenient: Whether int fields accept floats, as plain fields do; floats always accept ints.
+        """
+        kind = plan.kind
+        key_repr = repr(key)
+        fail_ref = self.constant(fail, '_p')
+        if kind is PlanKind.PRIMITIVE:
+            if plan.tp is float or (lenient and plan.tp is int):
+                check = self.constant((int, float), '_t')
+            else:
+                check = self.constant(plan.tp, '_t')
+            self.lines.append(f"{indent}if not isinstance({src}, {check}):")
+            self.lines.append(f"{indent}    _validate({key_repr}, {fail_ref}, {src})")
+            self.lines.append(f"{indent}{dst} = {src}")
+        elif kind is PlanKind.DATACLASS:
+            function = self.function_for(plan)
+            self.lines.append(f"{indent}if isinstance({src}, dict):")
+            self.lines.append(f"{indent}    {dst} = {function}({src})")
+            self.lines.append(f"{indent}else:")
+            self.lines.append(f"{indent}    {dst} = _validate({key_repr}, {fail_ref}, {src})")
+        elif kind is PlanKind.OPTIONAL:
+            inner = plan.inner
+            self.lines.append(f"{indent}if {src} is None:")
+            self.lines.append(f"{indent}    {dst} = None")
+            self.lines.append(f"{indent}else:")
+            inner_fail = inner if inner.kind is PlanKind.LIST or inner.kind is PlanKind.ARRAY else plan
+            self.emit(inner, key, src, dst, indent + '    ', inner_fail, False)
+        elif kind is PlanKind.LIST:
+            inner = plan.inner
+            self.lines.append(f"{indent}if not isinstance({src}, list):")
+            self.lines.append(f"{indent}    _validate({key_repr}, {fail_ref}, {src})")
+            if inner.kind is PlanKind.PRIMITIVE:
+                item = self.unique('_x')
+                check = self.constant((int, float) if inner.tp is float else inner.tp, '_t')
+                self.lines.append(f"{indent}for {item} in {src}:")
+                self.lines.append(f"{indent}    if not isinstance({item}, {check}):")
+                self.lines.append(f"{indent}        _validate({key_repr}, {fail_ref}, {src})")
+                self.lines.append(f"{indent}{dst} = {src}")
+            elif inner.kind is PlanKind.DATACLASS:
+                item = self.unique('_x')
+                function = self.function_for(inner)
+                inner_ref = self.constant(inner, '_p')
+                self.lines.append(f"{indent}{dst} = [{function}({item}) if isinstance({item}, dict) "
+                                  f"else _validate({key_repr}, {inner_ref}, {item}) for {item} in {src}]")
+            else:
+                item, result, decoded = self.unique('_x'), self.unique('_l'), self.unique('_y')
+                self.lines.append(f"{indent}{result} = []")
+                self.lines.append(f"{indent}for {item} in {src}:")
+                self.emit(inner, key, item, decoded, indent + '    ', inner, False)
+                self.lines.append(f"{indent}    {result}.append({decoded})")
+                self.lines.append(f"{indent}{dst} = {result}")
+        elif kind is PlanKind.DICT:
+            inner = plan.inner
+            self.lines.append(f"{indent}if not isinstance({src}, dict):")
+            self.lines.append(f"{indent}    _validate({key_repr}, {fail_ref}, {src})")
+            name, item = self.unique('_k'), self.unique('_x')
+            if inner.kind is PlanKind.PRIMITIVE:
+                check = self.constant((int, float) if inner.tp is float else inner.tp, '_t')
+                self.lines.append(f"{indent}for {name}, {item} in {src}.items():")
+                self.lines.append(f"{indent}    if type({name}) is not str or not isinstance({item}, {check}):")
+                self.lines.append(f"{indent}        _validate({key_repr}, {fail_ref}, {src})")
+                self.lines.append(f"{indent}{dst} = {src}")
+            else:
+                result, decoded = self.unique('_d'), self.unique('_y')
+                self.lines.append(f"{indent}{result} = {{}}")
+                self.lines.append(f"{indent}for {name}, {item} in {src}.items():")
+                self.lines.append(f"{indent}    if type({name}) is not str:")
+                self.lines.append(f"{indent}        _validate({key_repr}, {fail_ref}, {src})")
+                self.emit(inner, key, item, decoded, indent + '    ', inner, False)
+                self.lines.append(f"{indent}    {result}[{name}] = {decoded}")
+                self.lines.append(f"{indent}{dst} = {result}")
+        elif kind is PlanKind.UNION:
+            # the members with a single candidate per JSON type are dispatched inline on type(value),
+            # the other types go through the generic validation and its dispatch table
+            value_type = self.unique('_ty')
+            branches = []
+            for json_type, candidates in plan.dispatch.items():
+                if len(candidates) != 1:
+                    continue
+                member = candidates[0]
+                if member.kind is PlanKind.PRIMITIVE and member.tp is json_type:
+                    branches.append((json_type, f"{dst} = {src}"))
+                elif member.kind is PlanKind.DATACLASS:
+                    branches.append((json_type, f"{dst} = {self.function_for(member)}({src})"))
+            if branches:
+                self.lines.append(f"{indent}{value_type} = type({src})")
+                for index, (json_type, statement) in enumerate(branches):
+                    keyword = 'if' if index == 0 else 'elif'
+                    self.lines.append(f"{indent}{keyword} {value_type} is {self.constant(json_type, '_t')}:")
+                    self.lines.append(f"{indent}    {statement}")
+                self.lines.append(f"{indent}else:")
+                self.lines.append(f"{indent}    {dst} = _validate({key_repr}, {fail_ref}, {src})")
+            else:
+                self.lines.append(f"{indent}{dst} = _validate({key_repr}, {fail_ref}, {src})")
+        elif kind is PlanKind.TAGGED:
+            table, member = self.tag_table_for(plan), self.unique('_m')
+            tag_ref = self.constant(plan.tp.tag, '_tag')
+            self.lines.append(f"{indent}{member} = None")
+            self.lines.append(f"{indent}if isinstance({src}, dict):")
+            self.lines.append(f"{indent}    try:")
+            self.lines.append(f"{indent}        {member} = {table}.get({src}.get({tag_ref}, _MISSING))")
+            self.lines.append(f"{indent}    except TypeError:")
+            self.lines.append(f"{indent}        pass")
+            self.lines.append(f"{indent}if {member} is None:")
+            self.lines.append(f"{indent}    {dst} = _validate({key_repr}, {fail_ref}, {src})")
+            self.lines.append(f"{indent}else:")
+            self.lines.append(f"{indent}    {dst} = {member}({src})")
+        elif kind is PlanKind.ARRAY:
+            coercer = self.constant(plan.coercer, '_c')
+            self.lines.append(f"{indent}try:")
+            self.lines.append(f"{indent}    {dst} = {coercer}({src})")
+            self.lines.append(f"{indent}except (TypeError, ValueError, OverflowError):")
+            self.lines.append(f"{indent}    _validate({key_repr}, {fail_ref}, {src})")
+        else:
+            self.lines.append(f"{indent}{dst} = _validate({key_repr}, {fail_ref}, {src})")
+
+    def emit_function(self, plan: TypePlan) -> None:
+        name = self.functions[plan]
+        if plan.kind is PlanKind.TAGGED:
+            self.lines.append(f"def {name}(data):")
+            self.emit(plan, plan.tp.__name__, 'data', 'value', '    ', plan, False)
+            self.lines.append("    return value")
+            self.lines.append("")
+            return
+        factory_ref = self.constant(plan.factory, '_new')
+        plan_ref = self.constant(plan, '_p')
+        self.lines.append(f"def {name}(data):")
+        self.lines.append("    if not isinstance(data, dict):")
+        self.lines.append(f"        return _validate({plan.tp.__name__!r}, {plan_ref}, data)")
+        arguments = []
+        for field in plan.fields:
+            value, decoded = self.unique('_v'), self.unique('_f')
+            if field.required:
+                self.lines.append(f"    {value} = data.get({field.name!r}, _MISSING)")
+                self.lines.append(f"    if {value} is _MISSING:")
+                self.lines.append(f"        _missing_field({plan_ref}, {self.constant(field, '_fp')}, data)")
+                self.emit(field.plan, field.name, value, decoded, '    ', field.plan, True)
+            elif field.default is MISSING and field.default_factory is MISSING:
+                # a missing Optional field is None, as an explicit null is
+                self.lines.append(f"    {value} = data.get({field.name!r})")
+                self.emit(field.plan, field.name, value, decoded, '    ', field.plan, True)
+            else:
+                if field.default_factory is not MISSING:
+                    default = f"{self.constant(field.default_factory, '_factory')}()"
+                else:
+                    default = self.constant(field.default, '_default')
+                self.lines.append(f"    {value} = data.get({field.name!r}, _MISSING)")
+                self.lines.append(f"    if {value} is _MISSING:")
+                self.lines.append(f"        {decoded} = {default}")
+                self.lines.append("    else:")
+                self.emit(field.plan, field.name, value, decoded, '        ', field.plan, True)
+            arguments.append(decoded)
+        self.lines.append(f"    return {factory_ref}({', '.join(arguments)})")
+        self.lines.append("")
+
+    def build(self, root: TypePlan) -> Callable[[Dict[str, Any]], Any]:
+        self.function_for(root)
+        compiled = []
+        while self.pending:
+            plan = self.pending.pop()
+            self.emit_function(plan)
+            compiled.append(plan)
+        source = '\n'.join(self.lines)
+        exec(source, self.namespace)
+        for plan, table in self.tag_tables.items():
+            self.namespace[table] = {tag: self.namespace[self.functions[member]]
+                                     for tag, member in plan.dispatch.items()}
+        for plan in compiled:
+            plan.decoder = self.namespace[self.functions[plan]]
+        return root.decoder
+
+
+def compile_decoder(plan: TypePlan, fallback: Fallback, missing: MissingField) -> Callable[[Dict[str, Any]], Any]:
+    """
+    Compiles a dataclass (or tagged union) plan into a specialized Python function, the same way
+    `dataclasses` generates `__init__`: the source is generated from the plan and executed once.
+
+    The generated function takes the JSON object as a dictionary and returns the dataclass
+    instance. The functions are stored on the plans, so every dataclass is compiled once.
+
+    :param plan: The compiled plan of the dataclass or tagged union.
+    :param fallback: The generic validation routine, called when an inline check fails.
+    :param missing: The routine called when a required field is missing, expected to raise.
+    :return: The decoder function.
+    """
+    if plan.decoder is not None:
+        return plan.decoder
+    return _DecoderBuilder(fallback, missing).build(plan)
@@ -0,0 +1,93 @@
+from dataclasses import MISSING
+from typing import Any, Callable, Dict, Generic, Iterable, Iterator, List, Tuple, TypeVar
+
+
+T = TypeVar('T')
+
+
+class Columns(Generic[T]):
+    """
+    A struct-of-arrays container holding many records of a dataclass as one column per field.
+
+    A column is a list, or an `array.array` / NumPy array for int and float fields decoded with the
+    numeric_lists option. Rows are only built on demand, by `row` and `rows`.
+
+    :param cls: The dataclass the records were validated against.
+    :param columns: The columns, keyed by field name in field declaration order.
+    :param length: The number of records.
+    """
+    __slots__ = ('cls', 'columns', '_length')
+
+    def __init__(self, cls: type, columns: Dict[str, Any], length: int):
+        self.cls = cls
+        self.columns = columns
+        self._length = length
+
+    @property
+    def names(self) -> Tuple[str, ...]:
+        """
+        The field names, in declaration order.
+        """
+        return tuple(self.columns)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, name: str) -> Any:
+        return self.columns[name]
+
+    def __contains__(self, name: object) -> bool:
+        return name in self.columns
+
+    def row(self, index: int) -> T:
+        """
+        Builds the dataclass instance of one record.
+
+        :param index: The position of the record.
+        :return: An instance of cls.
+        """
+        return self.cls(**{name: column[index] for name, column in self.columns.items()})
+
+    def rows(self) -> Iterator[T]:
+        """
+        Builds the dataclass instances of every record, one at a time.
+        """
+        names = self.names
+        cls = self.cls
+        for values in zip(*self.columns.values()):
+            yield cls(**dict(zip(names, values)))
+
+    def to_dict(self) -> Dict[str, List[Any]]:
+        """
+        Returns the columns as plain lists, e.g. to build a pandas DataFrame.
+        """
+        return {name: column if isinstance(column, list) else column.tolist()
+                for name, column in self.columns.items()}
+
+    def __repr__(self) -> str:
+        return f"Columns({self.cls.__name__}, {len(self)} rows, fields={list(self.columns)})"
+
+
+def collect_columns(names: Iterable[str], rows: Iterable[Any],
+                    check_row: Callable[[Any], Any]) -> Tuple[Dict[str, List[Any]], int]:
+    """
+    Pivots raw JSON objects into one list of raw values per field, consuming the rows one at a time
+    so that only the values (not the per-record dictionaries) are kept.
+
+    :param names: The field names.
+    :param rows: The JSON objects, as dictionaries.
+    :param check_row: Called with any row that is not a dictionary; expected to raise.
+    :return: The raw columns and the number of rows; a row missing a field holds `dataclasses.MISSING`
+             in its column.
+    """
+    columns: Dict[str, List[Any]] = {name: [] for name in names}
+    appends = [(name, column.append) for name, column in columns.items()]
+    count = 0
+    for row in rows:
+        if not isinstance(row, dict):
+            check_row(row)
+        get = row.get
+        for name, append in appends:
+            append(get(name, MISSING))
+        count += 1
+    return columns, count
@@ -1,20 +1,70 @@
-import builtins
-from typing import Any, Dict, TypeVar, Type
-from object_serializer.utils.validations import Validator
+import dataclasses
+import inspect
+import sys
+import threading
+import types
+import weakref
+from typing import (Any, Callable, Dict, ForwardRef, List, Optional, TypeVar, Type, Union, get_args, get_origin,
+                    get_type_hints)
+from object_serializer.utils.validations import UNION_ORIGINS, Validator
+from object_serializer.utils.type_registry import is_primitive_type, is_scalar_type
 from dataclasses import fields
-from object_serializer.exceptions import InvalidDataTypeError
+from object_serializer.exceptions import InvalidDataTypeError, NotADataclassError
 
 
 T = TypeVar('T')
 
+_field_types: 'weakref.WeakKeyDictionary[type, Dict[str, Any]]' = weakref.WeakKeyDictionary()
+# the slotted mirrors created together, by name, for the forward references between them
+_mirror_namespaces: 'weakref.WeakKeyDictionary[type, Dict[str, type]]' = weakref.WeakKeyDictionary()
+
+
+def _is_forward(tp: Any) -> bool:
+    if isinstance(tp, (str, ForwardRef)):
+        return True
+    return any(_is_forward(arg) for arg in get_args(tp) if arg is not Ellipsis)
+
+
+def field_types(cls: Any) -> Dict[str, Any]:
+    """
+    Returns the types of the fields of a dataclass, mapped by field name, with string annotations
+    (`from __future__ import annotations`) and forward references such as `List["TreeNode"]`
+    resolved by `typing.get_type_hints`. The class itself is in scope under its own name, so
+    self-referential dataclasses defined in a function resolve too.
+
+    The types are resolved once per class and cached.
+
+    :param cls: The dataclass.
+    :return: A dictionary mapping field names to their resolved types.
+    :raises InvalidDataTypeError: If an annotation names a type that cannot be found.
+    """
+    resolved = _field_types.get(cls)
+    if resolved is not None:
+        return resolved
+    resolved = {field.name: field.type for field in fields(cls)}
+    if any(_is_forward(tp) for tp in resolved.values()):
+        localns = dict(_mirror_namespaces.get(cls, {}))
+        localns[cls.__name__] = cls
+        try:
+            hints = get_type_hints(cls, localns=localns)
+        except NameError as e:
+            raise InvalidDataTypeError(cls, f"Cannot resolve the field types of {cls.__name__}: {e}") from None
+        # the annotations already holding types are kept as they are
+        resolved = {name: hints[name] if _is_forward(tp) else tp for name, tp in resolved.items()}
+    _field_types[cls] = resolved
+    return resolved
+
 
 def serialize(cls: Any) -> Dict[str, Any]:
     """
     Serializes a dataclass into a dictionary that maps field names to their types.
 
     This function inspects the fields of a given dataclass and maps each field's name
-    to its respective type. It supports the following types: primitive types (builtins),
-    lists (List), optionals (Optional), and other dataclasses (dataclass).
+    to its respective type. It supports the following types: JSON primitive types (str, int, float,
+    bool, dict, list), registered scalar types (datetime, Decimal, UUID, Enum, ...), lists (List),
+    optionals (Optional), maps with string keys (Dict[str, T]), tuples (Tuple), sets (Set,
+    FrozenSet), unions (Union), tagged unions (TaggedUnion) and other dataclasses (dataclass).
+    String annotations and forward references are resolved first, see `field_types`.
 
     If a field's type is not valid (not a dataclass, list, or optional), an
     InvalidDataTypeError is raised.
@@ -26,12 +76,13 @@ def serialize(cls: Any) -> Dict[str, Any]:
                                  nor a valid data structure.
     """
     cls_dict = {}
+    resolved = field_types(cls)
     for field in fields(cls):
-        field_type = field.type
+        field_type = resolved[field.name]
 
         if Validator.validate_dataclass(field_type):
             cls_dict[field.name] = field_type
-        elif field_type in vars(builtins).values():
+        elif is_primitive_type(field_type) or is_scalar_type(field_type):
             cls_dict[field.name] = field_type
         else:
             if Validator.is_lst(field_type):
@@ -40,6 +91,10 @@ def serialize(cls: Any) -> Dict[str, Any]:
             elif Validator.is_optional(field_type):
                 if Validator.validate_clsoptional(field_type):
                     cls_dict[field.name] = field_type
+            elif (Validator.is_dict(field_type) or Validator.is_tuple(field_type) or Validator.is_set(field_type)
+                  or Validator.is_union(field_type) or Validator.is_tagged_union(field_type)):
+                if Validator.validate_type(field_type):
+                    cls_dict[field.name] = field_type
             else:
                 raise InvalidDataTypeError(field_type, f"Field '{field.name}' with type {field_type} is not valid")
 
@@ -54,4 +109,209 @@ def gen_dataclass_instance(cls: Type[T], data: Dict[str, Any]) -> T:
     :param data: A dictionary containing the validated data.
     :return: An instance of the dataclass populated with the validated data.
     """
-    return cls(**data)
\ No newline at end of file
+    return cls(**data)
+
+
+def _generated_init(cls: type) -> bool:
+    # the __init__ written by @dataclass is compiled from a string; a user defined one is not
+    init = cls.__dict__.get('__init__')
+    code = getattr(init, '__code__', None)
+    return code is not None and code.co_filename == '<string>'
+
+
+def _slot_setters(cls: type, names: List[str]) -> Optional[List[Callable[[Any, Any], None]]]:
+    setters = []
+    for name in names:
+        descriptor = next((klass.__dict__[name] for klass in cls.__mro__ if name in klass.__dict__), None)
+        if not isinstance(descriptor, types.MemberDescriptorType):
+            return None
+        setters.append(descriptor.__set__)
+    return setters
+
+
+def instance_factory(cls: Type[T]) -> Callable[..., T]:
+    """
+    Returns the fastest function building an instance of a dataclass from the values of its fields,
+    passed positionally in field declaration order.
+
+    - When the fields are exactly the positional parameters of `__init__`, the class itself is
+      returned: a positional call avoids building a keyword arguments dictionary per instance.
+    - Frozen dataclasses whose `__init__` is the generated one and which have no `__post_init__`
+      are built with `object.__new__` and their fields are assigned directly (through the slot
+      descriptors of a slotted class, or as the instance `__dict__`), skipping the
+      `object.__setattr__` call per field of the generated `__init__`.
+    - Any other class is called with keyword arguments, as `gen_dataclass_instance` does.
+
+    :param cls: The dataclass.
+    :return: A function taking one value per field and returning the instance.
+    """
+    names = [field.name for field in fields(cls)]
+    try:
+        parameters = list(inspect.signature(cls.__init__).parameters.values())[1:]
+    except (TypeError, ValueError):
+        parameters = None
+    positional = parameters is not None and [parameter.name for parameter in parameters] == names and all(
+        parameter.kind in (parameter.POSITIONAL_ONLY, parameter.POSITIONAL_OR_KEYWORD) for parameter in parameters)
+
+    params = getattr(cls, '__dataclass_params__', None)
+    if (positional and params is not None and params.frozen and _generated_init(cls) and
+            not hasattr(cls, '__post_init__')):
+        new = object.__new__
+        setters = _slot_setters(cls, names)
+        if setters is not None:
+            def create_slots(*values: Any) -> T:
+                instance = new(cls)
+                for setter, value in zip(setters, values):
+                    setter(instance, value)
+                return instance
+            return create_slots
+        if not any(isinstance(getattr(cls, name, None), types.MemberDescriptorType) for name in names):
+            set_attribute = object.__setattr__
+
+            def create_dict(*values: Any) -> T:
+                instance = new(cls)
+                set_attribute(instance, '__dict__', dict(zip(names, values)))
+                return instance
+            return create_dict
+
+    if positional:
+        return cls
+
+    def create(*values: Any) -> T:
+        return cls(**dict(zip(names, values)))
+    return create
+
+
+_slotted_mirrors: 'weakref.WeakKeyDictionary[type, type]' = weakref.WeakKeyDictionary()
+# the classes whose deep mirror is being built, with the namespace shared by the mirrors of the same call
+_mirroring: Dict[type, Dict[str, type]] = {}
+_mirror_lock = threading.RLock()
+
+
+def _mirror_type(tp: Any, deep: bool) -> Any:
+    if not deep:
+        return tp
+    if tp in _mirroring:
+        # a recursive reference: the mirror does not exist yet, it is resolved by name once it does
+        return ForwardRef(tp.__name__)
+    if Validator.validate_dataclass(tp):
+        return slotted_dataclass(tp, deep)
+    if Validator.is_tagged_union(tp):
+        if any(cls in _mirroring for cls in tp.classes):
+            raise InvalidDataTypeError(tp, f"Cannot mirror {tp!r}, one of its members refers to it")
+        return type(tp)(tp.tag, {tag: slotted_dataclass(cls, deep) for tag, cls in tp.members.items()}, tp.__name__)
+    args = get_args(tp)
+    if not args:
+        return tp
+    mirrored = tuple(arg if arg is Ellipsis else _mirror_type(arg, deep) for arg in args)
+    if get_origin(tp) in UNION_ORIGINS:
+        # a PEP 604 union cannot be subscripted, and its members may now be forward references
+        return Union[mirrored]
+    if hasattr(tp, 'copy_with'):
+        return tp.copy_with(mirrored)
+    return get_origin(tp)[mirrored]
+
+
+def slotted_dataclass(cls: Type[T], deep: bool = True) -> type:
+    """
+    Builds (once per class) a slotted mirror of a dataclass: a new dataclass with the same name,
+    fields, defaults and dataclass options, whose instances store their fields in `__slots__`
+    instead of a per-instance `__dict__`, which cuts the memory of every decoded instance.
+
+    The methods, properties and class attributes defined in the class body (and `__post_init__`)
+    are copied to the mirror, and zero-argument `super()` in them refers to the mirror. The mirror
+    has the bases of the original class, the dataclass ones replaced by their own mirror, but it is
+    not a subclass of the original class: `isinstance` checks against the original class do not
+    hold for its instances, those against its other bases do. A base that does not declare
+    `__slots__` gives the instances a `__dict__` back.
+
+    :param cls: The dataclass to mirror.
+    :param deep: Whether nested dataclass field types (in lists, optionals and the other generic
+                 types too) are replaced by their own slotted mirror. Recursive references become
+                 forward references to the mirrors, see `field_types`.
+    :return: The slotted dataclass.
+    :raises NotADataclassError: If cls is not a dataclass.
+    :raises InvalidDataTypeError: If a field has a default value and Python is older than 3.10,
+                                  whose dataclasses cannot combine slots and defaults.
+    """
+    if not Validator.validate_dataclass(cls):
+        raise NotADataclassError(cls)
+    mirrors = _slotted_mirrors.get(cls)
+    if mirrors is not None and deep in mirrors:
+        return mirrors[deep]
+    with _mirror_lock:
+        namespace = next(iter(_mirroring.values()), {})
+        _mirroring[cls] = namespace
+        try:
+            mirror = _build_mirror(cls, deep)
+        finally:
+            del _mirroring[cls]
+        namespace[cls.__name__] = mirror
+        _mirror_namespaces[mirror] = namespace
+        _slotted_mirrors.setdefault(cls, {})[deep] = mirror
+    return mirror
+
+
+def _build_mirror(cls: type, deep: bool) -> type:
+    params = cls.__dataclass_params__
+    options = dict(init=params.init, repr=params.repr, eq=params.eq, order=params.order,
+                   unsafe_hash=params.unsafe_hash, frozen=params.frozen)
+    field_types = serialize(cls)
+    namespace = {name: value for name, value in cls.__dict__.items()
+                 if not (name.startswith('__') and name.endswith('__')) and name not in field_types}
+    if hasattr(cls, '__post_init__'):
+        namespace['__post_init__'] = cls.__post_init__
+    bases = tuple(slotted_dataclass(base, deep) if Validator.validate_dataclass(base) else base
+                  for base in cls.__bases__ if base is not object)
+
+    if sys.version_info >= (3, 10):
+        specs = []
+        for field in fields(cls):
+            extra = {'kw_only': field.kw_only} if field.kw_only is not dataclasses.MISSING else {}
+            spec = dataclasses.field(default=field.default, default_factory=field.default_factory,
+                                     init=field.init, repr=field.repr, hash=field.hash, compare=field.compare,
+                                     metadata=field.metadata, **extra)
+            specs.append((field.name, _mirror_type(field_types[field.name], deep), spec))
+        mirror = dataclasses.make_dataclass(cls.__name__, specs, bases=bases, namespace=namespace, slots=True,
+                                            **options)
+    else:
+        if any(field.default is not dataclasses.MISSING or field.default_factory is not dataclasses.MISSING
+               for field in fields(cls)):
+            raise InvalidDataTypeError(cls, f"Slotted dataclasses with default values need Python 3.10 "
+                                            f"({cls.__name__})")
+        annotations = {name: _mirror_type(tp, deep) for name, tp in field_types.items()}
+        namespace.update(__annotations__=annotations, __slots__=tuple(annotations))
+        mirror = dataclasses.dataclass(type(cls.__name__, bases, namespace), **options)
+    mirror.__module__ = cls.__module__
+    mirror.__qualname__ = cls.__qualname__
+    cell = (lambda: mirror).__closure__[0]
+    for name, value in namespace.items():
+        rebound = _rebind(value, cls, cell)
+        if rebound is not value:
+            setattr(mirror, name, rebound)
+    return mirror
+
+
+def _rebind(value: Any, cls: type, cell: Any) -> Any:
+    # the functions of a class body using zero-argument super() hold the class in a __class__ cell
+    if isinstance(value, (classmethod, staticmethod)):
+        function = _rebind(value.__func__, cls, cell)
+        return value if function is value.__func__ else type(value)(function)
+    if isinstance(value, property):
+        accessors = [_rebind(accessor, cls, cell) for accessor in (value.fget, value.fset, value.fdel)]
+        if all(new is old for new, old in zip(accessors, (value.fget, value.fset, value.fdel))):
+            return value
+        return type(value)(*accessors, value.__doc__)
+    if not isinstance(value, types.FunctionType) or '__class__' not in value.__code__.co_freevars:
+        return value
+    index = value.__code__.co_freevars.index('__class__')
+    if value.__closure__[index].cell_contents is not cls:
+        return value
+    closure = value.__closure__[:index] + (cell,) + value.__closure__[index + 1:]
+    function = types.FunctionType(value.__code__, value.__globals__, value.__name__, value.__defaults__, closure)
+    function.__kwdefaults__ = value.__kwdefaults__
+    function.__qualname__ = value.__qualname__
+    function.__doc__ = value.__doc__
+    function.__annotations__ = value.__annotations__
+    function.__dict__.update(value.__dict__)
+    return function
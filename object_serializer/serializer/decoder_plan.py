@@ -0,0 +1,454 @@
+import dataclasses
+import threading
+from collections import OrderedDict, namedtuple
+from enum import Enum
+from typing import Any, Callable, Dict, NamedTuple, Optional, Tuple, Union, get_args, get_origin
+
+from object_serializer.serializer.dataclass_serializer import serialize, instance_factory
+from object_serializer.serializer.numeric import numeric_list_converter, array_to_list
+from object_serializer.exceptions import InvalidDataTypeError
+from object_serializer.utils.validations import Validator
+from object_serializer.utils.type_registry import Coercer, Encoder, is_primitive_type, get_scalar_type
+
+
+DEFAULT_PLAN_CACHE_SIZE = 512
+
+PlanCacheInfo = namedtuple('PlanCacheInfo', ['hits', 'misses', 'maxsize', 'currsize'])
+
+
+class PlanKind(Enum):
+    """
+    The precomputed category of a type, deciding which validation routine the Parser runs for it.
+    """
+    PRIMITIVE = 'primitive'
+    SCALAR = 'scalar'
+    LIST = 'list'
+    OPTIONAL = 'optional'
+    DATACLASS = 'dataclass'
+    ARRAY = 'array'
+    DICT = 'dict'
+    TUPLE = 'tuple'
+    SET = 'set'
+    UNION = 'union'
+    TAGGED = 'tagged'
+
+
+JSON_VALUE_TYPES = (str, int, float, bool, dict, list, type(None))
+"""The Python types of the values a JSON document is parsed into."""
+
+
+class PlanOptions(NamedTuple):
+    """
+    The decoding options that change the plan built for a type; plans built with other options than
+    the defaults are cached separately.
+
+    :param numeric_lists: The container List[int] and List[float] fields are decoded into, one of
+                          `NUMERIC_LIST_MODES` ('array' or 'numpy'), or None for plain lists.
+    """
+    numeric_lists: Optional[str] = None
+
+
+DEFAULT_PLAN_OPTIONS = PlanOptions()
+
+
+class _PlanKey(NamedTuple):
+    tp: Any
+    options: PlanOptions
+
+
+class FieldPlan:
+    """
+    The decoding plan of a single dataclass field: its name, the plan of its type and what a JSON
+    object missing the field decodes to.
+
+    `default` and `default_factory` are those of the dataclass field (`dataclasses.MISSING` when
+    unset). A field is `required` when it has neither and is not Optional: a missing Optional field
+    without a default decodes to None.
+    """
+    __slots__ = ('name', 'plan', 'default', 'default_factory', 'required')
+
+    def __init__(self, name: str, plan: 'TypePlan', default: Any = dataclasses.MISSING,
+                 default_factory: Any = dataclasses.MISSING):
+        self.name = name
+        self.plan = plan
+        self.default = default
+        self.default_factory = default_factory
+        self.required = (default is dataclasses.MISSING and default_factory is dataclasses.MISSING
+                         and plan.kind is not PlanKind.OPTIONAL)
+
+    def missing_value(self) -> Any:
+        """
+        Returns the value of the field when the JSON object does not hold it: a new value of the
+        default factory, the default, or None. Defaults are not validated, as in `__init__`.
+        """
+        if self.default_factory is not dataclasses.MISSING:
+            return self.default_factory()
+        if self.default is not dataclasses.MISSING:
+            return self.default
+        return None
+
+    def __repr__(self) -> str:
+        return f"FieldPlan({self.name!r}, {self.plan!r})"
+
+
+class TypePlan:
+    """
+    A decoding plan compiled once for a type.
+
+    The plan stores the kind of the type together with everything the Parser needs to validate a
+    value against it, so that no introspection (`fields()`, `get_origin()`, `get_args()`) is done
+    while decoding:
+
+    - PRIMITIVE: `tp` is the JSON primitive type the value is checked against.
+    - SCALAR: `coercer` and `encoder` are the registered conversions from and to JSON.
+    - LIST / OPTIONAL: `inner` is the plan of the element (or non-None) type.
+    - ARRAY: a List[int] or List[float] decoded with a numeric_lists option; `inner` is the plan
+      of the element type and `coercer` converts the whole JSON list in one call.
+    - DATACLASS: `fields` holds one FieldPlan per dataclass field, in declaration order, `factory`
+      the function building an instance from the field values passed positionally (see
+      `instance_factory`), and `decoder` the generated decoder function once `Parser.compile` has
+      been called for it.
+    - DICT: a Dict[str, T] decoded from a JSON object; `inner` is the plan of the value type.
+    - TUPLE: a Tuple decoded from a JSON list; `members` holds the plan of every item of a fixed
+      length tuple, `inner` the plan of the items of a variadic one (`Tuple[int, ...]`).
+    - SET: a Set or FrozenSet decoded from a JSON list; `inner` is the plan of the item type and
+      `factory` the set type.
+    - UNION: a Union without None (an Optional of several types is an OPTIONAL plan whose `inner` is
+      a UNION); `members` holds the plan of every member type and `dispatch` maps the Python type
+      of a JSON value to the members that can decode it, see `union_dispatch`.
+    - TAGGED: a TaggedUnion decoded from a JSON object; `members` holds the DATACLASS plan of every
+      member and `dispatch` maps each tag value to the plan of its member.
+    """
+    __slots__ = ('tp', 'kind', 'inner', 'fields', 'coercer', 'encoder', 'factory', 'decoder', 'members',
+                 'dispatch')
+
+    def __init__(self, tp: Any, kind: PlanKind, inner: Optional['TypePlan'] = None,
+                 fields: Tuple[FieldPlan, ...] = (), coercer: Optional[Coercer] = None,
+                 encoder: Optional[Encoder] = None, members: Tuple['TypePlan', ...] = ()):
+        self.tp = tp
+        self.kind = kind
+        self.inner = inner
+        self.fields = fields
+        self.coercer = coercer
+        self.encoder = encoder
+        self.factory = None
+        self.decoder = None
+        self.members = members
+        self.dispatch = None
+
+    def __repr__(self) -> str:
+        return f"TypePlan({self.tp!r}, {self.kind.value})"
+
+
+class _Building(threading.local):
+    """
+    The plans the current thread is building: the dataclass and tagged union plans whose inner plans
+    are being built (`shells`), and the plans built meanwhile, which are only cached once the
+    outermost of those plans is complete (`built`).
+    """
+    def __init__(self):
+        self.shells: Dict[_PlanKey, TypePlan] = {}
+        self.built: Dict[Tuple['PlanCache', Any], TypePlan] = {}
+
+
+_building = _Building()
+
+
+def _build_shell(plan: TypePlan, options: PlanOptions, build: Callable[[TypePlan, PlanOptions], None]) -> TypePlan:
+    # the plan is reachable from its own inner plans (List["TreeNode"] in TreeNode) before it is complete
+    key = _PlanKey(plan.tp, options)
+    shells = _building.shells
+    shells[key] = plan
+    try:
+        build(plan, options)
+    except BaseException:
+        del shells[key]
+        if not shells:
+            _building.built.clear()
+        raise
+    del shells[key]
+    if not shells:
+        built, _building.built = _building.built, {}
+        for (cache, cache_key), inner in built.items():
+            cache._store(cache_key, inner)
+    return plan
+
+
+def _build_dataclass(plan: TypePlan, options: PlanOptions) -> None:
+    tp = plan.tp
+    cls_dict = serialize(tp)
+    declared = tp.__dataclass_fields__
+    plan.fields = tuple(FieldPlan(name, get_plan(field_type, options), declared[name].default,
+                                  declared[name].default_factory)
+                        for name, field_type in cls_dict.items())
+    plan.factory = instance_factory(tp)
+
+
+def _build_tagged(plan: TypePlan, options: PlanOptions) -> None:
+    plan.members = tuple(get_plan(cls, options) for cls in plan.tp.classes)
+    plan.dispatch = dict(zip(plan.tp.tags, plan.members))
+
+
+def build_plan(tp: Any, options: PlanOptions = DEFAULT_PLAN_OPTIONS) -> TypePlan:
+    """
+    Builds the decoding plan of a type, validating it the same way `serialize` does.
+
+    Inner plans are obtained through the shared plan cache, so nested dataclasses and element
+    types are compiled only once and shared between every plan that refers to them.
+
+    Recursive types are supported: while the plan of a dataclass (or tagged union) is built, the
+    inner plans referring back to it receive the plan itself, completed afterwards, so a recursive
+    tree shares one plan per type whatever its depth. The inner plans built meanwhile are cached
+    once the outermost plan is complete, and dropped if it fails.
+
+    :param tp: The type to compile.
+    :param options: The decoding options, passed down to the inner plans.
+    :return: The compiled plan.
+    :raises InvalidDataTypeError: If the type (or one of its inner types) is not supported.
+    """
+    if Validator.validate_dataclass(tp):
+        return _build_shell(TypePlan(tp, PlanKind.DATACLASS), options, _build_dataclass)
+    if Validator.is_lst(tp):
+        Validator.validate_clslist(tp)
+        inner = get_plan(get_args(tp)[0], options)
+        if options.numeric_lists is not None and inner.kind is PlanKind.PRIMITIVE and inner.tp in (int, float):
+            return TypePlan(tp, PlanKind.ARRAY, inner=inner, encoder=array_to_list,
+                            coercer=numeric_list_converter(options.numeric_lists, inner.tp))
+        return TypePlan(tp, PlanKind.LIST, inner=inner)
+    if Validator.is_optional(tp):
+        Validator.validate_clsoptional(tp)
+        args = tuple(argv for argv in get_args(tp) if argv is not type(None))
+        arg = args[0] if len(args) == 1 else Union[args]
+        return TypePlan(tp, PlanKind.OPTIONAL, inner=get_plan(arg, options))
+    if Validator.is_dict(tp):
+        Validator.validate_clsdict(tp)
+        return TypePlan(tp, PlanKind.DICT, inner=get_plan(get_args(tp)[1], options))
+    if Validator.is_tuple(tp):
+        Validator.validate_clstuple(tp)
+        args = get_args(tp)
+        if len(args) == 2 and args[1] is Ellipsis:
+            return TypePlan(tp, PlanKind.TUPLE, inner=get_plan(args[0], options))
+        return TypePlan(tp, PlanKind.TUPLE, members=tuple(get_plan(arg, options) for arg in args))
+    if Validator.is_set(tp):
+        Validator.validate_clsset(tp)
+        plan = TypePlan(tp, PlanKind.SET, inner=get_plan(get_args(tp)[0], options))
+        plan.factory = frozenset if get_origin(tp) is frozenset else set
+        return plan
+    if Validator.is_union(tp):
+        Validator.validate_clsunion(tp)
+        plan = TypePlan(tp, PlanKind.UNION, members=tuple(get_plan(arg, options) for arg in get_args(tp)))
+        plan.dispatch = union_dispatch(plan.members)
+        return plan
+    if Validator.is_tagged_union(tp):
+        return _build_shell(TypePlan(tp, PlanKind.TAGGED), options, _build_tagged)
+    if is_primitive_type(tp):
+        return TypePlan(tp, PlanKind.PRIMITIVE)
+    scalar = get_scalar_type(tp)
+    if scalar is not None:
+        return TypePlan(tp, PlanKind.SCALAR, coercer=scalar.coercer, encoder=scalar.encoder)
+    raise InvalidDataTypeError(tp, f"Type {tp} is not valid")
+
+
+_STRICT = {
+    PlanKind.DATACLASS: (dict,),
+    PlanKind.DICT: (dict,),
+    PlanKind.TAGGED: (dict,),
+    PlanKind.LIST: (list,),
+    PlanKind.ARRAY: (list,),
+    PlanKind.TUPLE: (list,),
+    PlanKind.SET: (list,),
+}
+
+
+def _dispatch_rank(plan: TypePlan, json_type: type) -> Optional[int]:
+    # 0: the member takes values of that type as they are, 1: a scalar that may convert them,
+    # 2: a number accepted for another number type, None: the member never accepts them
+    kind = plan.kind
+    if kind is PlanKind.PRIMITIVE:
+        if json_type is plan.tp:
+            return 0
+        if plan.tp in (int, float) and json_type in (int, float, bool):
+            return 2
+        return None
+    if kind is PlanKind.SCALAR:
+        return None if json_type is type(None) else 1
+    return 0 if json_type in _STRICT.get(kind, ()) else None
+
+
+def union_dispatch(members: Tuple[TypePlan, ...]) -> Dict[type, Tuple[TypePlan, ...]]:
+    """
+    Precomputes the members of a Union that can decode each JSON value type, so that a value is
+    only validated against the members its type can match rather than against every member in turn.
+
+    For each type, the members taking values of that type as they are come first (e.g. `str` for a
+    string, the dataclasses and dicts for an object), then the registered scalars, which may convert
+    it, then the numeric members accepting it as another number type; members of the same rank keep
+    their declaration order. A primitive member always decodes the values it is a candidate for, so
+    the members ranked after it are dropped. A value whose type has a single candidate is decoded
+    with no attempt.
+
+    :param members: The plans of the Union members.
+    :return: A dictionary mapping each type of JSON_VALUE_TYPES to its candidate members, possibly none.
+    """
+    dispatch = {}
+    for json_type in JSON_VALUE_TYPES:
+        ranked = [(rank, index, member) for index, member in enumerate(members)
+                  for rank in (_dispatch_rank(member, json_type),) if rank is not None]
+        candidates = []
+        for _, _, member in sorted(ranked, key=lambda item: item[:2]):
+            candidates.append(member)
+            if member.kind is PlanKind.PRIMITIVE:
+                break
+        dispatch[json_type] = tuple(candidates)
+    return dispatch
+
+
+class PlanCache:
+    """
+    A bounded, thread-safe LRU cache of compiled plans keyed by type (and by the decoding options,
+    when they are not the defaults).
+
+    Plans are built outside the lock; if two threads compile the same type concurrently the first
+    plan stored wins and both callers receive it. The plans built for the fields of a dataclass are
+    stored once the plan of the dataclass is complete, see `build_plan`.
+    """
+    def __init__(self, maxsize: int = DEFAULT_PLAN_CACHE_SIZE):
+        if maxsize < 1:
+            raise ValueError('maxsize must be a positive integer')
+        self._maxsize = maxsize
+        self._plans: 'OrderedDict[Any, TypePlan]' = OrderedDict()
+        self._lock = threading.RLock()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, tp: Any, options: PlanOptions = DEFAULT_PLAN_OPTIONS) -> TypePlan:
+        """
+        Returns the plan of a type, compiling and storing it on a cache miss.
+
+        :param tp: The type whose plan is requested.
+        :param options: The decoding options the plan is built with.
+        :return: The compiled plan.
+        :raises InvalidDataTypeError: If the type is not supported.
+        """
+        key = tp if options == DEFAULT_PLAN_OPTIONS else _PlanKey(tp, options)
+        try:
+            with self._lock:
+                plan = self._plans.get(key)
+                if plan is not None:
+                    self._plans.move_to_end(key)
+                    self._hits += 1
+                    return plan
+                self._misses += 1
+        except TypeError:
+            # unhashable annotations cannot be cached, compile them every time
+            return build_plan(tp, options)
+
+        building = _building
+        if building.shells:
+            plan = building.shells.get(_PlanKey(tp, options)) or building.built.get((self, key))
+            if plan is not None:
+                return plan
+        plan = build_plan(tp, options)
+        if building.shells:
+            # part of a plan still being built, stored along with it
+            building.built[(self, key)] = plan
+            return plan
+        return self._store(key, plan)
+
+    def _store(self, key: Any, plan: TypePlan) -> TypePlan:
+        """
+        Stores a plan built for a cache key, unless another one was stored meanwhile.
+
+        :return: The plan stored for the key.
+        """
+        with self._lock:
+            existing = self._plans.get(key)
+            if existing is not None:
+                return existing
+            self._plans[key] = plan
+            while len(self._plans) > self._maxsize:
+                self._plans.popitem(last=False)
+        return plan
+
+    def info(self) -> PlanCacheInfo:
+        """
+        Reports the cache statistics.
+
+        :return: A PlanCacheInfo with hits, misses, maxsize and current size.
+        """
+        with self._lock:
+            return PlanCacheInfo(self._hits, self._misses, self._maxsize, len(self._plans))
+
+    def types(self) -> Tuple[Any, ...]:
+        """
+        Lists the cached types, from the least to the most recently used.
+
+        :return: A tuple of the types currently holding a plan, once per set of decoding options.
+        """
+        with self._lock:
+            return tuple(key.tp if type(key) is _PlanKey else key for key in self._plans)
+
+    def resize(self, maxsize: int) -> None:
+        """
+        Changes the cache bound, evicting the least recently used plans if needed.
+
+        :param maxsize: The new maximum number of cached plans.
+        """
+        if maxsize < 1:
+            raise ValueError('maxsize must be a positive integer')
+        with self._lock:
+            self._maxsize = maxsize
+            while len(self._plans) > self._maxsize:
+                self._plans.popitem(last=False)
+
+    def clear(self) -> None:
+        """
+        Drops every cached plan and resets the statistics.
+        """
+        with self._lock:
+            self._plans.clear()
+            self._hits = 0
+            self._misses = 0
+
+
+_plan_cache = PlanCache()
+
+
+def get_plan(tp: Any, options: PlanOptions = DEFAULT_PLAN_OPTIONS) -> TypePlan:
+    """
+    Returns the compiled plan of a type from the shared plan cache.
+
+    :param tp: The type whose plan is requested.
+    :param options: The decoding options the plan is built with.
+    :return: The compiled plan.
+    :raises InvalidDataTypeError: If the type is not supported.
+    """
+    return _plan_cache.get(tp, options)
+
+
+def plan_cache_info() -> PlanCacheInfo:
+    """
+    Reports hits, misses, bound and size of the shared plan cache.
+    """
+    return _plan_cache.info()
+
+
+def cached_plan_types() -> Tuple[Any, ...]:
+    """
+    Lists the types currently cached in the shared plan cache.
+    """
+    return _plan_cache.types()
+
+
+def set_plan_cache_size(maxsize: int) -> None:
+    """
+    Changes the bound of the shared plan cache.
+    """
+    _plan_cache.resize(maxsize)
+
+
+def clear_plan_cache() -> None:
+    """
+    Empties the shared plan cache, e.g. after redefining dataclasses at runtime.
+    """
+    _plan_cache.clear()
@@ -0,0 +1,126 @@
+from typing import Any, Dict, List, Optional
+
+from object_serializer.serializer.decoder_plan import TypePlan, PlanKind
+from object_serializer.serializer.projection import EXCLUDED
+
+
+_PRIMITIVE = PlanKind.PRIMITIVE
+_SCALAR = PlanKind.SCALAR
+_LIST = PlanKind.LIST
+_OPTIONAL = PlanKind.OPTIONAL
+_DATACLASS = PlanKind.DATACLASS
+_ARRAY = PlanKind.ARRAY
+_DICT = PlanKind.DICT
+_TUPLE = PlanKind.TUPLE
+_SET = PlanKind.SET
+_UNION = PlanKind.UNION
+_TAGGED = PlanKind.TAGGED
+
+# the Python types of the values decoded by each plan kind, to find the member of a Union a value belongs to
+_DECODED_TYPES = {
+    _LIST: list,
+    _DICT: dict,
+    _TUPLE: tuple,
+    _SET: (set, frozenset),
+}
+
+
+def encode_object(plan: TypePlan, obj: Any) -> Dict[str, Any]:
+    """
+    Encodes a dataclass instance into a JSON-compatible dictionary following its compiled plan.
+
+    Unlike `dataclasses.asdict`, values are not deep-copied: primitive values, and lists or
+    dictionaries holding only primitives, are placed in the result as they are, so the result shares
+    them with the instance. Fields set to EXCLUDED by a projection are left out.
+
+    :param plan: The compiled plan of the dataclass.
+    :param obj: The instance to encode.
+    :return: A dictionary mapping field names to JSON values.
+    """
+    result = {}
+    for field in plan.fields:
+        value = getattr(obj, field.name)
+        if value is EXCLUDED:
+            continue
+        field_plan = field.plan
+        if field_plan.kind is not _PRIMITIVE:
+            value = encode_value(field_plan, value)
+        result[field.name] = value
+    return result
+
+
+def encode_value(plan: TypePlan, value: Any) -> Any:
+    """
+    Encodes a single value into its JSON-compatible form, dispatching on the plan kind.
+
+    :param plan: The compiled plan of the declared type.
+    :param value: The value to encode.
+    :return: The JSON-compatible value.
+    """
+    kind = plan.kind
+    if kind is _PRIMITIVE:
+        return value
+    if kind is _OPTIONAL:
+        if value is None:
+            return None
+        return encode_value(plan.inner, value)
+    if kind is _LIST:
+        return _encode_list(plan.inner, value)
+    if kind is _SCALAR or kind is _ARRAY:
+        return plan.encoder(value)
+    if kind is _DICT:
+        inner = plan.inner
+        if inner.kind is _PRIMITIVE:
+            return value
+        return {name: encode_value(inner, item) for name, item in value.items()}
+    if kind is _TUPLE:
+        if plan.members:
+            return [encode_value(member, item) for member, item in zip(plan.members, value)]
+        return _encode_list(plan.inner, list(value))
+    if kind is _SET:
+        return _encode_list(plan.inner, list(value))
+    if kind is _UNION:
+        member = _union_member(plan, value)
+        # a number decoded for another numeric member (1.5 for Union[int, str]) is left as it is
+        return value if member is None else encode_value(member, value)
+    if kind is _TAGGED:
+        return _encode_tagged(plan, value)
+    return encode_object(plan, value)
+
+
+def _encode_tagged(plan: TypePlan, value: Any) -> Dict[str, Any]:
+    # the tag is written when the member does not declare it as a field
+    union = plan.tp
+    for tag, member in plan.dispatch.items():
+        if type(value) is member.tp:
+            result = encode_object(member, value)
+            result.setdefault(union.tag, tag)
+            return result
+    raise TypeError(f"{type(value).__name__} is not a member of {union!r}")
+
+
+def _union_member(plan: TypePlan, value: Any) -> Optional[TypePlan]:
+    for member in plan.members:
+        kind = member.kind
+        if kind is _ARRAY:
+            if isinstance(value, list) or hasattr(value, 'tolist'):
+                return member
+        elif kind is _TAGGED:
+            if type(value) in member.tp.classes:
+                return member
+        elif isinstance(value, _DECODED_TYPES.get(kind, member.tp)):
+            return member
+    return None
+
+
+def _encode_list(inner: TypePlan, value: List[Any]) -> List[Any]:
+    kind = inner.kind
+    if kind is _PRIMITIVE:
+        if isinstance(value, list):
+            return value
+        # array.array and numpy arrays decoded with the numeric_lists option
+        tolist = getattr(value, 'tolist', None)
+        return value if tolist is None else tolist()
+    if kind is _DATACLASS:
+        return [encode_object(inner, item) for item in value]
+    return [encode_value(inner, item) for item in value]
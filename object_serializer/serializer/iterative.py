@@ -0,0 +1,161 @@
+from dataclasses import MISSING
+from typing import Any, Callable, Dict, Generator, List, Optional, Tuple
+
+from object_serializer.serializer.decoder_plan import FieldPlan, TypePlan, PlanKind
+from object_serializer.exceptions import TypeValueMismatchError, UnresolvedAttributeError
+
+
+Validate = Callable[[str, TypePlan, Any], Any]
+MissingField = Callable[[TypePlan, FieldPlan, Dict[str, Any]], Any]
+Frame = Generator[Tuple[str, TypePlan, Any], Any, Any]
+
+_PRIMITIVE = PlanKind.PRIMITIVE
+_LIST = PlanKind.LIST
+_OPTIONAL = PlanKind.OPTIONAL
+_DATACLASS = PlanKind.DATACLASS
+_DICT = PlanKind.DICT
+_TUPLE = PlanKind.TUPLE
+_SET = PlanKind.SET
+_UNION = PlanKind.UNION
+_TAGGED = PlanKind.TAGGED
+
+
+class IterativeDecoder:
+    """
+    Decodes a JSON value against a plan with an explicit stack instead of Python recursion, so that
+    the depth of the document is bounded by memory only rather than by the recursion limit.
+
+    Every object, list or dictionary being decoded is a suspended generator on the stack, yielding
+    its children one at a time and receiving their decoded values. Values that hold no nested
+    container (primitives, scalars, numeric arrays, lists of primitives) and every mismatch are
+    handed to the generic validation (`validate`), so the results and errors are those of
+    `Parser.validate_and_parse`. Only a Union with several candidates for a value decodes each
+    attempt with a nested run, one Python frame per such level.
+
+    :param validate: The generic validation routine, `Parser._validate_value`.
+    :param missing: The routine resolving a missing field, `Parser._missing_field`.
+    """
+    __slots__ = ('validate', 'missing')
+
+    def __init__(self, validate: Validate, missing: MissingField):
+        self.validate = validate
+        self.missing = missing
+
+    def decode(self, key: str, plan: TypePlan, data: Any) -> Any:
+        """
+        Validates and decodes a value against a plan.
+
+        :param key: The name of the value in error messages.
+        :param plan: The compiled plan of the expected type.
+        :param data: The JSON value.
+        :return: The decoded value.
+        :raises TypeValueMismatchError: If any value does not match its expected type.
+        :raises UnresolvedAttributeError: If a required field is missing.
+        """
+        frame, value = self._start(key, plan, data)
+        if frame is None:
+            return value
+        stack = [frame]
+        start = self._start
+        while True:
+            try:
+                request = frame.send(value)
+            except StopIteration as done:
+                stack.pop()
+                value = done.value
+                if not stack:
+                    return value
+                frame = stack[-1]
+                continue
+            child, value = start(*request)
+            if child is not None:
+                stack.append(child)
+                frame = child
+
+    def _start(self, key: str, plan: TypePlan, actual: Any) -> Tuple[Optional[Frame], Any]:
+        # returns the frame decoding a container, or the decoded value of anything else
+        kind = plan.kind
+        if kind is _DATACLASS:
+            if isinstance(actual, dict):
+                return self._object(plan, actual), None
+        elif kind is _OPTIONAL:
+            if actual is None:
+                return None, None
+            inner = plan.inner
+            if inner.kind is not _PRIMITIVE and (inner.kind is not _DATACLASS or isinstance(actual, dict)):
+                return self._start(key, inner, actual)
+        elif kind is _LIST or kind is _SET or (kind is _TUPLE and not plan.members):
+            if isinstance(actual, list) and plan.inner.kind is not _PRIMITIVE:
+                factory = None if kind is _LIST else plan.factory or tuple
+                return self._items(key, plan.inner, actual, factory), None
+        elif kind is _TUPLE:
+            if isinstance(actual, list) and len(actual) == len(plan.members):
+                return self._tuple(key, plan.members, actual), None
+        elif kind is _DICT:
+            if isinstance(actual, dict) and plan.inner.kind is not _PRIMITIVE:
+                return self._dict(key, plan, actual), None
+        elif kind is _TAGGED:
+            if isinstance(actual, dict):
+                try:
+                    member = plan.dispatch.get(actual.get(plan.tp.tag, MISSING))
+                except TypeError:
+                    member = None
+                if member is not None:
+                    return self._object(member, actual), None
+        elif kind is _UNION:
+            candidates = plan.dispatch.get(type(actual), plan.members)
+            if len(candidates) == 1:
+                return self._start(key, candidates[0], actual)
+            for candidate in candidates[:-1]:
+                try:
+                    return None, self.decode(key, candidate, actual)
+                except (TypeValueMismatchError, UnresolvedAttributeError):
+                    pass
+            if candidates:
+                return self._start(key, candidates[-1], actual)
+        # flat values, and mismatches, which the generic validation raises
+        return None, self.validate(key, plan, actual)
+
+    def _object(self, plan: TypePlan, data: Dict[str, Any]) -> Frame:
+        values = []
+        for field in plan.fields:
+            value = data.get(field.name, MISSING)
+            field_plan = field.plan
+            kind = field_plan.kind
+            # the values matching a primitive type exactly, and nulls of optionals, need no round trip
+            if (kind is _PRIMITIVE and type(value) is field_plan.tp) or (value is None and kind is _OPTIONAL):
+                values.append(value)
+            elif value is MISSING:
+                values.append(self.missing(plan, field, data))
+            else:
+                values.append((yield field.name, field_plan, value))
+        return plan.factory(*values)
+
+    @staticmethod
+    def _items(key: str, inner: TypePlan, items: List[Any], factory: Optional[type]) -> Frame:
+        values = []
+        optional = inner.kind is _OPTIONAL
+        for item in items:
+            if item is None and optional:
+                values.append(None)
+            else:
+                values.append((yield key, inner, item))
+        return values if factory is None else factory(values)
+
+    @staticmethod
+    def _tuple(key: str, members: Tuple[TypePlan, ...], items: List[Any]) -> Frame:
+        values = []
+        for member, item in zip(members, items):
+            values.append((yield key, member, item))
+        return tuple(values)
+
+    @staticmethod
+    def _dict(key: str, plan: TypePlan, items: Dict[str, Any]) -> Frame:
+        inner = plan.inner
+        values = {}
+        for name, item in items.items():
+            if type(name) is not str:
+                raise TypeValueMismatchError(key, plan.tp, type(items), template=TypeValueMismatchError.DICT_KEY,
+                                             item_type=type(name))
+            values[name] = yield key, inner, item
+        return values
@@ -1,91 +1,1074 @@
-import json
-from typing import Any, List, Dict, get_args, Type, TypeVar, Union
+import os
+from concurrent.futures import Executor
+from dataclasses import MISSING
+from functools import partial
+from json import JSONDecodeError
+from typing import (Any, AsyncIterable, AsyncIterator, Callable, Iterable, Iterator, List, Dict, Optional, Set,
+                    Tuple, Type, TypeVar, Union)
 
-from object_serializer.serializer.dataclass_serializer import serialize, gen_dataclass_instance
-from object_serializer.exceptions import TypeValueMismatchError, InvalidDataTypeError
+from object_serializer.serializer.dataclass_serializer import slotted_dataclass
+from object_serializer.serializer.codegen import compile_decoder
+from object_serializer.serializer.encoder import encode_object
+from object_serializer.serializer.batch import BatchResult, RecordError
+from object_serializer.serializer.stats import ParserStats
+from object_serializer.serializer.columnar import Columns, collect_columns
+from object_serializer.serializer.lazy import lazy_proxy, bind_proxies, materialize
+from object_serializer.serializer.iterative import IterativeDecoder
+from object_serializer.serializer.projection import Paths, Projection, Fill, build_projection
+from object_serializer.serializer.report import FieldError, ValidationReport
+from object_serializer.serializer.aio import (DEFAULT_ASYNC_CHUNK_SIZE, run_in_executor, validate_many_in_chunks,
+                                             aiter_ndjson)
+from object_serializer.serializer.parallel import DEFAULT_PARALLEL_CHUNK_SIZE, decode_parallel
+from object_serializer.serializer.streaming import (Source, DEFAULT_CHUNK_SIZE, iter_ndjson, iter_json_array,
+                                                    iter_object_field)
+from object_serializer.serializer.decoder_plan import (TypePlan, FieldPlan, PlanKind, PlanOptions, PlanCacheInfo, get_plan,
+                                                       plan_cache_info, clear_plan_cache)
+from object_serializer.serializer.numeric import NUMERIC_LIST_MODES
+from object_serializer.exceptions import (TypeValueMismatchError, NotADataclassError, UnresolvedAttributeError,
+                                          InvalidDataTypeError)
 from object_serializer.utils.validations import Validator
+from object_serializer.utils.json_backend import JsonBackend, JsonInput, get_backend
 
 
 T = TypeVar('T')
 
+Backend = Union[str, JsonBackend, None]
+
+Document = Union[JsonInput, 'os.PathLike[str]', Dict[str, Any]]
+
+_PRIMITIVE = PlanKind.PRIMITIVE
+_SCALAR = PlanKind.SCALAR
+_LIST = PlanKind.LIST
+_OPTIONAL = PlanKind.OPTIONAL
+_DATACLASS = PlanKind.DATACLASS
+_ARRAY = PlanKind.ARRAY
+_DICT = PlanKind.DICT
+_TUPLE = PlanKind.TUPLE
+_SET = PlanKind.SET
+_UNION = PlanKind.UNION
+_TAGGED = PlanKind.TAGGED
+
+# the kinds of the types a whole document can be decoded into
+_ROOT_KINDS = (_DATACLASS, _TAGGED)
+
+_JSON_TYPES = (str, bytes, bytearray, memoryview)
+
+
+def _is_raw(data: Any) -> bool:
+    # JSON text, bytes-like objects and paths are parsed, anything else is taken as parsed already
+    return isinstance(data, _JSON_TYPES) or (type(data) is not dict and isinstance(data, os.PathLike))
+
 
 class Parser:
+    _stats: Optional[ParserStats] = None
+
     @staticmethod
-    def parse_json(data: str) -> Dict[str, Any]:
+    def parse_json(data: Union[JsonInput, 'os.PathLike[str]'], backend: Backend = None) -> Dict[str, Any]:
         """
         Converts a JSON string to a dictionary.
 
-        :param data: The string to be parsed as JSON.
+        Binary input (bytes, bytearray, memoryview) is handed to the JSON backend as it is, without
+        being decoded to a string first when the backend supports it. A path (`os.PathLike`, a str
+        being JSON text) is parsed from a memory map of the file, see `JsonBackend.load_path`.
+
+        :param data: The string (or bytes-like object, or path) to be parsed as JSON.
+        :param backend: The JSON backend name (json, orjson, ujson, msgspec) or instance, by default the
+                        one selected with `set_default_backend`.
         :return: Parsed dictionary if valid JSON, otherwise raises JSONDecodeError.
         :raises TypeError: If the data is None.
         """
         if data is None:
             raise TypeError('data must not be None')
+        if isinstance(data, os.PathLike):
+            return get_backend(backend).load_path(data)
+        return get_backend(backend).loads(data)
+
+    @staticmethod
+    def validate_and_parse(cls: Type[T], data: Document, backend: Backend = None,
+                           numeric_lists: Optional[str] = None, lazy: bool = False, include: Paths = None,
+                           exclude: Paths = None, iterative: bool = False) -> T:
+        """
+        Validates a JSON string or dictionary against a dataclass and returns an instance of that dataclass.
+
+        JSON can also be given as bytes, bytearray or memoryview, parsed without being decoded to a
+        str first when the backend supports it, or as a path to a file, parsed from a memory map of
+        the file rather than from a copy of its content (see `parse_json`).
+
+        The dataclass is compiled once into a decoding plan which is cached by type, so repeated calls
+        do not inspect the dataclass fields again. cls can also be a TaggedUnion of dataclasses, decoding
+        the document into the member its tag selects.
+
+        :param cls: The dataclass (or TaggedUnion) to validate against.
+        :param data: JSON string, bytes-like object, path or dictionary.
+        :param backend: The JSON backend parsing a JSON string, see `parse_json`.
+        :param numeric_lists: 'array' or 'numpy' to decode List[int] and List[float] fields into
+                              `array.array` or NumPy arrays, checked and converted in one bulk
+                              operation; None (the default) keeps lists.
+        :param lazy: If True, nested dataclass fields and lists of dataclasses are only checked to be
+                     an object (a list) and are validated and built on first use, through a
+                     LazyProxy that then replaces itself on its owner; the errors they hold are
+                     raised at that point. Call `materialize` to validate everything later.
+        :param include: The fields to decode, as names or dotted paths into nested dataclasses (e.g.
+                        `reviews.rating`, through lists and optionals); the other fields are neither
+                        validated nor built and are set to their default value, or to EXCLUDED when
+                        they have none.
+        :param exclude: The fields (names or dotted paths) not to decode, set like the fields left out
+                        by include.
+        :param iterative: If True, the document is decoded with an explicit stack instead of recursive
+                          calls (see `IterativeDecoder`), so nesting deeper than the recursion limit
+                          (trees, threads of comments) does not raise RecursionError. A JSON string
+                          is still parsed by the backend, which may have its own nesting limit: pass
+                          a dictionary to decode documents of any depth.
+        :return: An instance of the dataclass.
+        :raises NotADataclassError: If cls is not a dataclass.
+        :raises TypeValueMismatchError: If any value in the JSON does not match the expected type.
+        :raises UnresolvedAttributeError: If include or exclude names a field that does not exist.
+        :raises ValueError: If numeric_lists is unknown, or 'numpy' without NumPy installed, or if lazy
+                            is combined with include or exclude, or used with a TaggedUnion, or
+                            if iterative is combined with lazy, include or exclude.
+        """
+        options = Parser._plan_options(numeric_lists)
+        stats = Parser._stats
+        if stats is not None:
+            return Parser._validate_and_parse_stats(stats, cls, data, backend, options, lazy, include, exclude,
+                                                    iterative)
+
+        if _is_raw(data):
+            data = Parser.parse_json(data, backend)
+
+        plan = get_plan(cls, options)
+        if plan.kind not in _ROOT_KINDS:
+            raise NotADataclassError(cls)
+        if lazy or include is not None or exclude is not None or iterative:
+            return Parser._root_validator(plan, lazy, include, exclude, iterative)(data)
+        return Parser._validate_value(cls.__name__, plan, data)
+
+    @staticmethod
+    def _root_validator(plan: TypePlan, lazy: bool, include: Paths, exclude: Paths,
+                        iterative: bool = False) -> Callable[[Any], Any]:
+        """
+        Returns the function validating a root object against a dataclass plan with the lazy, include,
+        exclude and iterative options of `validate_and_parse`.
+
+        :raises ValueError: If lazy is combined with include or exclude, or any of them is used with a
+                            TaggedUnion or with iterative.
+        """
+        key = plan.tp.__name__
+        if iterative:
+            if lazy or include is not None or exclude is not None:
+                raise ValueError("iterative cannot be combined with lazy, include or exclude")
+            return partial(IterativeDecoder(Parser._validate_value, Parser._missing_field).decode, key, plan)
+        if plan.kind is _TAGGED and (lazy or include is not None or exclude is not None):
+            raise ValueError("lazy, include and exclude are not supported for a TaggedUnion")
+        if include is not None or exclude is not None:
+            if lazy:
+                raise ValueError("lazy cannot be combined with include or exclude")
+            return partial(Parser._validate_projected, key, plan, build_projection(plan, include, exclude))
+        if lazy:
+            return partial(Parser._validate_lazy, key, plan)
+        return partial(Parser._validate_value, key, plan)
+
+    @staticmethod
+    def _validate_and_parse_stats(stats: ParserStats, cls: Type[T], data: Document,
+                                  backend: Backend, options: PlanOptions, lazy: bool, include: Paths,
+                                  exclude: Paths, iterative: bool) -> T:
+        """
+        `validate_and_parse` with every phase recorded by the installed ParserStats.
+        """
+        if _is_raw(data):
+            data = stats.call(cls, 'parse', Parser.parse_json, data, backend)
+
+        plan = stats.call(cls, 'plan', get_plan, cls, options)
+        if plan.kind not in _ROOT_KINDS:
+            raise NotADataclassError(cls)
+        return stats.call(cls, 'decode', Parser._root_validator(plan, lazy, include, exclude, iterative), data)
+
+    @staticmethod
+    def validate_and_report(cls: Type[T], data: Document, backend: Backend = None,
+                            numeric_lists: Optional[str] = None) -> ValidationReport[T]:
+        """
+        Validates a JSON string or dictionary against a dataclass, collecting every error of the
+        document instead of raising the first one.
 
+        Each error is a FieldError locating the value by its full path (`products[17].reviews[2].rating`)
+        with the expected and actual types. A valid document goes through the generated decoder
+        (see `compile`) only; the document is walked again, recording every error, once the decoder
+        has failed.
+
+        :param cls: The dataclass to validate against.
+        :param data: JSON string, bytes-like object, path or dictionary, see `validate_and_parse`.
+        :param backend: The JSON backend parsing a JSON string, see `parse_json`.
+        :param numeric_lists: The container of List[int] and List[float] fields, see `validate_and_parse`.
+        :return: A ValidationReport holding the instance, or the errors when there is any.
+        :raises NotADataclassError: If cls is not a dataclass.
+        """
+        decode = Parser.compile(cls, numeric_lists)
+        if _is_raw(data):
+            data = Parser.parse_json(data, backend)
         try:
-            return json.loads(data)
-        except json.JSONDecodeError as e:
-            raise e
+            return ValidationReport(decode(data))
+        except (TypeValueMismatchError, UnresolvedAttributeError) as e:
+            error = e
+        report = ValidationReport()
+        Parser._collect(get_plan(cls, Parser._plan_options(numeric_lists)), data, [], report.errors)
+        if not report.errors:
+            # the walk must agree with the decoder; should it not, the decoder error is reported, located
+            # by its field name only, rather than an empty report without a value
+            if isinstance(error, UnresolvedAttributeError):
+                report.errors.append(FieldError((error.field_name,), error.cls, None))
+            else:
+                report.errors.append(FieldError((error.field_name,), error.cls_type, error.json_type))
+        return report
 
     @staticmethod
-    def validate_and_parse(cls: Type[T], data: Union[str, Dict[str, Any]]) -> T:
+    def _collect(plan: TypePlan, actual: Any, path: List[Union[str, int]], errors: List[FieldError],
+                 lenient: bool = True) -> Any:
         """
-        Validates a JSON string or dictionary against a dataclass and returns an instance of that dataclass.
+        Validates a value against a plan like `_validate_value`, but appends a FieldError to errors for
+        every mismatch instead of raising, and goes on with the rest of the value.
+
+        :param path: The field names and list indexes leading to the value, extended while walking it.
+        :param lenient: Whether an int plan accepts a float, as it does for a field, a tuple member or a
+                        union member; an item of a list or dictionary and an optional value do not
+                        (`_validate_list`, `_validate_optional`). A float plan always accepts an int.
+        :return: The decoded value; meaningless when errors were added.
+        """
+        kind = plan.kind
+        if kind is _PRIMITIVE:
+            tp = plan.tp
+            if (isinstance(actual, tp) or (tp is float and isinstance(actual, int)) or
+                    (lenient and tp is int and isinstance(actual, float))):
+                return actual
+        elif kind is _SCALAR:
+            try:
+                return plan.coercer(plan.tp, actual)
+            except (TypeError, ValueError):
+                pass
+        elif kind is _OPTIONAL:
+            if actual is None:
+                return None
+            return Parser._collect(plan.inner, actual, path, errors, False)
+        elif kind is _ARRAY:
+            try:
+                return plan.coercer(actual)
+            except (TypeError, ValueError, OverflowError):
+                if isinstance(actual, List):
+                    count = len(errors)
+                    Parser._collect_items(plan.inner, actual, path, errors)
+                    if len(errors) > count:
+                        return None
+        elif kind is _UNION:
+            candidates = plan.dispatch.get(type(actual), plan.members)
+            attempt = []
+            for candidate in candidates:
+                attempt = []
+                value = Parser._collect(candidate, actual, path, attempt)
+                if not attempt:
+                    return value
+            if candidates:
+                # none of the candidates fits, report why the last one does not
+                errors.extend(attempt)
+                return None
+        elif isinstance(actual, List):
+            if kind is _LIST:
+                return Parser._collect_items(plan.inner, actual, path, errors)
+            if kind is _SET or (kind is _TUPLE and not plan.members):
+                return (plan.factory or tuple)(Parser._collect_items(plan.inner, actual, path, errors))
+            if kind is _TUPLE and len(actual) == len(plan.members):
+                values = []
+                for index, (member, item) in enumerate(zip(plan.members, actual)):
+                    path.append(index)
+                    values.append(Parser._collect(member, item, path, errors))
+                    path.pop()
+                return tuple(values)
+        elif isinstance(actual, Dict):
+            if kind is _DICT:
+                values = {}
+                for name, item in actual.items():
+                    path.append(name)
+                    if type(name) is str:
+                        values[name] = Parser._collect(plan.inner, item, path, errors, False)
+                    else:
+                        errors.append(FieldError(tuple(path), str, type(name)))
+                    path.pop()
+                return values
+            if kind is _TAGGED:
+                tag = actual.get(plan.tp.tag, MISSING)
+                try:
+                    member = plan.dispatch.get(tag)
+                except TypeError:
+                    member = None
+                if member is not None:
+                    return Parser._collect(member, actual, path, errors)
+                path.append(plan.tp.tag)
+                errors.append(FieldError(tuple(path), plan.tp, None if tag is MISSING else type(tag)))
+                path.pop()
+                return None
+            if kind is _DATACLASS:
+                count = len(errors)
+                values = []
+                for field in plan.fields:
+                    path.append(field.name)
+                    value = actual.get(field.name, MISSING)
+                    if value is not MISSING:
+                        values.append(Parser._collect(field.plan, value, path, errors))
+                    elif field.required:
+                        errors.append(FieldError(tuple(path), field.plan.tp, None))
+                    else:
+                        values.append(field.missing_value())
+                    path.pop()
+                if len(errors) > count:
+                    return None
+                return plan.factory(*values)
+        errors.append(FieldError(tuple(path), plan.tp, type(actual)))
+        return None
+
+    @staticmethod
+    def _collect_items(inner: TypePlan, actual: List[Any], path: List[Union[str, int]],
+                       errors: List[FieldError]) -> List[Any]:
+        """
+        Validates the items of a list against the element plan, see `_collect`.
+        """
+        values = []
+        for index, item in enumerate(actual):
+            path.append(index)
+            values.append(Parser._collect(inner, item, path, errors, False))
+            path.pop()
+        return values
+
+    @staticmethod
+    def validate_and_parse_many(cls: Type[T], records: Iterable[Document],
+                                fail_fast: bool = True, backend: Backend = None,
+                                numeric_lists: Optional[str] = None, include: Paths = None,
+                                exclude: Paths = None, iterative: bool = False) -> BatchResult[T]:
+        """
+        Validates many JSON strings or dictionaries against the same dataclass.
+
+        The plan of the dataclass is resolved once for the whole batch and every record goes through
+        its generated decoder (see `compile`). Records are consumed lazily, so they can come from any
+        iterable or generator.
+
+        :param cls: The dataclass to validate against.
+        :param records: An iterable of JSON strings (str or bytes-like objects), paths of JSON files
+                        (parsed from a memory map, see `parse_json`) or dictionaries.
+        :param fail_fast: If True the first invalid record raises its error; if False invalid records
+                          are reported in the result and decoding goes on with the next record.
+        :param backend: The JSON backend parsing the JSON strings, see `parse_json`.
+        :param numeric_lists: The container of List[int] and List[float] fields, see `validate_and_parse`.
+        :param include: The fields to decode, see `validate_and_parse`.
+        :param exclude: The fields not to decode, see `validate_and_parse`.
+        :param iterative: Whether records are decoded with an explicit stack, see `validate_and_parse`.
+        :return: A BatchResult holding the decoded instances and the errors of the invalid records.
+        :raises NotADataclassError: If cls is not a dataclass.
+        :raises TypeValueMismatchError: If fail_fast is True and a record does not match the dataclass.
+        :raises OSError: If the file of a path cannot be opened.
+        """
+        decode, loads = Parser._decoder(cls, backend, numeric_lists)
+        load_path = get_backend(backend).load_path
+        if Parser._stats is not None:
+            load_path = Parser._stats.timed(cls, 'parse', load_path)
+        if include is not None or exclude is not None or iterative:
+            # projected records skip the generated decoder, which builds every field, and iterative
+            # ones skip it as its functions call each other once per nesting level
+            plan = get_plan(cls, Parser._plan_options(numeric_lists))
+            decode = Parser._root_validator(plan, False, include, exclude, iterative)
+            if Parser._stats is not None:
+                decode = Parser._stats.timed(cls, 'decode', decode)
+        result = BatchResult()
+        values = result.values
+        for index, record in enumerate(records):
+            try:
+                if isinstance(record, _JSON_TYPES):
+                    record = loads(record)
+                elif type(record) is not dict and isinstance(record, os.PathLike):
+                    record = load_path(record)
+                values.append(decode(record))
+            except (TypeValueMismatchError, UnresolvedAttributeError, JSONDecodeError) as e:
+                if fail_fast:
+                    raise
+                result.errors.append(RecordError(index, e))
+        return result
+
+    @staticmethod
+    def validate_and_parse_parallel(cls: Type[T],
+                                    records: Iterable[Union[str, bytes, 'os.PathLike[str]', Dict[str, Any]]],
+                                    max_workers: Optional[int] = None,
+                                    chunk_size: int = DEFAULT_PARALLEL_CHUNK_SIZE,
+                                    executor: Optional[Executor] = None, backend: Optional[str] = None) -> List[T]:
+        """
+        Validates many JSON strings, JSON bytes or dictionaries against a dataclass using several
+        processes.
+
+        The records are split into chunks of chunk_size records which are decoded by a
+        ProcessPoolExecutor; every worker compiles the dataclass once and reuses its decoder for all the
+        chunks it receives. Since records and instances are pickled between processes, the dataclass
+        must be importable (defined at module level) and the gain grows with the size of the batch.
+        Paths of JSON files are sent as they are and parsed by the workers from a memory map, so
+        their content is never pickled.
+
+        :param cls: The dataclass to validate against.
+        :param records: An iterable of JSON strings, JSON bytes, paths of JSON files or dictionaries.
+        :param max_workers: The number of worker processes, by default the number of CPUs.
+        :param chunk_size: The number of records decoded by a worker per task.
+        :param executor: An executor to use instead of creating a ProcessPoolExecutor for the call.
+        :param backend: The name of the JSON backend the workers parse the JSON strings with.
+        :return: The instances of cls, in input order.
+        :raises NotADataclassError: If cls is not a dataclass.
+        :raises TypeValueMismatchError: If a record does not match the dataclass.
+        """
+        if get_plan(cls).kind not in _ROOT_KINDS:
+            raise NotADataclassError(cls)
+        backend = get_backend(backend).name
+        return decode_parallel(Parser.compile, cls, records, max_workers, chunk_size, executor, backend)
+
+    @staticmethod
+    async def avalidate_and_parse(cls: Type[T], data: Union[str, Dict[str, Any]],
+                                  executor: Optional[Executor] = None, backend: Backend = None) -> T:
+        """
+        Asynchronous counterpart of `validate_and_parse`, running the decoding on an executor so that
+        large payloads do not block the event loop.
 
         :param cls: The dataclass to validate against.
         :param data: JSON string or dictionary.
+        :param executor: The executor to run on, by default the default executor of the running loop.
+        :param backend: The JSON backend parsing a JSON string, see `parse_json`.
         :return: An instance of the dataclass.
         :raises TypeValueMismatchError: If any value in the JSON does not match the expected type.
         """
+        return await run_in_executor(executor, Parser.validate_and_parse, cls, data, backend)
 
-        if isinstance(data, str):
-            data = Parser.parse_json(data)
+    @staticmethod
+    async def avalidate_and_parse_many(cls: Type[T], records: Iterable[Union[str, Dict[str, Any]]],
+                                       fail_fast: bool = True, chunk_size: int = DEFAULT_ASYNC_CHUNK_SIZE,
+                                       executor: Optional[Executor] = None,
+                                       backend: Backend = None) -> BatchResult[T]:
+        """
+        Asynchronous counterpart of `validate_and_parse_many`.
 
-        cls_dict = serialize(cls)
-        validated_data = Parser._validate_types(cls, cls_dict, data)
+        The records are decoded on the executor chunk_size records at a time, and the event loop gets
+        control back between two chunks.
 
-        return validated_data
+        :param cls: The dataclass to validate against.
+        :param records: An iterable of JSON strings or dictionaries.
+        :param fail_fast: If True the first invalid record raises; otherwise errors are collected.
+        :param chunk_size: The number of records decoded per executor call.
+        :param executor: The executor to run on, by default the default executor of the running loop.
+        :param backend: The JSON backend parsing the JSON strings, see `parse_json`.
+        :return: A BatchResult, with error indexes relative to the whole batch.
+        :raises NotADataclassError: If cls is not a dataclass.
+        """
+        if get_plan(cls).kind not in _ROOT_KINDS:
+            raise NotADataclassError(cls)
+        validate_many = partial(Parser.validate_and_parse_many, backend=backend)
+        return await validate_many_in_chunks(validate_many, cls, records, fail_fast, chunk_size, executor)
 
     @staticmethod
-    def _validate_types(cls: Type[T], cls_dict: Dict[str, Any], data: Dict[str, Any]) -> T:
+    def aiter_ndjson(cls: Type[T], stream: AsyncIterable[Union[bytes, str]],
+                     yield_every: int = DEFAULT_ASYNC_CHUNK_SIZE, backend: Backend = None) -> AsyncIterator[T]:
         """
-        Validates the types of the JSON data against the dataclass and recursively constructs
-        the dataclass instance.
+        Lazily validates a JSON Lines (NDJSON) async byte stream against a dataclass.
+
+        The stream can be any async iterable of bytes (or str) chunks, such as the content of an aiohttp
+        response; chunks do not need to be aligned on lines.
 
         :param cls: The dataclass to validate against.
-        :param cls_dict: The dictionary representation of the dataclass with expected types.
+        :param stream: An async iterable of bytes or str chunks.
+        :param yield_every: The number of records decoded between two returns to the event loop.
+        :param backend: The JSON backend parsing the lines, see `parse_json`.
+        :return: An async generator yielding one instance of cls per line.
+        :raises NotADataclassError: If cls is not a dataclass.
+        :raises StreamDecodeError: If a line is invalid, with its line number and offset.
+        """
+        decode, loads = Parser._decoder(cls, backend)
+        return aiter_ndjson(decode, stream, yield_every, loads)
+
+    @staticmethod
+    def iter_ndjson(cls: Type[T], source: Source, backend: Backend = None) -> Iterator[T]:
+        """
+        Lazily validates a JSON Lines (NDJSON) file, one object per line, against a dataclass.
+
+        Lines are read and decoded one at a time, so memory stays bounded whatever the size of the
+        input. Blank lines are skipped.
+
+        :param cls: The dataclass to validate against.
+        :param source: A path or an opened (text or binary) file object.
+        :param backend: The JSON backend parsing the lines, see `parse_json`.
+        :return: A generator yielding one instance of cls per line.
+        :raises NotADataclassError: If cls is not a dataclass.
+        :raises StreamDecodeError: If a line is invalid, with its line number and offset; the
+                                   original error is available as its `error` attribute.
+        """
+        decode, loads = Parser._decoder(cls, backend)
+        return iter_ndjson(decode, source, loads)
+
+    @staticmethod
+    def iter_json_array(cls: Type[T], source: Source, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[T]:
+        """
+        Lazily validates a file holding a top-level JSON array of objects against a dataclass.
+
+        The file is read in chunks and the elements are decoded one at a time, so memory is bounded by
+        the largest element instead of the whole document.
+
+        :param cls: The dataclass to validate against.
+        :param source: A path or an opened (text or binary) file object.
+        :param chunk_size: The number of characters (or bytes) read at a time.
+        :return: A generator yielding one instance of cls per array element.
+        :raises NotADataclassError: If cls is not a dataclass.
+        :raises StreamDecodeError: If the document or an element is invalid, with the line number and
+                                   character offset where the element starts.
+        """
+        decode, _ = Parser._decoder(cls)
+        return iter_json_array(decode, source, chunk_size)
+
+    @staticmethod
+    def iter_field(cls: Type[T], source: Source, field: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[Any]:
+        """
+        Lazily validates the elements of one list field of a dataclass, read from a file holding a
+        single JSON object.
+
+        This is meant for documents whose bulk is one huge list, e.g. `products` in
+        `{"products": [...], "total": 100}`: instead of loading the whole document and building the
+        whole list, the file is scanned in chunks, the values of the other fields are validated and
+        discarded one at a time and each element of the list is validated and yielded as soon as it
+        has been read. When the document does not hold the field, the elements of its default are
+        yielded as they are. The other fields missing from the document, and anything following the
+        object, are reported once the whole document has been read.
+
+        :param cls: The dataclass describing the document.
+        :param source: A path or an opened (text or binary) file object.
+        :param field: The name of the list field to stream; its type must be List[...] or
+                      Optional[List[...]].
+        :param chunk_size: The number of characters (or bytes) read at a time.
+        :return: A generator yielding the validated elements of the list.
+        :raises NotADataclassError: If cls is not a dataclass.
+        :raises UnresolvedAttributeError: If cls has no such field, or if a required field is missing from
+                                          the document.
+        :raises InvalidDataTypeError: If the field is not a list.
+        :raises StreamDecodeError: If the document, an element or another field is invalid, with the line
+                                   number and character offset where the value starts.
+        """
+        plan, field_plan, inner = Parser._list_field_plan(cls, field)
+        if inner.kind is _DATACLASS:
+            decode_item, _ = Parser._decoder(inner.tp)
+        else:
+            decode_item = partial(Parser._validate_value, field, inner)
+        return iter_object_field(decode_item, partial(Parser._validate_member, plan),
+                                 partial(Parser._missing_members, plan, field_plan, True), source, field, chunk_size)
+
+    @staticmethod
+    def _validate_member(plan: TypePlan, name: str, value: Any) -> None:
+        """
+        Validates a member of a streamed object against its field, see `iter_field`. Members that are
+        not fields are ignored, as `validate_and_parse` ignores them.
+        """
+        for field in plan.fields:
+            if field.name == name:
+                Parser._validate_value(name, field.plan, value)
+                return
+
+    @staticmethod
+    def _missing_members(plan: TypePlan, streamed: FieldPlan, defaults: bool, names: Set[str]) -> Iterable[Any]:
+        """
+        Checks the fields a streamed object does not hold, see `iter_field`.
+
+        :param streamed: The field whose array is streamed.
+        :param defaults: Whether the elements of the default of a missing streamed field are returned.
+        :param names: The names of the members of the object.
+        :return: The elements to yield in place of the array of the streamed field.
+        :raises UnresolvedAttributeError: If a required field is missing.
+        """
+        for field in plan.fields:
+            if field.name not in names and field is not streamed:
+                Parser._missing_field(plan, field, {})
+        if streamed.name in names:
+            return ()
+        default = Parser._missing_field(plan, streamed, {})
+        return (default or ()) if defaults else ()
+
+    @staticmethod
+    def _list_field_plan(cls: Type[T], field: str) -> Tuple[TypePlan, FieldPlan, TypePlan]:
+        """
+        Resolves a List[...] (or Optional[List[...]]) field of a dataclass.
+
+        :return: The plan of the dataclass, the field and the plan of its elements.
+        :raises NotADataclassError: If cls is not a dataclass.
+        :raises UnresolvedAttributeError: If cls has no such field.
+        :raises InvalidDataTypeError: If the field is not a list.
+        """
+        plan = get_plan(cls)
+        if plan.kind is not _DATACLASS:
+            raise NotADataclassError(cls)
+        field_plan = next((item for item in plan.fields if item.name == field), None)
+        if field_plan is None:
+            raise UnresolvedAttributeError(cls, {}, field, f"Class {cls.__name__} has no field {field}")
+        type_plan = field_plan.plan
+        list_plan = type_plan.inner if type_plan.kind is _OPTIONAL else type_plan
+        if list_plan.kind is not _LIST:
+            raise InvalidDataTypeError(type_plan.tp, f"Field '{field}' with type {type_plan.tp} is not a list")
+        return plan, field_plan, list_plan.inner
+
+    @staticmethod
+    def validate_columns(cls: Type[T], records: Iterable[Document],
+                         backend: Backend = None, numeric_lists: Optional[str] = None) -> Columns[T]:
+        """
+        Validates many records against a dataclass into a columnar container instead of instances.
+
+        The records are pivoted into one column per field as they are read, so no dataclass instance
+        and no per-record dictionary is kept, then every column is validated once: a column of a
+        primitive field is checked with a single pass over the values, and with numeric_lists set
+        int and float columns are converted in bulk into `array.array` or NumPy arrays. A column accepts
+        the same values as its field either way: an int column holding floats or ints out of the 64-bit
+        range stays a list. Nested dataclasses, lists and scalars are still decoded value by value.
+
+        :param cls: The dataclass to validate against.
+        :param records: An iterable of JSON strings (str or bytes-like objects), paths of JSON files or
+                        dictionaries, e.g. the value of a List[cls] field of an already parsed document.
+        :param backend: The JSON backend parsing the JSON strings, see `parse_json`.
+        :param numeric_lists: 'array' or 'numpy' to store int and float columns (and List[int] /
+                              List[float] fields) as arrays, see `validate_and_parse`.
+        :return: A Columns container.
+        :raises NotADataclassError: If cls is not a dataclass.
+        :raises TypeValueMismatchError: If a record is not an object or a value does not match its field.
+        :raises ValueError: If numeric_lists is unknown, or 'numpy' without NumPy installed.
+        """
+        options = Parser._plan_options(numeric_lists)
+        plan = get_plan(cls, options)
+        if plan.kind is not _DATACLASS:
+            raise NotADataclassError(cls)
+        json_backend = get_backend(backend)
+        rows = (json_backend.loads(record) if isinstance(record, _JSON_TYPES) else
+                json_backend.load_path(record) if _is_raw(record) else record for record in records)
+        return Parser._decode_columns(plan, options, rows)
+
+    @staticmethod
+    def ndjson_columns(cls: Type[T], source: Source, backend: Backend = None,
+                       numeric_lists: Optional[str] = None) -> Columns[T]:
+        """
+        Validates a JSON Lines (NDJSON) file into a columnar container, see `validate_columns`.
+
+        Lines are read one at a time and pivoted into the columns immediately.
+
+        :param cls: The dataclass to validate against.
+        :param source: A path or an opened (text or binary) file object.
+        :param backend: The JSON backend parsing the lines, see `parse_json`.
+        :param numeric_lists: 'array' or 'numpy' to store int and float columns as arrays.
+        :return: A Columns container.
+        :raises NotADataclassError: If cls is not a dataclass.
+        :raises StreamDecodeError: If a line is not a valid JSON object, with its line number and offset.
+        :raises TypeValueMismatchError: If a value does not match its field.
+        """
+        options = Parser._plan_options(numeric_lists)
+        plan = get_plan(cls, options)
+        if plan.kind is not _DATACLASS:
+            raise NotADataclassError(cls)
+        rows = iter_ndjson(partial(Parser._check_row, plan), source, get_backend(backend).loads)
+        return Parser._decode_columns(plan, options, rows)
+
+    @staticmethod
+    def field_columns(cls: Type[T], source: Source, field: str, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                      numeric_lists: Optional[str] = None) -> Columns[Any]:
+        """
+        Validates the elements of one List[Dataclass] field of a document into a columnar container.
+
+        The document is streamed as with `iter_field`: the other fields are skipped and the elements of
+        the list are pivoted into the columns as soon as they are read.
+
+        :param cls: The dataclass describing the document.
+        :param source: A path or an opened (text or binary) file object.
+        :param field: The name of the field; its type must be List[D] or Optional[List[D]] with D a
+                      dataclass, whose fields become the columns.
+        :param chunk_size: The number of characters (or bytes) read at a time.
+        :param numeric_lists: 'array' or 'numpy' to store int and float columns as arrays.
+        :return: A Columns container of D (empty if an optional field is null, or if a field with a default
+                 or an optional field is missing).
+        :raises NotADataclassError: If cls is not a dataclass.
+        :raises UnresolvedAttributeError: If cls has no such field, or if a required field is missing from
+                                          the document.
+        :raises InvalidDataTypeError: If the field is not a list of dataclasses.
+        :raises StreamDecodeError: If the document is malformed, an element is not an object or another
+                                   field is invalid.
+        :raises TypeValueMismatchError: If a value does not match its field.
+        """
+        document, field_plan, inner = Parser._list_field_plan(cls, field)
+        if inner.kind is not _DATACLASS:
+            field_type = field_plan.plan.tp
+            raise InvalidDataTypeError(field_type, f"Field '{field}' with type {field_type} is not a list of "
+                                                   f"dataclasses")
+        options = Parser._plan_options(numeric_lists)
+        plan = get_plan(inner.tp, options)
+        # the default of a missing field holds instances rather than rows, the columns only hold what the
+        # document holds
+        rows = iter_object_field(partial(Parser._check_row, plan), partial(Parser._validate_member, document),
+                                 partial(Parser._missing_members, document, field_plan, False), source, field,
+                                 chunk_size)
+        return Parser._decode_columns(plan, options, rows)
+
+    @staticmethod
+    def _check_row(plan: TypePlan, row: Any) -> Dict[str, Any]:
+        """
+        Passes a JSON object through, raising the usual error for anything else.
+        """
+        if isinstance(row, dict):
+            return row
+        return Parser._validate_value(plan.tp.__name__, plan, row)
+
+    @staticmethod
+    def _decode_columns(plan: TypePlan, options: PlanOptions, rows: Iterable[Any]) -> Columns[Any]:
+        """
+        Pivots JSON objects into columns and validates each column once, see `validate_columns`.
+        """
+        columns, count = collect_columns((field.name for field in plan.fields), rows,
+                                         partial(Parser._check_row, plan))
+        validate = Parser._validate_value
+        for field in plan.fields:
+            name, field_plan = field.name, field.plan
+            column = columns[name]
+            if MISSING in column:
+                # the defaults of missing fields are validated along with the column they fill
+                column = columns[name] = [Parser._missing_field(plan, field, {}) if value is MISSING else value
+                                          for value in column]
+            if field_plan.kind is not _PRIMITIVE:
+                columns[name] = [validate(name, field_plan, value) for value in column]
+                continue
+            tp = field_plan.tp
+            numeric = tp is int or tp is float
+            check = (int, float) if numeric else tp
+            if not all(isinstance(value, check) for value in column):
+                for value in column:
+                    validate(name, field_plan, value)
+            if numeric and options.numeric_lists is not None:
+                # an int field accepts floats and ints out of the 64-bit range, which an int array cannot
+                # hold: such a column stays the list of the validated values
+                try:
+                    columns[name] = get_plan(List[tp], options).coercer(column)
+                except (TypeError, ValueError, OverflowError):
+                    pass
+        return Columns(plan.tp, columns, count)
+
+    @staticmethod
+    def compile(cls: Type[T], numeric_lists: Optional[str] = None) -> Callable[[Dict[str, Any]], T]:
+        """
+        Compiles a dataclass into a specialized decoder function.
+
+        The decoder is generated from the cached plan of the dataclass, with the type checks and the
+        calls to nested decoders inlined, and validates exactly like `validate_and_parse`. It is
+        generated once per dataclass and reused by later calls. The decoder of a TaggedUnion looks the
+        decoder of the member up by the tag of the object in a dictionary.
+
+        :param cls: The dataclass (or TaggedUnion) to compile.
+        :param numeric_lists: The container of List[int] and List[float] fields, see `validate_and_parse`;
+                              every option gets its own decoder.
+        :return: A function taking the JSON data as a dictionary and returning an instance of cls.
+        :raises NotADataclassError: If cls is not a dataclass.
+        """
+        plan = get_plan(cls, Parser._plan_options(numeric_lists))
+        if plan.kind not in _ROOT_KINDS:
+            raise NotADataclassError(cls)
+        return compile_decoder(plan, Parser._validate_value, Parser._missing_field)
+
+    @staticmethod
+    def slotted(cls: Type[T], deep: bool = True) -> type:
+        """
+        Returns the slotted mirror of a dataclass, to decode into compact instances without a
+        per-instance `__dict__`, e.g. `Parser.validate_and_parse(Parser.slotted(Product), data)`.
+
+        The mirror is built once per class, see `slotted_dataclass` for what it keeps of the original.
+
+        :param cls: The dataclass to mirror.
+        :param deep: Whether nested dataclass field types are mirrored too.
+        :return: The slotted dataclass.
+        :raises NotADataclassError: If cls is not a dataclass.
+        """
+        return slotted_dataclass(cls, deep)
+
+    @staticmethod
+    def _decoder(cls: Type[T], backend: Backend = None,
+                 numeric_lists: Optional[str] = None) -> Tuple[Callable[[Dict[str, Any]], T], Callable[[Any], Any]]:
+        """
+        Returns the compiled decoder of a dataclass and the loads function of a JSON backend, both
+        recorded by the installed ParserStats if there is one.
+
+        :raises NotADataclassError: If cls is not a dataclass.
+        """
+        loads = get_backend(backend).loads
+        stats = Parser._stats
+        if stats is None:
+            return Parser.compile(cls, numeric_lists), loads
+        decode = stats.call(cls, 'plan', Parser.compile, cls, numeric_lists)
+        return stats.timed(cls, 'decode', decode), stats.timed(cls, 'parse', loads)
+
+    @staticmethod
+    def _plan_options(numeric_lists: Optional[str]) -> PlanOptions:
+        """
+        Validates the decoding options of a call and bundles them for the plan cache.
+
+        :raises ValueError: If numeric_lists is not None nor one of NUMERIC_LIST_MODES.
+        """
+        if numeric_lists is not None and numeric_lists not in NUMERIC_LIST_MODES:
+            raise ValueError(f"Unknown numeric_lists mode '{numeric_lists}', expected one of "
+                             f"{', '.join(NUMERIC_LIST_MODES)}")
+        return PlanOptions(numeric_lists)
+
+    @staticmethod
+    def enable_stats(stats: Optional[ParserStats] = None) -> ParserStats:
+        """
+        Installs a ParserStats collector recording the calls of the Parser per dataclass and per phase
+        (JSON parsing, plan resolution, decoding and construction), see `ParserStats`.
+
+        Instrumentation is off by default; while it is off the decoding paths run uninstrumented.
+
+        :param stats: The collector to install, by default a new one.
+        :return: The installed collector.
+        """
+        if stats is None:
+            stats = ParserStats()
+        Parser._stats = stats
+        return stats
+
+    @staticmethod
+    def disable_stats() -> Optional[ParserStats]:
+        """
+        Removes the installed ParserStats collector.
+
+        :return: The collector that was installed, if any, with everything it recorded.
+        """
+        stats, Parser._stats = Parser._stats, None
+        return stats
+
+    @staticmethod
+    def get_stats() -> Optional[ParserStats]:
+        """
+        Returns the installed ParserStats collector, or None when instrumentation is off.
+        """
+        return Parser._stats
+
+    @staticmethod
+    def dump(obj: Any) -> Dict[str, Any]:
+        """
+        Encodes a dataclass instance into a JSON-compatible dictionary.
+
+        The instance is walked with the same cached plan used to decode its class: nested dataclasses,
+        lists and optionals are encoded the way they are decoded and registered scalars go through
+        their encoder. Contrary to `dataclasses.asdict` nothing is deep-copied, so lists holding only
+        primitives are shared between the instance and the result.
+
+        :param obj: The dataclass instance to encode.
+        :return: A dictionary that can be passed to `json.dumps` or back to `validate_and_parse`.
+        :raises NotADataclassError: If obj is not a dataclass instance.
+        """
+        cls = type(obj)
+        if not Validator.validate_dataclass(cls):
+            raise NotADataclassError(cls)
+        return encode_object(get_plan(cls), obj)
+
+    @staticmethod
+    def dumps(obj: Any, backend: Backend = None, **kwargs: Any) -> str:
+        """
+        Encodes a dataclass instance into a JSON string, see `dump`.
+
+        :param obj: The dataclass instance to encode.
+        :param backend: The JSON backend emitting the string, see `parse_json`.
+        :param kwargs: Keyword arguments of `json.dumps` (indent, sort_keys, ...); backends that cannot
+                       honor them fall back to the standard library.
+        :return: The JSON string.
+        :raises NotADataclassError: If obj is not a dataclass instance.
+        """
+        return get_backend(backend).dumps(Parser.dump(obj), **kwargs)
+
+    @staticmethod
+    def plan_cache_info() -> PlanCacheInfo:
+        """
+        Reports the statistics of the shared decoding plan cache.
+
+        :return: A PlanCacheInfo with hits, misses, maxsize and current size.
+        """
+        return plan_cache_info()
+
+    @staticmethod
+    def clear_plan_cache() -> None:
+        """
+        Empties the shared decoding plan cache.
+        """
+        clear_plan_cache()
+
+    @staticmethod
+    def _validate_types(plan: TypePlan, data: Dict[str, Any]) -> Any:
+        """
+        Validates the types of the JSON data against a dataclass plan and recursively constructs
+        the dataclass instance.
+
+        :param plan: The compiled plan of the dataclass to validate against.
         :param data: The JSON data as a dictionary.
         :return: An instance of the dataclass populated with validated data.
         :raises TypeValueMismatchError: If any value in the JSON does not match the expected type.
+        :raises UnresolvedAttributeError: If the JSON misses a field without a default that is not Optional.
+        """
+        values = []
+        for field in plan.fields:
+            value = data.get(field.name, MISSING)
+            if value is MISSING:
+                values.append(Parser._missing_field(plan, field, data))
+            else:
+                values.append(Parser._validate_value(field.name, field.plan, value))
+        stats = Parser._stats
+        if stats is not None:
+            return stats.call(plan.tp, 'construct', plan.factory, *values)
+        return plan.factory(*values)
+
+    @staticmethod
+    def _missing_field(plan: TypePlan, field: FieldPlan, data: Dict[str, Any]) -> Any:
+        """
+        Returns the value of a field the JSON object does not hold, see `FieldPlan.missing_value`.
+
+        :raises UnresolvedAttributeError: If the field is required.
+        """
+        if field.required:
+            raise UnresolvedAttributeError(plan.tp, data, field.name)
+        return field.missing_value()
+
+    @staticmethod
+    def _validate_value(key: str, plan: TypePlan, actual: Any) -> Any:
+        """
+        Validates a single value against a plan, dispatching on the precomputed plan kind.
+
+        :param key: The field name that is being parsed
+        :param plan: The compiled plan of the expected type.
+        :param actual: The actual value to validate.
+        :return: The validated value.
+        :raises TypeValueMismatchError: If the value does not match the expected type.
+        """
+        kind = plan.kind
+        if kind is _PRIMITIVE:
+            value = plan.tp
+            if not isinstance(actual, value):
+                if not ((value is int and isinstance(actual, float)) or
+                        (value is float and isinstance(actual, int))):
+                    raise TypeValueMismatchError(key, value, type(actual))
+            return actual
+        if kind is _SCALAR:
+            try:
+                return plan.coercer(plan.tp, actual)
+            except (TypeError, ValueError):
+                raise TypeValueMismatchError(key, plan.tp, type(actual)) from None
+        if kind is _OPTIONAL:
+            return Parser._validate_optional(key, plan, actual)
+        if kind is _LIST:
+            return Parser._validate_list(key, plan, actual)
+        if kind is _ARRAY:
+            return Parser._validate_array(key, plan, actual)
+        if kind is _DICT:
+            return Parser._validate_dict(key, plan, actual)
+        if kind is _UNION:
+            return Parser._validate_union(key, plan, actual)
+        if kind is _TAGGED:
+            return Parser._validate_tagged(key, plan, actual)
+        if kind is _TUPLE:
+            return Parser._validate_tuple(key, plan, actual)
+        if kind is _SET:
+            return plan.factory(Parser._validate_list(key, plan, actual))
+        if isinstance(actual, Dict):
+            return Parser._validate_types(plan, actual)
+        raise TypeValueMismatchError(key, plan.tp, type(actual), template=TypeValueMismatchError.EXPECTED_OBJECT)
+
+    @staticmethod
+    def _validate_projected(key: str, plan: TypePlan, projection: Projection, actual: Any) -> Any:
+        """
+        Validates a value holding the dataclass of a projection (directly, or through lists and
+        optionals), decoding only the fields the projection selects, see the include and exclude
+        options of `validate_and_parse`.
+        """
+        kind = plan.kind
+        if kind is _OPTIONAL:
+            if actual is None:
+                return None
+            plan = plan.inner
+            kind = plan.kind
+        if kind is _DATACLASS:
+            if isinstance(actual, Dict):
+                values = []
+                for field, entry in zip(plan.fields, projection.entries):
+                    if type(entry) is Fill:
+                        values.append(entry())
+                        continue
+                    name = field.name
+                    value = actual.get(name, MISSING)
+                    if value is MISSING:
+                        values.append(Parser._missing_field(plan, field, actual))
+                    elif entry is None:
+                        values.append(Parser._validate_value(name, field.plan, value))
+                    else:
+                        values.append(Parser._validate_projected(name, field.plan, entry, value))
+                return plan.factory(*values)
+        elif kind is _LIST and isinstance(actual, List):
+            inner = plan.inner
+            return [Parser._validate_projected(key, inner, projection, item) for item in actual]
+        return Parser._validate_value(key, plan, actual)
+
+    @staticmethod
+    def _validate_lazy(key: str, plan: TypePlan, actual: Any) -> Any:
+        """
+        Validates a dataclass object whose nested fields are deferred, see the lazy option of
+        `validate_and_parse`.
+        """
+        if isinstance(actual, Dict):
+            return Parser._validate_types_lazy(plan, actual)
+        return Parser._validate_value(key, plan, actual)
+
+    @staticmethod
+    def _defer(key: str, plan: TypePlan, actual: Any) -> Any:
+        """
+        Validates a field value against a plan like `_validate_value`, but returns a LazyProxy
+        deferring the validation of the content of nested dataclasses and lists of dataclasses. The
+        value itself is checked to be an object (a list) right away.
+        """
+        target = plan
+        if plan.kind is _OPTIONAL:
+            if actual is None:
+                return None
+            target = plan.inner
+        kind = target.kind
+        if kind is _DATACLASS and isinstance(actual, Dict):
+            return lazy_proxy(key, partial(Parser._validate_types_lazy, target, actual), target.tp)
+        if kind is _LIST and target.inner.kind is _DATACLASS and isinstance(actual, List):
+            return lazy_proxy(key, partial(Parser._validate_list_lazy, key, target, actual))
+        return Parser._validate_value(key, plan, actual)
+
+    @staticmethod
+    def _validate_types_lazy(plan: TypePlan, data: Dict[str, Any]) -> Any:
         """
-        validated_data = {}
-        for key, value in cls_dict.items():
-            is_optional = Validator.is_optional(value)
-            is_list = Validator.is_lst(value)
-            actual_value = data.get(key)
-
-            if is_optional:
-                validated_data[key] = Parser.validate_optional_type(key, value, actual_value)
-            elif is_list:
-                validated_data[key] = Parser.validate_list_type(key, value, actual_value)
-            elif Validator.validate_dataclass(value):
-                if isinstance(actual_value, Dict):
-                    value_dict = serialize(value)
-                    validated_data[key] = Parser._validate_types(value, value_dict, actual_value)
-                else:
-                    raise TypeValueMismatchError(key, value, type(actual_value),
-                                                 f"Expected a new object at field {key},"
-                                                 f" found {type(actual_value).__name__}"
-                                                 f"instead")
+        Builds a dataclass instance whose nested fields are deferred, see `_defer`.
+        """
+        values = []
+        for field in plan.fields:
+            value = data.get(field.name, MISSING)
+            if value is MISSING:
+                values.append(Parser._missing_field(plan, field, data))
             else:
-                if not isinstance(actual_value, value):
-                    if not ((value is int and isinstance(actual_value, float)) or
-                            (value is float and isinstance(actual_value, int))):
-                        raise TypeValueMismatchError(key, value, type(actual_value),
-                                                     f"Expected type {value} at field {key}, found "
-                                                     f"{type(actual_value)} instead")
-                validated_data[key] = actual_value
-        return gen_dataclass_instance(cls, validated_data)
+                values.append(Parser._defer(field.name, field.plan, value))
+        instance = plan.factory(*values)
+        bind_proxies(instance, values)
+        return instance
+
+    @staticmethod
+    def _validate_list_lazy(key: str, plan: TypePlan, actual: List[Any]) -> List[Any]:
+        """
+        Builds the items of a deferred list of dataclasses, each with its own nested fields deferred.
+        """
+        inner = plan.inner
+        return [Parser._validate_types_lazy(inner, item) if isinstance(item, Dict)
+                else Parser._validate_value(key, inner, item) for item in actual]
+
+    @staticmethod
+    def materialize(obj: T) -> T:
+        """
+        Validates and builds every deferred field of an instance decoded with the lazy option, so that
+        all the errors it holds are raised now and no LazyProxy is left in it.
+
+        :param obj: The instance (or a list of instances).
+        :return: The same instance.
+        :raises TypeValueMismatchError: If a deferred value does not match its type.
+        """
+        return materialize(obj)
 
     @staticmethod
     def validate_list_type(key: str, expected: Any, actual: Any) -> List[Any]:
@@ -98,25 +1081,135 @@ class Parser:
         :return: A list with validated elements.
         :raises TypeValueMismatchError: If the actual value is not a list or its elements do not match the expected type.
         """
+        return Parser._validate_list(key, get_plan(expected), actual)
+
+    @staticmethod
+    def _validate_list(key: str, plan: TypePlan, actual: Any) -> List[Any]:
+        """
+        Validates a list against a compiled LIST plan, see `validate_list_type`.
+        """
         if not isinstance(actual, List):
-            raise TypeValueMismatchError(
-                key, expected, type(actual),
-                f"Expected a list at field {key}, found {type(actual).__name__} instead"
-            )
-        arg = get_args(expected)[0]
-        if Validator.is_optional(arg):
-            return [Parser.validate_optional_type(key, arg, item) for item in actual]
-        elif Validator.is_lst(arg):
-            return [Parser.validate_list_type(key, arg, item) for item in actual]
-        elif Validator.validate_dataclass(arg):
-            return [Parser._validate_types(arg, serialize(arg), item) for item in actual]
-        elif all(isinstance(value, arg) for value in actual):
+            raise TypeValueMismatchError(key, plan.tp, type(actual), template=TypeValueMismatchError.EXPECTED_LIST)
+        inner = plan.inner
+        kind = inner.kind
+        if kind is _OPTIONAL:
+            return [Parser._validate_optional(key, inner, item) for item in actual]
+        elif kind is _LIST:
+            return [Parser._validate_list(key, inner, item) for item in actual]
+        elif kind is not _PRIMITIVE:
+            return [Parser._validate_value(key, inner, item) for item in actual]
+        # JSON does not tell 1 from 1.0, so float lists accept ints as float fields do
+        arg = (int, float) if inner.tp is float else inner.tp
+        if all(isinstance(value, arg) for value in actual):
             return actual
-        else:
-            raise TypeValueMismatchError(
-                key, expected, type(actual),
-                f"List items at field {key} do not match the expected type"
-            )
+        index, item = next((index, item) for index, item in enumerate(actual) if not isinstance(item, arg))
+        raise TypeValueMismatchError(key, plan.tp, type(actual), template=TypeValueMismatchError.LIST_ITEM,
+                                     index=index, item_type=type(item), expected=inner.tp)
+
+    @staticmethod
+    def _validate_array(key: str, plan: TypePlan, actual: Any) -> Any:
+        """
+        Validates and converts a JSON list against a compiled ARRAY plan in a single bulk operation,
+        see the numeric_lists option of `validate_and_parse`.
+        """
+        try:
+            return plan.coercer(actual)
+        except (TypeError, ValueError, OverflowError):
+            if not isinstance(actual, List):
+                raise TypeValueMismatchError(key, plan.tp, type(actual),
+                                             template=TypeValueMismatchError.EXPECTED_LIST) from None
+            raise TypeValueMismatchError(key, plan.tp, type(actual),
+                                         template=TypeValueMismatchError.LIST_ITEMS) from None
+
+    @staticmethod
+    def _validate_dict(key: str, plan: TypePlan, actual: Any) -> Dict[str, Any]:
+        """
+        Validates a JSON object against a compiled DICT plan, keyed by strings with values of the
+        same type. An object of primitive values is returned as it is.
+        """
+        if not isinstance(actual, Dict):
+            raise TypeValueMismatchError(key, plan.tp, type(actual), template=TypeValueMismatchError.EXPECTED_OBJECT)
+        inner = plan.inner
+        if inner.kind is _PRIMITIVE:
+            arg = (int, float) if inner.tp is float else inner.tp
+            for name, value in actual.items():
+                if type(name) is not str or not isinstance(value, arg):
+                    break
+            else:
+                return actual
+            if type(name) is str:
+                raise TypeValueMismatchError(key, plan.tp, type(actual), template=TypeValueMismatchError.DICT_VALUE,
+                                             index=name, item_type=type(value), expected=inner.tp)
+        result = {}
+        for name, value in actual.items():
+            if type(name) is not str:
+                raise TypeValueMismatchError(key, plan.tp, type(actual), template=TypeValueMismatchError.DICT_KEY,
+                                             item_type=type(name))
+            result[name] = Parser._validate_value(key, inner, value)
+        return result
+
+    @staticmethod
+    def _validate_tuple(key: str, plan: TypePlan, actual: Any) -> Tuple[Any, ...]:
+        """
+        Validates a JSON list against a compiled TUPLE plan, of fixed length or variadic.
+        """
+        members = plan.members
+        if not members:
+            return tuple(Parser._validate_list(key, plan, actual))
+        if not isinstance(actual, List):
+            raise TypeValueMismatchError(key, plan.tp, type(actual), template=TypeValueMismatchError.EXPECTED_LIST)
+        if len(actual) != len(members):
+            raise TypeValueMismatchError(key, plan.tp, type(actual), template=TypeValueMismatchError.TUPLE_LENGTH,
+                                         expected=len(members), count=len(actual))
+        validate = Parser._validate_value
+        return tuple([validate(key, member, item) for member, item in zip(members, actual)])
+
+    @staticmethod
+    def _validate_union(key: str, plan: TypePlan, actual: Any) -> Any:
+        """
+        Validates a value against a compiled UNION plan.
+
+        The members that can decode the value are looked up by the type of the value in the
+        precomputed dispatch table of the plan (see `union_dispatch`); only when several members
+        are candidates (e.g. two dataclasses for an object) they are tried in turn. Values of other
+        types than the JSON ones are tried against every member.
+        """
+        candidates = plan.dispatch.get(type(actual), plan.members)
+        if len(candidates) == 1:
+            return Parser._validate_value(key, candidates[0], actual)
+        if not candidates:
+            raise TypeValueMismatchError(key, plan.tp, type(actual))
+        for candidate in candidates[:-1]:
+            try:
+                return Parser._validate_value(key, candidate, actual)
+            except (TypeValueMismatchError, UnresolvedAttributeError):
+                pass
+        return Parser._validate_value(key, candidates[-1], actual)
+
+    @staticmethod
+    def _validate_tagged(key: str, plan: TypePlan, actual: Any) -> Any:
+        """
+        Validates a JSON object against a compiled TAGGED plan: the member is looked up by the value of
+        the tag field in the dispatch table of the plan and the object is validated against it alone.
+
+        :raises UnresolvedAttributeError: If the object has no tag field.
+        :raises TypeValueMismatchError: If the value is not an object, or its tag selects no member.
+        """
+        if not isinstance(actual, Dict):
+            raise TypeValueMismatchError(key, plan.tp, type(actual), template=TypeValueMismatchError.EXPECTED_OBJECT)
+        union = plan.tp
+        tag = actual.get(union.tag, MISSING)
+        try:
+            member = plan.dispatch.get(tag)
+        except TypeError:
+            # an unhashable tag (a list or an object) selects no member
+            member = None
+        if member is not None:
+            return Parser._validate_types(member, actual)
+        if tag is MISSING:
+            raise UnresolvedAttributeError(union, actual, union.tag)
+        raise TypeValueMismatchError(key, union, type(tag), template=TypeValueMismatchError.UNKNOWN_TAG,
+                                     tag_field=union.tag, tag=tag, expected=union.tags)
 
     @staticmethod
     def validate_optional_type(key: str, expected: Any, actual: Any) -> Any:
@@ -130,19 +1223,30 @@ class Parser:
         :raises InvalidDataTypeError: If the expected type is an invalid Optional type.
         :raises TypeValueMismatchError: If the actual value does not match the expected type.
         """
+        return Parser._validate_optional(key, get_plan(expected), actual)
+
+    @staticmethod
+    def _validate_optional(key: str, plan: TypePlan, actual: Any) -> Any:
+        """
+        Validates a value against a compiled OPTIONAL plan, see `validate_optional_type`.
+        """
         if actual is None:
             return None
-        arg = [argv for argv in get_args(expected) if argv is not None][0]
-        if Validator.is_optional(arg):
-            raise InvalidDataTypeError(arg, "Optional cannot contain Optional")
-        elif Validator.is_lst(arg):
-            return Parser.validate_list_type(key, arg, actual)
-        elif Validator.validate_dataclass(arg) and Validator.is_dict(type(actual)):
-            return Parser._validate_types(arg, serialize(arg), actual)
-        elif isinstance(actual, arg):
+        inner = plan.inner
+        kind = inner.kind
+        if kind is _LIST:
+            return Parser._validate_list(key, inner, actual)
+        elif kind is _DATACLASS and isinstance(actual, Dict):
+            return Parser._validate_types(inner, actual)
+        elif kind is _SCALAR:
+            return Parser._validate_value(key, inner, actual)
+        elif kind is _ARRAY:
+            return Parser._validate_array(key, inner, actual)
+        elif kind is _DICT or kind is _UNION or kind is _TUPLE or kind is _SET or kind is _TAGGED:
+            return Parser._validate_value(key, inner, actual)
+        elif kind is _PRIMITIVE and (isinstance(actual, inner.tp) or (inner.tp is float and isinstance(actual, int))):
+            # JSON does not tell 1 from 1.0, so optional floats accept ints as float lists do
             return actual
         else:
-            raise TypeValueMismatchError(
-                "OptionalType", expected, type(actual),
-                f"Expected type {arg} at field {key}, found {type(actual).__name__} instead"
-            )
+            raise TypeValueMismatchError(key, plan.tp, type(actual),
+                                         template=TypeValueMismatchError.EXPECTED_INNER_TYPE, expected=inner.tp)
@@ -0,0 +1,211 @@
+import copy
+import weakref
+from dataclasses import fields, is_dataclass
+from typing import Any, Callable, Dict, Iterable, Optional
+
+
+class LazyProxy:
+    """
+    A placeholder for a nested field value (a dataclass or a list) whose validation is deferred
+    until it is first used.
+
+    On first use (an attribute, an item, iteration, comparison, ...) the deferred validation runs,
+    the proxy replaces itself on its owner with the decoded value (so later reads of the field get
+    the value directly, for frozen and slotted owners too) and forwards the operation to it.
+    Validation errors are raised at that point. `isinstance` checks see the class of the decoded value.
+
+    Copying, deep copying and pickling a proxy copy and pickle the decoded value. The proxy of a
+    dataclass is an instance of a subclass carrying the fields of the dataclass (see `lazy_proxy`),
+    so `dataclasses.fields`, `asdict` and `astuple` see a dataclass instance; the proxy of a list
+    is a list subclass (see `LazyList`).
+
+    The state of a proxy lives in the slots of its concrete type, list subclasses cannot share the
+    slots of a base.
+    """
+    __slots__ = ()
+
+    def __init__(self, field: str, resolve: Callable[[], Any]):
+        _set(self, '_lazy_owner', None)
+        _set(self, '_lazy_field', field)
+        _set(self, '_lazy_resolve', resolve)
+
+    def _lazy_materialize(self) -> Any:
+        resolve = self._lazy_resolve
+        if resolve is None:
+            return self._lazy_value
+        value = resolve()
+        _set(self, '_lazy_value', value)
+        _set(self, '_lazy_resolve', None)
+        owner = self._lazy_owner
+        if owner is not None:
+            field = self._lazy_field
+            if getattr(owner, field, None) is self:
+                _set(owner, field, value)
+            _set(self, '_lazy_owner', None)
+        return value
+
+    @property
+    def __class__(self) -> type:
+        return type(self._lazy_materialize())
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._lazy_materialize(), name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(self._lazy_materialize(), name, value)
+
+    def __getitem__(self, key: Any) -> Any:
+        return self._lazy_materialize()[key]
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        self._lazy_materialize()[key] = value
+
+    def __len__(self) -> int:
+        return len(self._lazy_materialize())
+
+    def __iter__(self):
+        return iter(self._lazy_materialize())
+
+    def __reversed__(self):
+        return reversed(self._lazy_materialize())
+
+    def __contains__(self, item: Any) -> bool:
+        return item in self._lazy_materialize()
+
+    def __bool__(self) -> bool:
+        return bool(self._lazy_materialize())
+
+    def __eq__(self, other: Any) -> bool:
+        return self._lazy_materialize() == other
+
+    def __ne__(self, other: Any) -> bool:
+        return self._lazy_materialize() != other
+
+    def __hash__(self) -> int:
+        return hash(self._lazy_materialize())
+
+    def __repr__(self) -> str:
+        return repr(self._lazy_materialize())
+
+    def __copy__(self) -> Any:
+        return copy.copy(self._lazy_materialize())
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> Any:
+        return copy.deepcopy(self._lazy_materialize(), memo)
+
+    def __reduce_ex__(self, protocol: int) -> Any:
+        return self._lazy_materialize().__reduce_ex__(protocol)
+
+
+_STATE = ('_lazy_owner', '_lazy_field', '_lazy_resolve', '_lazy_value')
+
+# the proxy overrides __setattr__ (and __class__), its slots are set through object's
+_set = object.__setattr__
+
+
+class LazyList(LazyProxy, list):
+    """
+    The proxy of a list. It is a list subclass, so that code dispatching on the type of a value (as
+    `dataclasses.asdict` does on Python 3.13) walks it as a list, and every list method is forwarded
+    to the decoded list: its own storage stays empty. Calling its type with an iterable, as `asdict`
+    does to rebuild the lists it walks, builds a plain list.
+    """
+    __slots__ = _STATE
+
+    def __new__(cls, items: Iterable[Any] = ()) -> Any:
+        return list(items)
+
+    def __radd__(self, other: Any) -> Any:
+        return other + self._lazy_materialize()
+
+
+def _forward(name: str) -> Callable[..., Any]:
+    def method(self, *args: Any, **kwargs: Any) -> Any:
+        return getattr(self._lazy_materialize(), name)(*args, **kwargs)
+
+    method.__name__ = method.__qualname__ = name
+    return method
+
+
+for _name in ('append', 'extend', 'insert', 'remove', 'pop', 'clear', 'index', 'count', 'sort', 'reverse', 'copy',
+              '__delitem__', '__add__', '__iadd__', '__mul__', '__rmul__', '__imul__', '__lt__', '__le__', '__gt__',
+              '__ge__'):
+    setattr(LazyList, _name, _forward(_name))
+
+
+_dataclass_proxies: 'weakref.WeakKeyDictionary[type, type]' = weakref.WeakKeyDictionary()
+
+
+def _dataclass_proxy_type(cls: type) -> type:
+    proxy_type = _dataclass_proxies.get(cls)
+    if proxy_type is None:
+        proxy_type = _dataclass_proxies[cls] = type(f"Lazy{cls.__name__}", (LazyProxy,), {
+            '__slots__': _STATE, '__module__': __name__, '__dataclass_fields__': cls.__dataclass_fields__})
+    return proxy_type
+
+
+def lazy_proxy(field: str, resolve: Callable[[], Any], cls: Optional[type] = None) -> LazyProxy:
+    """
+    Creates a LazyProxy, skipping the call of `__init__`.
+
+    :param field: The name of the field the proxy stands for.
+    :param resolve: The deferred validation, returning the decoded value.
+    :param cls: The dataclass the value is an instance of, None for a list.
+    """
+    proxy = list.__new__(LazyList) if cls is None else object.__new__(_dataclass_proxy_type(cls))
+    _set(proxy, '_lazy_owner', None)
+    _set(proxy, '_lazy_field', field)
+    _set(proxy, '_lazy_resolve', resolve)
+    return proxy
+
+
+def bind_proxies(owner: Any, values: Any) -> None:
+    """
+    Attaches the proxies among the field values of a freshly built instance to their owner.
+
+    A proxy already resolved while the instance was built (e.g. by `__post_init__`) is replaced by
+    its value right away.
+    """
+    for value in values:
+        if isinstance(value, LazyProxy):
+            if value._lazy_resolve is not None:
+                _set(value, '_lazy_owner', owner)
+            else:
+                field = value._lazy_field
+                if getattr(owner, field, None) is value:
+                    _set(owner, field, value._lazy_value)
+
+
+def resolve(value: Any) -> Any:
+    """
+    Returns the decoded value behind a proxy, or the value itself if it is not a proxy.
+    """
+    if isinstance(value, LazyProxy):
+        return value._lazy_materialize()
+    return value
+
+
+def materialize(obj: Any, _seen: Optional[set] = None) -> Any:
+    """
+    Resolves every proxy reachable from a value, validating the deferred fields, in place.
+
+    :param obj: A dataclass instance, a list or any other value.
+    :return: The value, with no proxy left in it.
+    """
+    obj = resolve(obj)
+    if _seen is None:
+        _seen = set()
+    if id(obj) in _seen:
+        return obj
+    if isinstance(obj, list):
+        _seen.add(id(obj))
+        for index, item in enumerate(obj):
+            obj[index] = materialize(item, _seen)
+    elif is_dataclass(obj) and not isinstance(obj, type):
+        _seen.add(id(obj))
+        for field in fields(obj):
+            value = getattr(obj, field.name)
+            resolved = materialize(value, _seen)
+            if resolved is not value:
+                object.__setattr__(obj, field.name, resolved)
+    return obj
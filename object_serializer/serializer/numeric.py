@@ -0,0 +1,82 @@
+from array import array
+from typing import Any, Callable, List
+
+
+NUMERIC_LIST_MODES = ('array', 'numpy')
+"""
+The containers `List[int]` and `List[float]` fields can be decoded into instead of lists:
+
+- array: `array.array` with typecode 'q' (64-bit signed integers) or 'd' (doubles);
+- numpy: a one-dimensional `numpy.ndarray` of dtype int64 or float64 (NumPy must be installed).
+"""
+
+ArrayConverter = Callable[[List[Any]], Any]
+
+_TYPECODES = {int: 'q', float: 'd'}
+
+
+def _array_converter(tp: type) -> ArrayConverter:
+    typecode = _TYPECODES[tp]
+
+    def convert(values: List[Any]) -> array:
+        if not isinstance(values, list):
+            raise TypeError(f"expected a list, found {type(values).__name__}")
+        # array() checks (and converts) every item in C, raising TypeError on the first non-number
+        return array(typecode, values)
+
+    return convert
+
+
+def _numpy_converter(tp: type) -> ArrayConverter:
+    try:
+        import numpy
+    except ImportError:
+        raise ValueError("numeric_lists='numpy' requires NumPy to be installed") from None
+
+    dtype = numpy.dtype(numpy.int64 if tp is int else numpy.float64)
+    # bool is an int subclass for the list validation as well; numpy only infers uint64 for
+    # values from 2 ** 63 upwards, which int64 cannot hold (astype would wrap them to negatives)
+    kinds = 'bi' if tp is int else 'biuf'
+
+    def convert(values: List[Any]) -> Any:
+        if not isinstance(values, list):
+            raise TypeError(f"expected a list, found {type(values).__name__}")
+        if not values:
+            return numpy.empty(0, dtype)
+        # numpy infers a single dtype for the whole list: strings, None or nested lists give a
+        # non-numeric (or multi-dimensional) array instead of a per-item isinstance check
+        result = numpy.array(values)
+        if result.dtype.kind == 'u' and tp is int:
+            raise OverflowError("expected a list of int, found values out of the int64 range")
+        if result.ndim != 1 or result.dtype.kind not in kinds:
+            raise TypeError(f"expected a list of {tp.__name__}, found items of dtype {result.dtype}")
+        return result.astype(dtype, copy=False)
+
+    return convert
+
+
+def numeric_list_converter(mode: str, tp: type) -> ArrayConverter:
+    """
+    Builds the bulk converter of a `List[int]` or `List[float]` field for a numeric_lists mode.
+
+    The converter takes the JSON list and returns the array, raising TypeError, ValueError or
+    OverflowError when the list holds anything else than numbers of the element type (ints for
+    float lists included) or numbers out of the 64-bit range.
+
+    :param mode: One of NUMERIC_LIST_MODES.
+    :param tp: int or float.
+    :return: The converter.
+    :raises ValueError: If the mode is unknown, or is 'numpy' and NumPy is not installed.
+    """
+    if mode == 'array':
+        return _array_converter(tp)
+    if mode == 'numpy':
+        return _numpy_converter(tp)
+    raise ValueError(f"Unknown numeric_lists mode '{mode}', expected one of {', '.join(NUMERIC_LIST_MODES)}")
+
+
+def array_to_list(value: Any) -> List[Any]:
+    """
+    Converts an `array.array` or `numpy.ndarray` back to a list of Python numbers.
+    """
+    return value.tolist()
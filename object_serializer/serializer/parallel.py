@@ -0,0 +1,66 @@
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from functools import partial
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+from object_serializer.utils.json_backend import get_backend
+
+
+DEFAULT_PARALLEL_CHUNK_SIZE = 256
+
+_RAW_TYPES = (str, bytes, bytearray, memoryview)
+
+# decoders compiled in the current (worker) process, by class
+_worker_decoders: Dict[Any, Callable[[Dict[str, Any]], Any]] = {}
+
+
+def _chunks(records: Iterable[Any], chunk_size: int) -> Iterator[List[Any]]:
+    iterator = iter(records)
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _decode_chunk(compile_class: Callable[[Any], Any], cls: Any, backend: Optional[str],
+                  chunk: List[Any]) -> List[Any]:
+    decode = _worker_decoders.get(cls)
+    if decode is None:
+        decode = _worker_decoders[cls] = compile_class(cls)
+    json_backend = get_backend(backend)
+    loads = json_backend.loads
+    return [decode(loads(record) if isinstance(record, _RAW_TYPES) else
+                   json_backend.load_path(record) if isinstance(record, os.PathLike) else record)
+            for record in chunk]
+
+
+def decode_parallel(compile_class: Callable[[Any], Any], cls: Any, records: Iterable[Any],
+                    max_workers: Optional[int] = None, chunk_size: int = DEFAULT_PARALLEL_CHUNK_SIZE,
+                    executor: Optional[Executor] = None, backend: Optional[str] = None) -> List[Any]:
+    """
+    Decodes records in worker processes, one chunk of records per task.
+
+    Each worker compiles the decoder of cls the first time it receives a chunk and keeps it for the
+    following chunks, so the class is compiled once per worker rather than once per record. The
+    chunks are mapped in order, so the result follows the order of the input.
+
+    :param compile_class: The function compiling a dataclass into a decoder (`Parser.compile`); it
+                          must be picklable, as must cls, the records and the decoded instances.
+    :param cls: The dataclass to decode into.
+    :param records: An iterable of JSON strings, JSON bytes, paths of JSON files or dictionaries.
+    :param max_workers: The number of worker processes, by default the number of CPUs.
+    :param chunk_size: The number of records sent to a worker at once.
+    :param executor: An executor to run the chunks on instead of a new ProcessPoolExecutor.
+    :param backend: The name of the JSON backend parsing the records in the workers.
+    :return: The decoded instances, in input order.
+    """
+    if chunk_size < 1:
+        raise ValueError('chunk_size must be a positive integer')
+    task = partial(_decode_chunk, compile_class, cls, backend)
+    chunks = _chunks(records, chunk_size)
+    if executor is not None:
+        return [value for chunk in executor.map(task, chunks) for value in chunk]
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        return [value for chunk in pool.map(task, chunks) for value in chunk]
@@ -0,0 +1,151 @@
+from dataclasses import MISSING
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple, Union
+
+from object_serializer.serializer.decoder_plan import FieldPlan, TypePlan, PlanKind
+from object_serializer.exceptions import InvalidDataTypeError, UnresolvedAttributeError
+
+
+Paths = Union[str, Iterable[str], None]
+
+
+class _Excluded:
+    """
+    The type of EXCLUDED.
+    """
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        return 'EXCLUDED'
+
+    def __bool__(self) -> bool:
+        return False
+
+    def __reduce__(self) -> str:
+        return 'EXCLUDED'
+
+
+EXCLUDED = _Excluded()
+"""The value of the fields left out by a projection that have no default value."""
+
+
+class Fill:
+    """
+    The value a field left out by a projection is set to: its default, a new value of its default
+    factory, or EXCLUDED.
+    """
+    __slots__ = ('default', 'factory')
+
+    def __init__(self, default: Any = EXCLUDED, factory: Optional[Callable[[], Any]] = None):
+        self.default = default
+        self.factory = factory
+
+    def __call__(self) -> Any:
+        if self.factory is not None:
+            return self.factory()
+        return self.default
+
+
+class Projection:
+    """
+    The compiled projection of a dataclass plan: for each field, in declaration order, None when
+    the field is decoded in full, a Fill when it is left out and a nested Projection of the
+    dataclass it holds (directly, or as the elements of lists and optionals) when only some of its
+    fields are decoded.
+    """
+    __slots__ = ('plan', 'entries')
+
+    def __init__(self, plan: TypePlan, entries: Tuple[Union[None, Fill, 'Projection'], ...]):
+        self.plan = plan
+        self.entries = entries
+
+
+def _tree(paths: Optional[Tuple[str, ...]]) -> Optional[Dict[str, Any]]:
+    # {'reviews': {'rating': {}}, 'id': {}}; an empty dict selects the whole field
+    if paths is None:
+        return None
+    tree: Dict[str, Any] = {}
+    for path in paths:
+        node = tree
+        parts = path.split('.')
+        for index, part in enumerate(parts):
+            if part in node and not node[part]:
+                break
+            node = node.setdefault(part, {})
+            if index == len(parts) - 1:
+                node.clear()
+    return tree
+
+
+def _element_plan(plan: TypePlan, name: str) -> TypePlan:
+    target = plan
+    while target.kind is PlanKind.OPTIONAL or target.kind is PlanKind.LIST:
+        target = target.inner
+    if target.kind is not PlanKind.DATACLASS:
+        raise InvalidDataTypeError(plan.tp, f"Field '{name}' with type {plan.tp} has no fields to select")
+    return target
+
+
+def _fill(field: FieldPlan) -> Fill:
+    if field.default_factory is not MISSING:
+        return Fill(factory=field.default_factory)
+    if field.default is not MISSING:
+        return Fill(field.default)
+    return Fill()
+
+
+def _project(plan: TypePlan, include: Optional[Dict[str, Any]], exclude: Optional[Dict[str, Any]]) -> Projection:
+    cls = plan.tp
+    names = {field.name for field in plan.fields}
+    for selection in (include, exclude):
+        for name in selection or ():
+            if name not in names:
+                raise UnresolvedAttributeError(cls, {}, name, f"Class {cls.__name__} has no field {name}")
+    entries = []
+    for field in plan.fields:
+        name = field.name
+        if include is not None and name not in include:
+            entries.append(_fill(field))
+            continue
+        sub_include = include[name] or None if include is not None else None
+        sub_exclude = exclude.get(name) if exclude else None
+        if sub_exclude is not None and not sub_exclude:
+            entries.append(_fill(field))
+        elif sub_include is None and sub_exclude is None:
+            entries.append(None)
+        else:
+            entries.append(_project(_element_plan(field.plan, name), sub_include, sub_exclude))
+    return Projection(plan, tuple(entries))
+
+
+def _normalize(paths: Paths) -> Optional[Tuple[str, ...]]:
+    if paths is None:
+        return None
+    if isinstance(paths, str):
+        return (paths,)
+    return tuple(sorted(set(paths)))
+
+
+@lru_cache(maxsize=256)
+def _build_projection(plan: TypePlan, include: Optional[Tuple[str, ...]],
+                      exclude: Optional[Tuple[str, ...]]) -> Projection:
+    return _project(plan, _tree(include), _tree(exclude))
+
+
+def build_projection(plan: TypePlan, include: Paths = None, exclude: Paths = None) -> Projection:
+    """
+    Compiles include / exclude field paths against a dataclass plan. Compiled projections are cached.
+
+    A path is a field name, or a dotted path into nested dataclasses (`reviews.rating`); paths go
+    through lists and optionals to the dataclass they hold. With `include` only the selected fields
+    are decoded; `exclude` then removes fields from what is selected. A selected dataclass field
+    without a nested path is decoded in full.
+
+    :param plan: The plan of the root dataclass.
+    :param include: The paths to decode, or None for every field.
+    :param exclude: The paths not to decode.
+    :return: The compiled projection.
+    :raises UnresolvedAttributeError: If a path names a field that does not exist.
+    :raises InvalidDataTypeError: If a path goes through a field that does not hold a dataclass.
+    """
+    return _build_projection(plan, _normalize(include), _normalize(exclude))
@@ -0,0 +1,85 @@
+from dataclasses import dataclass, field
+from typing import Any, Generic, List, Optional, Tuple, TypeVar, Union
+
+
+T = TypeVar('T')
+
+Path = Tuple[Union[str, int], ...]
+
+
+def format_path(path: Path) -> str:
+    """
+    Formats a path of field names and list indexes, e.g. `products[17].reviews[2].rating`.
+    """
+    parts = []
+    for segment in path:
+        if type(segment) is int:
+            parts.append(f"[{segment}]")
+        elif parts:
+            parts.append(f".{segment}")
+        else:
+            parts.append(segment)
+    return ''.join(parts)
+
+
+@dataclass
+class FieldError:
+    """
+    A value of a JSON document that does not match its dataclass field.
+
+    The error only stores the raw path and types; the location and message are formatted when
+    they are read.
+
+    :ivar path: The field names and list indexes leading to the value, from the root object.
+    :ivar expected: The type the value was expected to have.
+    :ivar actual: The type the value was found with, or None when the field is missing.
+    """
+    path: Path
+    expected: Any
+    actual: Optional[type]
+
+    @property
+    def missing(self) -> bool:
+        """
+        Whether the error is a missing mandatory field.
+        """
+        return self.actual is None
+
+    @property
+    def location(self) -> str:
+        """
+        The path of the value, e.g. `products[17].reviews[2].rating`.
+        """
+        return format_path(self.path)
+
+    @property
+    def message(self) -> str:
+        """
+        A human readable description of the error.
+        """
+        location = self.location or '<root>'
+        if self.actual is None:
+            return f"Missing mandatory field {location}"
+        return f"Expected type {self.expected} at {location}, found {self.actual.__name__} instead"
+
+    def __str__(self) -> str:
+        return self.message
+
+
+@dataclass
+class ValidationReport(Generic[T]):
+    """
+    The outcome of `Parser.validate_and_report`.
+
+    :ivar value: The decoded instance, or None if the document holds any error.
+    :ivar errors: Every error of the document, in document order.
+    """
+    value: Optional[T] = None
+    errors: List[FieldError] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        """
+        Whether the document was decoded.
+        """
+        return not self.errors
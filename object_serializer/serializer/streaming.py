@@ -0,0 +1,282 @@
+import codecs
+import json
+import os
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, IO, Iterable, Iterator, Set, Tuple, Union
+
+from object_serializer.exceptions import StreamDecodeError, TypeValueMismatchError, UnresolvedAttributeError
+
+
+Source = Union[str, 'os.PathLike[str]', IO[Any]]
+Decoder = Callable[[Dict[str, Any]], Any]
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+_WHITESPACE = ' \t\n\r'
+_TRUNCATION_MARGIN = 8
+_RECORD_ERRORS = (TypeValueMismatchError, UnresolvedAttributeError, json.JSONDecodeError)
+
+
+@contextmanager
+def open_source(source: Source) -> Iterator[IO[Any]]:
+    """
+    Opens a path in binary mode, or passes an already opened (text or binary) file object through.
+
+    Files opened here are closed when the context exits; file objects given by the caller are not.
+    """
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, 'rb') as fp:
+            yield fp
+    else:
+        yield source
+
+
+def iter_ndjson(decode: Decoder, source: Source, loads: Callable[[Any], Any] = json.loads) -> Iterator[Any]:
+    """
+    Decodes a JSON Lines (NDJSON) stream one line at a time.
+
+    Only the current line is held in memory. Blank lines are skipped.
+
+    :param decode: The decoder turning one JSON object into a dataclass instance.
+    :param source: A path or a file object.
+    :param loads: The function parsing one line.
+    :return: A generator of decoded instances.
+    :raises StreamDecodeError: If a line is not valid JSON or does not match the dataclass.
+    """
+    with open_source(source) as fp:
+        offset = 0
+        for line_number, line in enumerate(fp, 1):
+            if line.strip():
+                try:
+                    value = loads(line)
+                    yield decode(value)
+                except _RECORD_ERRORS as e:
+                    raise StreamDecodeError(line_number, offset, e) from e
+            offset += len(line)
+
+
+class JsonStreamReader:
+    """
+    An incremental reader of a JSON document read from a file object in chunks.
+
+    The reader keeps only the unconsumed tail of the input in memory and decodes one JSON value at a
+    time with `json.JSONDecoder.raw_decode`. When a value is cut by the end of the buffer more input is
+    read (at least doubling the buffer, so large values are not re-scanned quadratically) and the
+    value is decoded again. Offsets are counted in characters from the start of the document, and
+    lines are counted as the reading position advances, so each character is counted once.
+    """
+    def __init__(self, fp: IO[Any], chunk_size: int = DEFAULT_CHUNK_SIZE):
+        self.fp = fp
+        self.chunk_size = chunk_size
+        self.buffer = ''
+        self.pos = 0
+        self.eof = False
+        self.consumed = 0
+        self.consumed_lines = 0
+        self._counted = 0
+        self._lines = 0
+        self._decoder = json.JSONDecoder()
+        self._text_decoder = codecs.getincrementaldecoder('utf-8-sig')()
+
+    @property
+    def offset(self) -> int:
+        """
+        The absolute character offset of the reading position.
+        """
+        return self.consumed + self.pos
+
+    @property
+    def line(self) -> int:
+        """
+        The line number (starting from 1) of the reading position.
+        """
+        if self._counted < self.pos:
+            self._lines += self.buffer.count('\n', self._counted, self.pos)
+            self._counted = self.pos
+        return self.consumed_lines + self._lines + 1
+
+    def _fill(self, size: int) -> bool:
+        if self.eof:
+            return False
+        if self.pos:
+            self.consumed_lines = self.line - 1
+            self.consumed += self.pos
+            self.buffer = self.buffer[self.pos:]
+            self.pos = self._counted = self._lines = 0
+        while True:
+            chunk = self.fp.read(size)
+            if isinstance(chunk, (bytes, bytearray)):
+                text = self._text_decoder.decode(chunk, final=not chunk)
+            else:
+                text = chunk
+            if text:
+                self.buffer += text
+                return True
+            if not chunk:
+                self.eof = True
+                return False
+
+    def error(self, message: str) -> StreamDecodeError:
+        """
+        Builds a StreamDecodeError located at the reading position.
+        """
+        error = json.JSONDecodeError(message, self.buffer, self.pos)
+        return StreamDecodeError(self.line, self.offset, error)
+
+    def peek(self) -> str:
+        """
+        Skips whitespace and returns the next character without consuming it, '' at the end of input.
+        """
+        while True:
+            buffer, pos = self.buffer, self.pos
+            while pos < len(buffer) and buffer[pos] in _WHITESPACE:
+                pos += 1
+            self.pos = pos
+            if pos < len(buffer):
+                return buffer[pos]
+            if not self._fill(self.chunk_size):
+                return ''
+
+    def expect(self, char: str) -> None:
+        """
+        Consumes the next non-whitespace character, which must be `char`.
+
+        :raises StreamDecodeError: If another character (or the end of input) is found.
+        """
+        if self.peek() != char:
+            raise self.error(f"Expecting '{char}'")
+        self.pos += 1
+
+    def _is_truncated(self, error: json.JSONDecodeError) -> bool:
+        # a value cut by the end of the buffer fails near the end (a keyword, an escape or a missing
+        # delimiter) or as an unterminated string; anything else is a syntax error worth reporting
+        # without reading the rest of the input
+        return (error.pos >= len(self.buffer) - _TRUNCATION_MARGIN or
+                error.msg.startswith('Unterminated string'))
+
+    def decode_value(self) -> Tuple[Any, int, int]:
+        """
+        Decodes the next JSON value.
+
+        :return: The value, and the line and offset where it starts.
+        :raises StreamDecodeError: If the input does not hold a valid JSON value.
+        """
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError as e:
+                if self._is_truncated(e) and self._fill(max(self.chunk_size, len(self.buffer))):
+                    continue
+                raise StreamDecodeError(self.line, self.offset, e) from e
+            # a number can be cut by the end of the buffer, read on before accepting it
+            if end == len(self.buffer) and self._fill(self.chunk_size):
+                continue
+            line, offset = self.line, self.offset
+            self.pos = end
+            return value, line, offset
+
+    def iter_array(self) -> Iterator[Tuple[Any, int, int]]:
+        """
+        Decodes the elements of the JSON array starting at the reading position, one at a time.
+
+        :return: A generator of (value, line, offset) tuples.
+        :raises StreamDecodeError: If the input is not a well formed array.
+        """
+        self.expect('[')
+        if self.peek() == ']':
+            self.pos += 1
+            return
+        while True:
+            yield self.decode_value()
+            char = self.peek()
+            if char == ']':
+                self.pos += 1
+                return
+            if char != ',':
+                raise self.error("Expecting ',' delimiter")
+            self.pos += 1
+
+
+def iter_json_array(decode: Decoder, source: Source, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[Any]:
+    """
+    Decodes a document whose top-level value is a JSON array, one element at a time.
+
+    The document is read in chunks of `chunk_size` characters (or bytes), so memory is bounded by
+    the size of the largest element rather than by the size of the document.
+
+    :param decode: The decoder turning one JSON object into a dataclass instance.
+    :param source: A path or a file object.
+    :param chunk_size: The number of characters (or bytes) read at a time.
+    :return: A generator of decoded instances.
+    :raises StreamDecodeError: If the document is not a valid JSON array or an element does not
+                               match the dataclass.
+    """
+    with open_source(source) as fp:
+        reader = JsonStreamReader(fp, chunk_size)
+        for value, line, offset in reader.iter_array():
+            try:
+                yield decode(value)
+            except _RECORD_ERRORS as e:
+                raise StreamDecodeError(line, offset, e) from e
+        if reader.peek():
+            raise reader.error("Extra data")
+
+
+def iter_object_field(decode_item: Callable[[Any], Any], validate_member: Callable[[str, Any], Any],
+                      missing_members: Callable[[Set[str]], Iterable[Any]], source: Source, field: str,
+                      chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[Any]:
+    """
+    Decodes the elements of the array held by one field of a top-level JSON object, one at a time.
+
+    The object is scanned key by key: the values of the other members are decoded one at a time,
+    validated and discarded, and the array of the requested field is streamed element by element.
+    The object is read up to its end, and nothing but whitespace may follow it.
+
+    :param decode_item: The decoder of one element of the array.
+    :param validate_member: Called with the name and value of every other member of the object, and
+                            of the field when it does not hold an array; raises if the value is invalid.
+    :param missing_members: Called at the end of the object with the names of its members; raises for
+                            a missing required member and returns the elements to yield in place of
+                            the array when the object does not hold the field (those of a default).
+    :param source: A path or a file object.
+    :param field: The name of the field holding the array.
+    :param chunk_size: The number of characters (or bytes) read at a time.
+    :return: A generator of decoded elements.
+    :raises StreamDecodeError: If the document is malformed, or an element or another member is invalid.
+    """
+    with open_source(source) as fp:
+        reader = JsonStreamReader(fp, chunk_size)
+        reader.expect('{')
+        seen = set()
+        if reader.peek() == '}':
+            reader.pos += 1
+        else:
+            while True:
+                if reader.peek() != '"':
+                    raise reader.error("Expecting property name enclosed in double quotes")
+                key, _, _ = reader.decode_value()
+                reader.expect(':')
+                if key == field and key not in seen and reader.peek() == '[':
+                    for value, line, offset in reader.iter_array():
+                        try:
+                            yield decode_item(value)
+                        except _RECORD_ERRORS as e:
+                            raise StreamDecodeError(line, offset, e) from e
+                else:
+                    value, line, offset = reader.decode_value()
+                    try:
+                        validate_member(key, value)
+                    except _RECORD_ERRORS as e:
+                        raise StreamDecodeError(line, offset, e) from e
+                seen.add(key)
+                char = reader.peek()
+                if char == '}':
+                    reader.pos += 1
+                    break
+                if char != ',':
+                    raise reader.error("Expecting ',' delimiter")
+                reader.pos += 1
+        if reader.peek():
+            raise reader.error("Extra data")
+        yield from missing_members(seen)
@@ -0,0 +1,229 @@
+import json
+import mmap
+import os
+from typing import Any, Callable, Dict, List, Optional, Union
+
+
+JsonInput = Union[str, bytes, bytearray, memoryview]
+
+BACKEND_ENVIRON = 'OBJECT_SERIALIZER_JSON_BACKEND'
+"""
+Environment variable selecting the default backend at import time (json, orjson, ujson or msgspec).
+
+Without it the default is the standard library whatever is installed, as the other libraries accept
+different documents: orjson, for instance, rejects NaN and Infinity and reads integers wider than 64
+bits as floats.
+"""
+
+
+class JsonBackend:
+    """
+    A JSON implementation the library parses and emits JSON with.
+
+    Every backend accepts str, bytes, bytearray and memoryview input, handing binary input to the
+    underlying library without decoding it to str when the library supports it, and reports invalid
+    documents as `json.JSONDecodeError` whatever library is used. Files are parsed from a memory map
+    of their content, see `load_path`.
+    """
+    name = 'json'
+
+    def loads(self, data: JsonInput) -> Any:
+        """
+        Parses a JSON document.
+
+        :param data: The document, as str or bytes-like object.
+        :return: The parsed value.
+        :raises json.JSONDecodeError: If the document is not valid JSON.
+        """
+        try:
+            if isinstance(data, memoryview):
+                # decoded straight from the buffer, json.loads only takes bytes it would decode the same way
+                data = str(data, json.detect_encoding(bytes(data[:4])), 'surrogatepass')
+            return json.loads(data)
+        except UnicodeDecodeError as e:
+            raise _decode_error(e) from e
+
+    def load_path(self, path: 'os.PathLike[str]') -> Any:
+        """
+        Parses the JSON document of a file.
+
+        The file is memory-mapped and its content handed to `loads` as a memoryview, so it is not
+        read into a bytes copy first; with a backend parsing buffers directly (orjson, msgspec) the
+        document is parsed in place.
+
+        :param path: The path of the file.
+        :return: The parsed value.
+        :raises json.JSONDecodeError: If the document is not valid JSON.
+        :raises OSError: If the file cannot be opened.
+        """
+        with open(path, 'rb') as file:
+            try:
+                mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # empty files cannot be mapped
+                return self.loads(file.read())
+            with mapped, memoryview(mapped) as view:
+                return self.loads(view)
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        """
+        Serializes a JSON-compatible value to a JSON string.
+
+        :param obj: The value to serialize.
+        :param kwargs: Options of `json.dumps`; backends that cannot honor them use the standard library.
+        :return: The JSON string.
+        """
+        return json.dumps(obj, **kwargs)
+
+    def __repr__(self) -> str:
+        return f"<JsonBackend {self.name}>"
+
+
+def _decode_error(error: Exception) -> json.JSONDecodeError:
+    return json.JSONDecodeError(str(error), '', 0)
+
+
+class OrjsonBackend(JsonBackend):
+    name = 'orjson'
+
+    def __init__(self):
+        import orjson
+        self._orjson = orjson
+        self._loads = orjson.loads
+
+    def loads(self, data: JsonInput) -> Any:
+        # orjson.JSONDecodeError already subclasses json.JSONDecodeError
+        return self._loads(data)
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        indent = kwargs.get('indent')
+        if indent not in (None, 2) or not set(kwargs) <= {'indent', 'sort_keys'}:
+            return json.dumps(obj, **kwargs)
+        option = 0
+        if kwargs.get('sort_keys'):
+            option |= self._orjson.OPT_SORT_KEYS
+        if indent == 2:
+            option |= self._orjson.OPT_INDENT_2
+        try:
+            return self._orjson.dumps(obj, option=option).decode('utf-8')
+        except self._orjson.JSONEncodeError:
+            # e.g. integers wider than 64 bits, which the standard library supports
+            return json.dumps(obj, **kwargs)
+
+
+class UjsonBackend(JsonBackend):
+    name = 'ujson'
+
+    def __init__(self):
+        import ujson
+        self._ujson = ujson
+
+    def loads(self, data: JsonInput) -> Any:
+        if isinstance(data, (bytearray, memoryview)):
+            data = bytes(data)
+        try:
+            return self._ujson.loads(data)
+        except ValueError as e:
+            raise _decode_error(e) from e
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        if kwargs:
+            return json.dumps(obj, **kwargs)
+        return self._ujson.dumps(obj, ensure_ascii=False)
+
+
+class MsgspecBackend(JsonBackend):
+    name = 'msgspec'
+
+    def __init__(self):
+        import msgspec
+        self._decode = msgspec.json.decode
+        self._encode = msgspec.json.encode
+        self._error = msgspec.DecodeError
+
+    def loads(self, data: JsonInput) -> Any:
+        try:
+            return self._decode(data)
+        except self._error as e:
+            raise _decode_error(e) from e
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        if kwargs:
+            return json.dumps(obj, **kwargs)
+        return self._encode(obj).decode('utf-8')
+
+
+_FACTORIES: Dict[str, Callable[[], JsonBackend]] = {
+    'json': JsonBackend,
+    'orjson': OrjsonBackend,
+    'ujson': UjsonBackend,
+    'msgspec': MsgspecBackend,
+}
+_backends: Dict[str, JsonBackend] = {}
+
+
+def _load_backend(name: str) -> Optional[JsonBackend]:
+    backend = _backends.get(name)
+    if backend is None:
+        factory = _FACTORIES.get(name)
+        if factory is None:
+            raise ValueError(f"Unknown JSON backend '{name}', expected one of {', '.join(_FACTORIES)}")
+        try:
+            backend = _backends[name] = factory()
+        except ImportError:
+            return None
+    return backend
+
+
+def available_backends() -> List[str]:
+    """
+    Lists the names of the backends whose library is installed.
+    """
+    return [name for name in _FACTORIES if _load_backend(name) is not None]
+
+
+def set_default_backend(name: str) -> JsonBackend:
+    """
+    Selects the backend used when no backend is given to a call.
+
+    :param name: The backend name: json, orjson, ujson or msgspec.
+    :return: The selected backend.
+    :raises ValueError: If the name is unknown or its library is not installed.
+    """
+    global _default_backend
+    backend = _load_backend(name)
+    if backend is None:
+        raise ValueError(f"JSON backend '{name}' is not installed")
+    _default_backend = backend
+    return backend
+
+
+def get_backend(backend: Union[str, JsonBackend, None] = None) -> JsonBackend:
+    """
+    Resolves the backend of a call.
+
+    :param backend: A backend name, a JsonBackend instance or None for the default backend.
+    :return: The backend.
+    :raises ValueError: If the name is unknown or its library is not installed.
+    """
+    if backend is None:
+        return _default_backend
+    if isinstance(backend, JsonBackend):
+        return backend
+    resolved = _load_backend(backend)
+    if resolved is None:
+        raise ValueError(f"JSON backend '{backend}' is not installed")
+    return resolved
+
+
+def _initial_backend() -> JsonBackend:
+    name = os.environ.get(BACKEND_ENVIRON)
+    if name:
+        backend = _load_backend(name)
+        if backend is None:
+            raise ValueError(f"JSON backend '{name}' selected by {BACKEND_ENVIRON} is not installed")
+        return backend
+    return _load_backend('json')
+
+
+_default_backend = _initial_backend()
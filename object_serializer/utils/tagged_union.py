@@ -0,0 +1,99 @@
+from dataclasses import MISSING, is_dataclass
+from typing import Any, Dict, Iterable, Mapping, Optional, Tuple, Union
+
+from object_serializer.exceptions import NotADataclassError
+
+
+def _default_tag(cls: Any, tag: str) -> Any:
+    field = getattr(cls, '__dataclass_fields__', {}).get(tag)
+    if field is None or field.default is MISSING:
+        raise ValueError(f"Class {cls.__name__} has no default value for its tag field '{tag}'")
+    return field.default
+
+
+class TaggedUnion:
+    """
+    A union of dataclasses discriminated by a tag field of the JSON object, such as the "type" of
+    the events of a stream.
+
+    The tag values are mapped to the dataclasses either explicitly,
+    `TaggedUnion('type', {'click': Click, 'view': View})`, or through the default value of the tag
+    field declared by each dataclass, `TaggedUnion('type', [Click, View])`. The union is used as a
+    field annotation (`events: List[Event]`) or passed instead of a dataclass to `validate_and_parse`,
+    `validate_and_parse_many`, `compile` and the streaming functions: the dataclass of an object is
+    looked up by its tag in a dictionary and the object goes straight to its compiled plan.
+
+    Two unions with the same tag field and members are equal and share their compiled plans.
+
+    :param tag: The name of the tag field.
+    :param members: A mapping of tag values to dataclasses, or the dataclasses themselves.
+    :param name: The name of the union in error messages, "TaggedUnion" by default.
+    :raises NotADataclassError: If a member is not a dataclass.
+    :raises ValueError: If two members have the same tag value, or a member given without its tag
+                        value has no default value for its tag field.
+    """
+    def __init__(self, tag: str, members: Union[Mapping[Any, type], Iterable[type]], name: Optional[str] = None):
+        if isinstance(members, Mapping):
+            items = list(members.items())
+        else:
+            items = [(_default_tag(cls, tag), cls) for cls in members]
+        classes: Dict[Any, type] = {}
+        for value, cls in items:
+            if not is_dataclass(cls) or not isinstance(cls, type):
+                raise NotADataclassError(cls if isinstance(cls, type) else type(cls))
+            if value in classes:
+                raise ValueError(f"Tag value {value!r} is used by both {classes[value].__name__} and {cls.__name__}")
+            classes[value] = cls
+        self.tag = tag
+        self.members = classes
+        # named like a class, for error messages, statistics and generated decoders
+        self.__name__ = self.__qualname__ = name or 'TaggedUnion'
+
+    @property
+    def tags(self) -> Tuple[Any, ...]:
+        """
+        The tag values, in declaration order.
+        """
+        return tuple(self.members)
+
+    @property
+    def classes(self) -> Tuple[type, ...]:
+        """
+        The member dataclasses, in declaration order.
+        """
+        return tuple(self.members.values())
+
+    def tag_of(self, cls: type) -> Any:
+        """
+        Returns the tag value of a member dataclass.
+
+        :raises KeyError: If the class is not a member of the union.
+        """
+        for value, member in self.members.items():
+            if member is cls:
+                return value
+        raise KeyError(cls)
+
+    def __call__(self, data: Union[str, Dict[str, Any]]) -> Any:
+        """
+        Decodes a JSON string or dictionary into the member its tag selects, see
+        `Parser.validate_and_parse`. Being callable also lets typing accept the union as a type
+        argument (`List[Event]`) before Python 3.11.
+        """
+        from object_serializer.serializer.json_parser import Parser
+        return Parser.validate_and_parse(self, data)
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, TaggedUnion):
+            return NotImplemented
+        return self.tag == other.tag and list(self.members.items()) == list(other.members.items())
+
+    def __hash__(self) -> int:
+        return hash((self.tag, tuple(self.members.items())))
+
+    def __repr__(self) -> str:
+        members = ', '.join(f"{value!r}: {cls.__name__}" for value, cls in self.members.items())
+        return f"{self.__name__}({self.tag!r}, {{{members}}})"
+
+    def __reduce__(self):
+        return type(self), (self.tag, self.members, self.__name__)
@@ -0,0 +1,202 @@
+import threading
+import uuid
+from datetime import date, datetime, time
+from decimal import Decimal, InvalidOperation
+from enum import Enum
+from typing import Any, Callable, Dict, FrozenSet, NamedTuple, Optional
+
+
+Coercer = Callable[[Any, Any], Any]
+Encoder = Callable[[Any], Any]
+
+JSON_PRIMITIVE_TYPES: FrozenSet[type] = frozenset({str, int, float, bool, dict, list})
+"""The builtin types a JSON value is decoded to, accepted as-is for dataclass fields."""
+
+
+def _coerce_isoformat(tp: Any, value: Any) -> Any:
+    if isinstance(value, tp):
+        return value
+    if not isinstance(value, str):
+        raise TypeError(f"{tp.__name__} values must be ISO 8601 strings")
+    if value.endswith('Z') and tp is not date:
+        # fromisoformat() only understands the 'Z' suffix since Python 3.11
+        value = value[:-1] + '+00:00'
+    return tp.fromisoformat(value)
+
+
+def _coerce_decimal(tp: Any, value: Any) -> Any:
+    if isinstance(value, tp):
+        return value
+    if isinstance(value, bool) or not isinstance(value, (str, int, float)):
+        raise TypeError("Decimal values must be numbers or numeric strings")
+    try:
+        return tp(repr(value) if isinstance(value, float) else value)
+    except InvalidOperation as e:
+        raise ValueError(str(e)) from e
+
+
+def _coerce_uuid(tp: Any, value: Any) -> Any:
+    if isinstance(value, tp):
+        return value
+    if not isinstance(value, str):
+        raise TypeError("UUID values must be strings")
+    return tp(value)
+
+
+def _coerce_enum(tp: Any, value: Any) -> Any:
+    return tp(value)
+
+
+def _encode_isoformat(value: Any) -> str:
+    return value.isoformat()
+
+
+def _encode_enum(value: Any) -> Any:
+    return value.value
+
+
+class ScalarType(NamedTuple):
+    """
+    The conversions of a registered scalar type, from JSON (coercer) and back to JSON (encoder).
+    """
+    coercer: Coercer
+    encoder: Encoder
+
+
+class ScalarRegistry:
+    """
+    An extensible registry of the non-JSON scalar types a dataclass field can be annotated with.
+
+    Each scalar type is mapped to a coercer, a callable `coercer(tp, value)` that turns the JSON
+    value into an instance of `tp` (the annotated type), raising TypeError or ValueError when the
+    value cannot be converted, and to an encoder, a callable `encoder(value)` that turns an
+    instance back into a JSON value. A type registered here also covers its subclasses, which is
+    how a single entry for Enum supports every enumeration.
+    """
+    def __init__(self):
+        self._scalars: Dict[Any, ScalarType] = {}
+        self._lock = threading.Lock()
+
+    def register(self, tp: type, coercer: Coercer, encoder: Encoder = str) -> None:
+        """
+        Registers (or replaces) the conversions of a scalar type.
+
+        :param tp: The scalar type.
+        :param coercer: A callable `coercer(tp, value)` returning the converted value.
+        :param encoder: A callable `encoder(value)` returning the JSON value, `str` by default.
+        """
+        if not isinstance(tp, type):
+            raise TypeError(f"{tp!r} is not a class")
+        if tp in JSON_PRIMITIVE_TYPES:
+            raise ValueError(f"{tp.__name__} is a JSON primitive type and cannot be registered")
+        with self._lock:
+            scalars = dict(self._scalars)
+            scalars[tp] = ScalarType(coercer, encoder)
+            self._scalars = scalars
+
+    def unregister(self, tp: type) -> None:
+        """
+        Removes a scalar type from the registry.
+
+        :param tp: The scalar type.
+        :raises KeyError: If the type is not registered.
+        """
+        with self._lock:
+            scalars = dict(self._scalars)
+            del scalars[tp]
+            self._scalars = scalars
+
+    def get(self, tp: Any) -> Optional[ScalarType]:
+        """
+        Finds the conversions of a type, looking up its base classes when the type itself is not
+        registered.
+
+        :param tp: The annotated type.
+        :return: The ScalarType, or None if the type is not a registered scalar.
+        """
+        scalars = self._scalars
+        try:
+            scalar = scalars.get(tp)
+        except TypeError:
+            return None
+        if scalar is not None or not isinstance(tp, type):
+            return scalar
+        for base in tp.__mro__[1:]:
+            scalar = scalars.get(base)
+            if scalar is not None:
+                return scalar
+        return None
+
+    def get_coercer(self, tp: Any) -> Optional[Coercer]:
+        """
+        Finds the coercer of a type, see `get`.
+        """
+        scalar = self.get(tp)
+        return scalar.coercer if scalar is not None else None
+
+
+scalar_registry = ScalarRegistry()
+scalar_registry.register(datetime, _coerce_isoformat, _encode_isoformat)
+scalar_registry.register(date, _coerce_isoformat, _encode_isoformat)
+scalar_registry.register(time, _coerce_isoformat, _encode_isoformat)
+scalar_registry.register(Decimal, _coerce_decimal)
+scalar_registry.register(uuid.UUID, _coerce_uuid)
+scalar_registry.register(Enum, _coerce_enum, _encode_enum)
+
+
+def is_primitive_type(tp: Any) -> bool:
+    """
+    Checks if a type is one of the JSON primitive types.
+
+    :param tp: The type to be checked.
+    :return: True if the type is in JSON_PRIMITIVE_TYPES, False otherwise.
+    """
+    try:
+        return tp in JSON_PRIMITIVE_TYPES
+    except TypeError:
+        return False
+
+
+def is_scalar_type(tp: Any) -> bool:
+    """
+    Checks if a type is a registered scalar type (or a subclass of one).
+
+    :param tp: The type to be checked.
+    :return: True if the type has a coercer, False otherwise.
+    """
+    return scalar_registry.get_coercer(tp) is not None
+
+
+def get_scalar_coercer(tp: Any) -> Optional[Coercer]:
+    """
+    Returns the coercer of a registered scalar type, or None.
+    """
+    return scalar_registry.get_coercer(tp)
+
+
+def get_scalar_type(tp: Any) -> Optional[ScalarType]:
+    """
+    Returns the coercer and encoder of a registered scalar type, or None.
+    """
+    return scalar_registry.get(tp)
+
+
+def register_scalar(tp: type, coercer: Coercer, encoder: Encoder = str) -> None:
+    """
+    Registers a custom scalar type, e.g. `register_scalar(Path, lambda tp, value: tp(value))`.
+
+    Plans already compiled for dataclasses using the type are not updated: register scalars before
+    parsing, or call `Parser.clear_plan_cache()` afterwards.
+
+    :param tp: The scalar type.
+    :param coercer: A callable `coercer(tp, value)` returning the converted value.
+    :param encoder: A callable `encoder(value)` returning the JSON value, `str` by default.
+    """
+    scalar_registry.register(tp, coercer, encoder)
+
+
+def unregister_scalar(tp: type) -> None:
+    """
+    Removes a custom scalar type from the registry.
+    """
+    scalar_registry.unregister(tp)
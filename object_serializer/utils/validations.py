@@ -1,8 +1,15 @@
-import builtins
 import json
+import sys
+import types
 from dataclasses import is_dataclass
-from typing import Any, get_origin, List, get_args, Union, Optional, Dict
+from typing import Any, get_origin, List, get_args, Union, Optional, Dict, Tuple, Set, FrozenSet
 from object_serializer.exceptions import InvalidDataTypeError
+from object_serializer.utils.type_registry import is_primitive_type, is_scalar_type
+from object_serializer.utils.tagged_union import TaggedUnion
+from object_serializer.utils.json_backend import JsonBackend, JsonInput, get_backend
+
+# the origins of a Union: typing.Union and, from Python 3.10, the PEP 604 unions (int | str, X | None)
+UNION_ORIGINS = (Union, types.UnionType) if sys.version_info >= (3, 10) else (Union,)
 
 class Validator:
     """
@@ -12,14 +19,16 @@ class Validator:
     types such as lists and optionals. If a type is not valid, an InvalidDataTypeError is raised.
     """
     @staticmethod
-    def validate_json(data: str) -> bool:
+    def validate_json(data: JsonInput, backend: Union[str, JsonBackend, None] = None) -> bool:
         """
         Validates if a given string is a valid JSON.
 
-        This function attempts to parse a JSON string. If successful, it returns True.
-        If the string cannot be parsed, it returns False.
+        This function attempts to parse a JSON string with the selected JSON backend. If successful, it
+        returns True. If the string cannot be parsed, it returns False. When the parsed value is needed
+        afterwards, call `Parser.parse_json` directly instead of validating first.
 
-        :param data: The string to be validated as JSON.
+        :param data: The string (or bytes-like object) to be validated as JSON.
+        :param backend: The JSON backend name or instance, by default the default backend.
         :return: True if the string is valid JSON, False otherwise.
         :raises TypeError: If the data is None.
         """
@@ -27,34 +36,11 @@ class Validator:
             raise TypeError('data must not be None')
 
         try:
-            json.loads(data)
+            get_backend(backend).loads(data)
             return True
         except json.JSONDecodeError:
             return False
 
-    # @staticmethod
-    # def validate_datatype(cls: Any) -> bool:
-    #     if is_dataclass(cls):
-    #         return True
-    #
-    #     if cls in vars(builtins).values():
-    #         return True
-    #
-    #     origin = get_origin(cls)
-    #     if origin is list or origin is List:
-    #         args = get_args(cls)
-    #         if args:
-    #             return Validator.validate_datatype(args[0])
-    #         return True
-    #
-    #     if origin is Union and type(None) in get_args(cls):
-    #         arg = [arg for arg in get_args(cls) if arg is not type(None)]
-    #         if arg in vars(builtins).values() or arg is list or arg is List:
-    #             return True
-    #         else
-    #
-    #     raise NotADataclassError(cls)
-
     @staticmethod
     def validate_dataclass(cls: Any) -> bool:
         """
@@ -73,7 +59,7 @@ class Validator:
         Validates if a given type is a valid list type.
 
         This function checks if the provided type is a list and validates its contents. It recursively
-        verifies whether the inner type of the list is valid (primitives, lists, optionals, or dataclasses).
+        verifies whether the inner type of the list is valid (primitives, registered scalars, lists, optionals, or dataclasses).
 
         :param cls: The type to be checked, which is expected to be a list.
         :return: True if the type is a valid list type.
@@ -83,16 +69,7 @@ class Validator:
             args = get_args(cls)
             if  not args:
                 raise InvalidDataTypeError(cls, f"Class {cls} has none valid args")
-            arg = args[0]
-            if arg in vars(builtins).values():
-                return True
-            if Validator.is_lst(arg):
-                return Validator.validate_clslist(arg)
-            if Validator.is_optional(arg):
-                return Validator.validate_clsoptional(arg)
-            if Validator.validate_dataclass(arg):
-                return True
-            raise InvalidDataTypeError(arg, f"Class {arg} has not a valid datatype")
+            return Validator.validate_type(args[0])
         raise InvalidDataTypeError(cls, f"Class {cls} is not a List class")
 
     @staticmethod
@@ -101,7 +78,7 @@ class Validator:
         Validates if a given type is a valid Optional type.
 
         This function checks if the provided type is an Optional and validates its contents. It recursively
-        verifies whether the inner type of the Optional is valid (primitives, lists, optionals, or dataclasses).
+        verifies whether the inner type of the Optional is valid (primitives, registered scalars, lists, optionals, or dataclasses).
 
         :param cls: The type to be checked, which is expected to be an Optional.
         :return: True if the type is a valid Optional type.
@@ -111,18 +88,118 @@ class Validator:
             args = [arg for arg in get_args(cls) if arg is not type(None)]
             if not args:
                 raise InvalidDataTypeError(cls, f"Class {cls} has none valid args")
+            if len(args) > 1:
+                # Optional[Union[A, B]] is flattened by typing into Union[A, B, None]
+                return all(Validator.validate_type(arg) for arg in args)
             arg = args[0]
-            if arg in vars(builtins).values():
-                return True
-            if Validator.is_lst(arg):
-                return Validator.validate_clslist(arg)
             if Validator.is_optional(arg):
                 raise InvalidDataTypeError(arg, "Optional type cannot contain another optional type")
-            if Validator.validate_dataclass(arg):
-                return True
-            raise InvalidDataTypeError(arg, f"Class {arg} has not a valid datatype")
+            return Validator.validate_type(arg)
         raise InvalidDataTypeError(cls, f"Class {cls} is not a List class")
 
+    @staticmethod
+    def validate_clsdict(cls: Dict[str, Any]) -> bool:
+        """
+        Validates if a given type is a valid Dict type: a JSON object with string keys whose values
+        all have the same valid type.
+
+        :param cls: The type to be checked, which is expected to be a Dict[str, T].
+        :return: True if the type is a valid Dict type.
+        :raises InvalidDataTypeError: If the type is not a valid Dict, if its keys are not strings or if
+                                      the value type is not valid.
+        """
+        if Validator.is_dict(cls):
+            args = get_args(cls)
+            if len(args) != 2:
+                raise InvalidDataTypeError(cls, f"Class {cls} has none valid args")
+            if args[0] is not str:
+                raise InvalidDataTypeError(cls, f"Class {cls} must have str keys, JSON object keys are strings")
+            return Validator.validate_type(args[1])
+        raise InvalidDataTypeError(cls, f"Class {cls} is not a Dict class")
+
+    @staticmethod
+    def validate_clstuple(cls: Tuple[Any, ...]) -> bool:
+        """
+        Validates if a given type is a valid Tuple type, either of fixed length (`Tuple[int, str]`) or
+        variadic (`Tuple[int, ...]`), decoded from a JSON list.
+
+        :param cls: The type to be checked, which is expected to be a Tuple.
+        :return: True if the type is a valid Tuple type.
+        :raises InvalidDataTypeError: If the type is not a valid Tuple or if an item type is not valid.
+        """
+        if Validator.is_tuple(cls):
+            args = get_args(cls)
+            if not args or args == ((),):
+                raise InvalidDataTypeError(cls, f"Class {cls} has none valid args")
+            if len(args) == 2 and args[1] is Ellipsis:
+                args = args[:1]
+            return all(Validator.validate_type(arg) for arg in args)
+        raise InvalidDataTypeError(cls, f"Class {cls} is not a Tuple class")
+
+    @staticmethod
+    def validate_clsset(cls: Set[Any]) -> bool:
+        """
+        Validates if a given type is a valid Set (or FrozenSet) type, decoded from a JSON list. The items
+        must be hashable: JSON primitives other than dict and list, registered scalars or tuples of them.
+
+        :param cls: The type to be checked, which is expected to be a Set.
+        :return: True if the type is a valid Set type.
+        :raises InvalidDataTypeError: If the type is not a valid Set or if the item type is not hashable.
+        """
+        if Validator.is_set(cls):
+            args = get_args(cls)
+            if not args:
+                raise InvalidDataTypeError(cls, f"Class {cls} has none valid args")
+            arg = args[0]
+            if arg is dict or arg is list or not (is_primitive_type(arg) or is_scalar_type(arg)
+                                                  or Validator.is_tuple(arg)):
+                raise InvalidDataTypeError(arg, f"Class {arg} is not a valid set item datatype")
+            return Validator.validate_type(arg)
+        raise InvalidDataTypeError(cls, f"Class {cls} is not a Set class")
+
+    @staticmethod
+    def validate_clsunion(cls: Any) -> bool:
+        """
+        Validates if a given type is a valid Union type whose members are all valid types.
+
+        :param cls: The type to be checked, which is expected to be a Union.
+        :return: True if the type is a valid Union type.
+        :raises InvalidDataTypeError: If the type is not a Union or if a member type is not valid.
+        """
+        if Validator.is_optional(cls):
+            return Validator.validate_clsoptional(cls)
+        if Validator.is_union(cls):
+            return all(Validator.validate_type(arg) for arg in get_args(cls))
+        raise InvalidDataTypeError(cls, f"Class {cls} is not a Union class")
+
+    @staticmethod
+    def validate_type(cls: Any) -> bool:
+        """
+        Validates if a given type is a valid field type: a JSON primitive, a registered scalar, a
+        dataclass, a TaggedUnion, or a List, Optional, Dict, Tuple, Set or Union of valid types.
+
+        :param cls: The type to be checked.
+        :return: True if the type is valid.
+        :raises InvalidDataTypeError: If the type is not valid.
+        """
+        if is_primitive_type(cls) or is_scalar_type(cls) or Validator.validate_dataclass(cls):
+            return True
+        if Validator.is_tagged_union(cls):
+            return True
+        if Validator.is_lst(cls):
+            return Validator.validate_clslist(cls)
+        if Validator.is_optional(cls):
+            return Validator.validate_clsoptional(cls)
+        if Validator.is_dict(cls):
+            return Validator.validate_clsdict(cls)
+        if Validator.is_tuple(cls):
+            return Validator.validate_clstuple(cls)
+        if Validator.is_set(cls):
+            return Validator.validate_clsset(cls)
+        if Validator.is_union(cls):
+            return Validator.validate_clsunion(cls)
+        raise InvalidDataTypeError(cls, f"Class {cls} has not a valid datatype")
+
     @staticmethod
     def is_lst(cls: Any) -> bool:
         """
@@ -141,16 +218,63 @@ class Validator:
         """
         Checks if a given type is an Optional.
 
-        This function checks if the provided type has an origin of Union and contains a None type,
-        indicating it is an Optional.
+        This function checks if the provided type has an origin of Union (or is a PEP 604 union) and
+        contains a None type, indicating it is an Optional.
 
         :param cls: The type to be checked.
         :return: True if the type is an Optional, False otherwise.
         """
-        origin = get_origin(cls)
-        return origin is Union and type(None) in get_args(cls)
+        return get_origin(cls) in UNION_ORIGINS and type(None) in get_args(cls)
 
     @staticmethod
     def is_dict(cls: Any) -> bool:
+        """
+        Checks if a given type is a Dict.
+
+        :param cls: The type to be checked.
+        :return: True if the type is a Dict, False otherwise.
+        """
         origin = get_origin(cls)
         return origin is Dict or origin is dict
+
+    @staticmethod
+    def is_tuple(cls: Any) -> bool:
+        """
+        Checks if a given type is a Tuple.
+
+        :param cls: The type to be checked.
+        :return: True if the type is a Tuple, False otherwise.
+        """
+        origin = get_origin(cls)
+        return origin is Tuple or origin is tuple
+
+    @staticmethod
+    def is_set(cls: Any) -> bool:
+        """
+        Checks if a given type is a Set or a FrozenSet.
+
+        :param cls: The type to be checked.
+        :return: True if the type is a Set or a FrozenSet, False otherwise.
+        """
+        origin = get_origin(cls)
+        return origin is set or origin is frozenset or origin is Set or origin is FrozenSet
+
+    @staticmethod
+    def is_union(cls: Any) -> bool:
+        """
+        Checks if a given type is a Union (or a PEP 604 union) that is not an Optional.
+
+        :param cls: The type to be checked.
+        :return: True if the type is a Union without None, False otherwise.
+        """
+        return get_origin(cls) in UNION_ORIGINS and type(None) not in get_args(cls)
+
+    @staticmethod
+    def is_tagged_union(cls: Any) -> bool:
+        """
+        Checks if a given type is a TaggedUnion.
+
+        :param cls: The type to be checked.
+        :return: True if the type is a TaggedUnion, False otherwise.
+        """
+        return isinstance(cls, TaggedUnion)
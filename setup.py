@@ -3,9 +3,15 @@ from setuptools import setup, find_packages
 setup(
     name="object-serializer",
     version="0.1.0",
-    packages=find_packages(exclude=("test*", "examples*")),
+    packages=find_packages(exclude=("test*", "examples*", "benchmarks*")),
     include_package_data=True,
     python_requires='>=3.7',
+    extras_require={
+        "orjson": ["orjson"],
+        "ujson": ["ujson"],
+        "msgspec": ["msgspec"],
+        "numpy": ["numpy"],
+    },
     classifiers=[
         "Programming Language :: Python :: 3.7",
         "Programming Language :: Python :: 3.8",
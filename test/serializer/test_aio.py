@@ -0,0 +1,114 @@
+import asyncio
+import json
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import List, Optional
+
+from object_serializer.exceptions import StreamDecodeError, TypeValueMismatchError
+from object_serializer.serializer.json_parser import Parser
+
+
+@dataclass
+class Review:
+    rating: int
+    comment: str
+
+
+@dataclass
+class Event:
+    id: int
+    name: str
+    reviews: List[Review]
+    note: Optional[str]
+
+
+def event(index):
+    return {'id': index, 'name': f"événement {index}", 'reviews': [{'rating': 1, 'comment': 'ok'}], 'note': None}
+
+
+async def byte_stream(data, size):
+    for start in range(0, len(data), size):
+        await asyncio.sleep(0)
+        yield data[start:start + size]
+
+
+async def collect(iterator):
+    return [value async for value in iterator]
+
+
+class TestAio(unittest.TestCase):
+    test_case_ids = {
+        "test_avalidate_and_parse": "TCL_01",
+        "test_avalidate_and_parse_error": "TCL_02",
+        "test_avalidate_and_parse_many": "TCL_03",
+        "test_avalidate_and_parse_many_errors": "TCL_04",
+        "test_aiter_ndjson": "TCL_05",
+        "test_aiter_ndjson_error": "TCL_06",
+        "test_aiter_ndjson_yields_control": "TCL_07"
+    }
+
+    def test_avalidate_and_parse(self):
+        result = asyncio.run(Parser.avalidate_and_parse(Event, json.dumps(event(1))))
+        self.assertEqual(result, Parser.validate_and_parse(Event, event(1)))
+
+    def test_avalidate_and_parse_error(self):
+        async def main():
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                await Parser.avalidate_and_parse(Event, dict(event(1), id='one'), executor=executor)
+
+        with self.assertRaises(TypeValueMismatchError):
+            asyncio.run(main())
+
+    def test_avalidate_and_parse_many(self):
+        records = [event(i) for i in range(25)]
+        result = asyncio.run(Parser.avalidate_and_parse_many(Event, records, chunk_size=4))
+
+        self.assertTrue(result.ok)
+        self.assertEqual([value.id for value in result.values], list(range(25)))
+
+    def test_avalidate_and_parse_many_errors(self):
+        records = [event(i) if i % 7 else dict(event(i), id=None) for i in range(25)]
+        result = asyncio.run(Parser.avalidate_and_parse_many(Event, records, fail_fast=False, chunk_size=4))
+
+        self.assertEqual([error.index for error in result.errors], [0, 7, 14, 21])
+        self.assertEqual(len(result.values), 21)
+
+    def test_aiter_ndjson(self):
+        data = ''.join(json.dumps(event(i), ensure_ascii=False) + '\n' for i in range(20)).encode('utf-8')
+        result = asyncio.run(collect(Parser.aiter_ndjson(Event, byte_stream(data, 13))))
+
+        self.assertEqual([value.id for value in result], list(range(20)))
+        self.assertEqual(result[3].name, 'événement 3')
+
+    def test_aiter_ndjson_error(self):
+        lines = [json.dumps(event(0)), '', json.dumps(dict(event(2), reviews=[1]))]
+        data = '\n'.join(lines)
+
+        with self.assertRaises(StreamDecodeError) as context:
+            asyncio.run(collect(Parser.aiter_ndjson(Event, byte_stream(data, 10))))
+        self.assertEqual(context.exception.line, 3)
+        self.assertEqual(context.exception.offset, len(lines[0]) + 2)
+
+    def test_aiter_ndjson_yields_control(self):
+        async def single_chunk(data):
+            yield data
+
+        async def main():
+            ticks = 0
+
+            async def ticker():
+                nonlocal ticks
+                while True:
+                    ticks += 1
+                    await asyncio.sleep(0)
+
+            task = asyncio.ensure_future(ticker())
+            await asyncio.sleep(0)
+            data = b''.join(json.dumps(event(i)).encode('utf-8') + b'\n' for i in range(50))
+            async for _ in Parser.aiter_ndjson(Event, single_chunk(data), yield_every=10):
+                pass
+            task.cancel()
+            return ticks
+
+        self.assertGreaterEqual(asyncio.run(main()), 5)
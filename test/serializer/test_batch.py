@@ -0,0 +1,84 @@
+import json
+import unittest
+from dataclasses import dataclass
+from typing import List, Optional
+
+from object_serializer.exceptions import NotADataclassError, TypeValueMismatchError
+from object_serializer.serializer.json_parser import Parser
+
+
+@dataclass
+class Inner:
+    born_in: str
+    city_cap: int
+
+
+@dataclass
+class Person:
+    name: str
+    age: int
+    tags: List[str]
+    info: Optional[Inner]
+
+
+def person(index):
+    return {'name': f"name {index}", 'age': index, 'tags': ['a'], 'info': {'born_in': 'x', 'city_cap': index}}
+
+
+class TestBatch(unittest.TestCase):
+    test_case_ids = {
+        "test_many_dicts": "TCL_01",
+        "test_many_json_strings": "TCL_02",
+        "test_generator_input": "TCL_03",
+        "test_fail_fast": "TCL_04",
+        "test_collect_errors": "TCL_05",
+        "test_invalid_json_collected": "TCL_06",
+        "test_not_a_dataclass": "TCL_07"
+    }
+
+    def test_many_dicts(self):
+        result = Parser.validate_and_parse_many(Person, [person(i) for i in range(10)])
+
+        self.assertTrue(result.ok)
+        self.assertEqual([value.age for value in result.values], list(range(10)))
+        self.assertIsInstance(result.values[3].info, Inner)
+
+    def test_many_json_strings(self):
+        records = [json.dumps(person(i)) for i in range(3)]
+        result = Parser.validate_and_parse_many(Person, records)
+
+        self.assertEqual(result.values, [Parser.validate_and_parse(Person, record) for record in records])
+
+    def test_generator_input(self):
+        result = Parser.validate_and_parse_many(Person, (person(i) for i in range(5)))
+        self.assertEqual(len(result.values), 5)
+
+    def test_fail_fast(self):
+        records = [person(0), dict(person(1), age='one'), person(2)]
+        with self.assertRaises(TypeValueMismatchError):
+            Parser.validate_and_parse_many(Person, records)
+
+    def test_collect_errors(self):
+        records = [person(0), dict(person(1), age='one'), person(2), ['not', 'an', 'object'], person(4)]
+        result = Parser.validate_and_parse_many(Person, records, fail_fast=False)
+
+        self.assertFalse(result.ok)
+        self.assertEqual([value.age for value in result.values], [0, 2, 4])
+        self.assertEqual([error.index for error in result.errors], [1, 3])
+        self.assertEqual(result.errors[0].field_name, 'age')
+        self.assertIs(result.errors[0].expected, int)
+        self.assertIs(result.errors[0].actual, str)
+        self.assertIsInstance(result.errors[1].error, TypeValueMismatchError)
+
+    def test_invalid_json_collected(self):
+        records = [json.dumps(person(0)), '{"name": ', json.dumps(person(2))]
+        result = Parser.validate_and_parse_many(Person, records, fail_fast=False)
+
+        self.assertEqual(len(result.values), 2)
+        self.assertEqual(result.errors[0].index, 1)
+        self.assertIsInstance(result.errors[0].error, json.JSONDecodeError)
+        self.assertIsNone(result.errors[0].field_name)
+
+    def test_not_a_dataclass(self):
+        with self.assertRaises(NotADataclassError):
+            Parser.validate_and_parse_many(dict, [{}])
@@ -0,0 +1,116 @@
+import unittest
+from dataclasses import dataclass
+from typing import List, Optional
+
+from object_serializer.exceptions import NotADataclassError, TypeValueMismatchError
+from object_serializer.serializer.json_parser import Parser
+
+
+@dataclass
+class Review:
+    rating: int
+    comment: str
+
+
+@dataclass
+class Dimensions:
+    width: float
+    height: float
+
+
+@dataclass
+class Product:
+    id: int
+    price: float
+    tags: List[str]
+    dimensions: Dimensions
+    reviews: List[Review]
+    matrix: List[List[int]]
+    note: Optional[str]
+    related: Optional[List[Review]]
+
+
+def product_data():
+    return {
+        'id': 1,
+        'price': 10,
+        'tags': ['a', 'b'],
+        'dimensions': {'width': 1.5, 'height': 2},
+        'reviews': [{'rating': 5, 'comment': 'ok'}, {'rating': 3, 'comment': 'meh'}],
+        'matrix': [[1, 2], [3]],
+        'note': None,
+        'related': [{'rating': 1, 'comment': 'bad'}]
+    }
+
+
+class TestCodegen(unittest.TestCase):
+    test_case_ids = {
+        "test_compiled_matches_parser": "TCL_01",
+        "test_decoder_is_cached": "TCL_02",
+        "test_mismatch_in_field": "TCL_03",
+        "test_mismatch_in_list": "TCL_04",
+        "test_mismatch_in_optional": "TCL_05",
+        "test_mismatch_in_nested_object": "TCL_06",
+        "test_not_a_dataclass": "TCL_07",
+        "test_missing_optional": "TCL_08"
+    }
+
+    def assert_same_error(self, data):
+        with self.assertRaises(TypeValueMismatchError) as expected:
+            Parser.validate_and_parse(Product, data)
+        with self.assertRaises(TypeValueMismatchError) as actual:
+            Parser.compile(Product)(data)
+        self.assertEqual(str(actual.exception), str(expected.exception))
+        self.assertEqual(actual.exception.field_name, expected.exception.field_name)
+
+    def test_compiled_matches_parser(self):
+        decoder = Parser.compile(Product)
+        result = decoder(product_data())
+
+        self.assertEqual(result, Parser.validate_and_parse(Product, product_data()))
+        self.assertIsInstance(result.dimensions, Dimensions)
+        self.assertIsInstance(result.related[0], Review)
+
+    def test_decoder_is_cached(self):
+        self.assertIs(Parser.compile(Product), Parser.compile(Product))
+
+    def test_mismatch_in_field(self):
+        data = product_data()
+        data['id'] = 'abc'
+        self.assert_same_error(data)
+
+    def test_mismatch_in_list(self):
+        data = product_data()
+        data['matrix'] = [[1, 2], [3, 'x']]
+        self.assert_same_error(data)
+
+        data = product_data()
+        data['reviews'] = [{'rating': 5, 'comment': 'ok'}, 'not an object']
+        self.assert_same_error(data)
+
+    def test_mismatch_in_optional(self):
+        data = product_data()
+        data['note'] = 10
+        self.assert_same_error(data)
+
+    def test_mismatch_in_nested_object(self):
+        data = product_data()
+        data['dimensions'] = {'width': 'wide', 'height': 2}
+        self.assert_same_error(data)
+
+        data = product_data()
+        data['dimensions'] = []
+        self.assert_same_error(data)
+
+    def test_not_a_dataclass(self):
+        with self.assertRaises(NotADataclassError):
+            Parser.compile(str)
+
+    def test_missing_optional(self):
+        data = product_data()
+        del data['note']
+        del data['related']
+
+        result = Parser.compile(Product)(data)
+        self.assertIsNone(result.note)
+        self.assertIsNone(result.related)
@@ -0,0 +1,129 @@
+import io
+import json
+import unittest
+from array import array
+from dataclasses import dataclass
+from typing import List, Optional
+
+from object_serializer.exceptions import (InvalidDataTypeError, StreamDecodeError, TypeValueMismatchError,
+                                          UnresolvedAttributeError)
+from object_serializer.serializer.columnar import Columns
+from object_serializer.serializer.json_parser import Parser
+
+
+@dataclass
+class Author:
+    name: str
+
+
+@dataclass
+class Review:
+    rating: int
+    score: float
+    comment: str
+    verified: bool
+    author: Optional[Author]
+
+
+@dataclass
+class Product:
+    title: str
+    tags: List[str]
+    reviews: Optional[List[Review]]
+
+
+def review(index):
+    return {'rating': index % 5, 'score': index / 2, 'comment': f"c{index}", 'verified': index % 2 == 0,
+            'author': {'name': f"a{index}"} if index % 3 else None}
+
+
+class TestColumnar(unittest.TestCase):
+    test_case_ids = {
+        "test_validate_columns": "TCL_01",
+        "test_rows_match_instances": "TCL_02",
+        "test_numeric_columns": "TCL_03",
+        "test_column_errors": "TCL_04",
+        "test_ndjson_columns": "TCL_05",
+        "test_field_columns": "TCL_06",
+        "test_field_columns_errors": "TCL_07",
+        "test_numeric_columns_match_fields": "TCL_08"
+    }
+
+    def test_validate_columns(self):
+        columns = Parser.validate_columns(Review, [review(i) for i in range(4)])
+        self.assertIsInstance(columns, Columns)
+        self.assertEqual(len(columns), 4)
+        self.assertEqual(columns.names, ('rating', 'score', 'comment', 'verified', 'author'))
+        self.assertEqual(columns['rating'], [0, 1, 2, 3])
+        self.assertEqual(columns['score'], [0.0, 0.5, 1.0, 1.5])
+        self.assertEqual(columns['author'], [None, Author('a1'), Author('a2'), None])
+        self.assertIn('comment', columns)
+        self.assertEqual(len(Parser.validate_columns(Review, [])), 0)
+
+    def test_rows_match_instances(self):
+        records = [json.dumps(review(i)) for i in range(5)]
+        columns = Parser.validate_columns(Review, records)
+        expected = Parser.validate_and_parse_many(Review, records).values
+        self.assertEqual(list(columns.rows()), expected)
+        self.assertEqual(columns.row(3), expected[3])
+
+    def test_numeric_columns(self):
+        columns = Parser.validate_columns(Review, [review(i) for i in range(3)], numeric_lists='array')
+        self.assertEqual(columns['rating'], array('q', [0, 1, 2]))
+        self.assertEqual(columns['score'], array('d', [0.0, 0.5, 1.0]))
+        self.assertEqual(columns['verified'], [True, False, True])
+        self.assertEqual(columns.to_dict()['score'], [0.0, 0.5, 1.0])
+
+    def test_column_errors(self):
+        invalid = [
+            [review(0), dict(review(1), comment=1)],
+            [review(0), dict(review(1), rating="1")],
+            [review(0), dict(review(1), author={'name': 2})],
+            [review(0), ["not", "an", "object"]],
+        ]
+        for records in invalid:
+            with self.subTest(records=records):
+                with self.assertRaises(TypeValueMismatchError):
+                    Parser.validate_columns(Review, records)
+        with self.assertRaises(UnresolvedAttributeError):
+            Parser.validate_columns(Review, [review(0), {'rating': 1}])
+
+    def test_ndjson_columns(self):
+        source = io.StringIO(''.join(json.dumps(review(i)) + '\n' for i in range(6)))
+        columns = Parser.ndjson_columns(Review, source, numeric_lists='array')
+        self.assertEqual(len(columns), 6)
+        self.assertEqual(columns['comment'], [f"c{i}" for i in range(6)])
+        with self.assertRaises(StreamDecodeError) as context:
+            Parser.ndjson_columns(Review, io.StringIO(json.dumps(review(0)) + '\n[1]\n'))
+        self.assertEqual(context.exception.line, 2)
+
+    def test_field_columns(self):
+        document = {'title': "t", 'tags': ["a"], 'reviews': [review(i) for i in range(10)]}
+        columns = Parser.field_columns(Product, io.StringIO(json.dumps(document)), 'reviews', chunk_size=16)
+        self.assertEqual(list(columns.rows()), Parser.validate_and_parse(Product, document).reviews)
+        empty = Parser.field_columns(Product, io.StringIO('{"title": "t", "tags": [], "reviews": null}'), 'reviews')
+        self.assertEqual(len(empty), 0)
+        self.assertEqual(empty.names, ('rating', 'score', 'comment', 'verified', 'author'))
+
+    def test_field_columns_errors(self):
+        with self.assertRaises(InvalidDataTypeError):
+            Parser.field_columns(Product, io.StringIO('{}'), 'tags')
+        document = {'title': "t", 'tags': [], 'reviews': [review(0), 3]}
+        with self.assertRaises(StreamDecodeError):
+            Parser.field_columns(Product, io.StringIO(json.dumps(document)), 'reviews')
+
+    def test_numeric_columns_match_fields(self):
+        # an int field accepts floats and big ints, its array column must not reject them
+        records = [review(0), dict(review(1), rating=1.5), dict(review(2), rating=2 ** 70, score=2)]
+        expected = Parser.validate_and_parse_many(Review, records).values
+        for numeric_lists in (None, 'array'):
+            with self.subTest(numeric_lists=numeric_lists):
+                columns = Parser.validate_columns(Review, records, numeric_lists=numeric_lists)
+                self.assertEqual(columns['rating'], [0, 1.5, 2 ** 70])
+                self.assertEqual(list(columns.rows()), expected)
+        columns = Parser.validate_columns(Review, records, numeric_lists='array')
+        self.assertEqual(columns['score'], array('d', [0.0, 0.5, 2.0]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,170 @@
+import sys
+import unittest
+from dataclasses import FrozenInstanceError, dataclass, field, fields, is_dataclass
+from typing import List, Optional
+
+from object_serializer.exceptions import NotADataclassError, TypeValueMismatchError
+from object_serializer.serializer.dataclass_serializer import instance_factory, slotted_dataclass
+from object_serializer.serializer.json_parser import Parser
+
+
+@dataclass(frozen=True)
+class Point:
+    x: float
+    y: float
+
+
+@dataclass
+class Shape:
+    name: str
+    points: List[Point]
+    origin: Optional[Point]
+
+    def size(self) -> int:
+        return len(self.points)
+
+
+@dataclass
+class Checked:
+    value: int
+
+    def __post_init__(self):
+        if self.value < 0:
+            raise ValueError('negative')
+
+
+@dataclass
+class Custom:
+    value: int
+
+    def __init__(self, value):
+        self.value = value * 2
+
+
+class Labelled:
+    __slots__ = ()
+
+    def label(self) -> str:
+        return f"<{self.name}>"
+
+
+@dataclass
+class Base(Labelled):
+    name: str
+
+    def describe(self) -> str:
+        return f"base {self.name}"
+
+    @classmethod
+    def kind(cls) -> str:
+        return cls.__name__.lower()
+
+
+@dataclass
+class Sub(Base):
+    size: int
+
+    def describe(self) -> str:
+        return f"{super().describe()} of size {self.size}"
+
+    @classmethod
+    def kind(cls) -> str:
+        return f"{super().kind()} of a base"
+
+    @property
+    def title(self) -> str:
+        return super().label().upper()
+
+
+def shape_data():
+    return {'name': "s", 'points': [{'x': 1.0, 'y': 2.0}, {'x': 3, 'y': 4}], 'origin': None}
+
+
+class TestConstruction(unittest.TestCase):
+    test_case_ids = {
+        "test_positional_factory": "TCL_01",
+        "test_frozen_factory": "TCL_02",
+        "test_init_is_honored": "TCL_03",
+        "test_frozen_decoding": "TCL_04",
+        "test_slotted_mirror": "TCL_05",
+        "test_slotted_mirror_decoding": "TCL_06",
+        "test_native_slots": "TCL_07",
+        "test_slotted_mirror_bases": "TCL_08"
+    }
+
+    def test_positional_factory(self):
+        self.assertIs(instance_factory(Shape), Shape)
+        self.assertIs(instance_factory(Checked), Checked)
+
+    def test_frozen_factory(self):
+        point = instance_factory(Point)(1.0, 2.0)
+        self.assertEqual(point, Point(1.0, 2.0))
+        self.assertEqual(hash(point), hash(Point(1.0, 2.0)))
+        with self.assertRaises(FrozenInstanceError):
+            point.x = 3.0
+
+    def test_init_is_honored(self):
+        self.assertEqual(Parser.validate_and_parse(Custom, {'value': 2}).value, 4)
+        self.assertEqual(Parser.compile(Custom)({'value': 2}).value, 4)
+        with self.assertRaises(ValueError):
+            Parser.validate_and_parse(Checked, {'value': -1})
+
+    def test_frozen_decoding(self):
+        shape = Parser.validate_and_parse(Shape, shape_data())
+        self.assertEqual(shape.points, [Point(1.0, 2.0), Point(3, 4)])
+        self.assertEqual(Parser.compile(Shape)(shape_data()), shape)
+        self.assertEqual(Parser.dump(shape), shape_data())
+
+    def test_slotted_mirror(self):
+        mirror = Parser.slotted(Shape)
+        self.assertIs(Parser.slotted(Shape), mirror)
+        self.assertTrue(is_dataclass(mirror))
+        self.assertEqual(mirror.__name__, 'Shape')
+        self.assertEqual([f.name for f in fields(mirror)], ['name', 'points', 'origin'])
+        self.assertFalse(hasattr(mirror('a', [], None), '__dict__'))
+        self.assertEqual(mirror('a', [], None).size(), 0)
+        with self.assertRaises(NotADataclassError):
+            slotted_dataclass(int)
+
+    def test_slotted_mirror_decoding(self):
+        mirror = Parser.slotted(Shape)
+        shape = Parser.validate_and_parse(mirror, shape_data())
+        self.assertFalse(hasattr(shape.points[0], '__dict__'))
+        with self.assertRaises(FrozenInstanceError):
+            shape.points[0].x = 0.0
+        self.assertEqual(Parser.compile(mirror)(shape_data()), shape)
+        self.assertEqual(Parser.dump(shape), shape_data())
+        with self.assertRaises(TypeValueMismatchError):
+            Parser.validate_and_parse(mirror, dict(shape_data(), name=1))
+        self.assertIs(type(Parser.validate_and_parse(Parser.slotted(Shape, deep=False), shape_data()).points[0]),
+                      Point)
+
+    @unittest.skipIf(sys.version_info < (3, 10), "slots=True needs Python 3.10")
+    def test_native_slots(self):
+        @dataclass(slots=True, frozen=True)
+        class Pixel:
+            x: int
+            y: int
+            tags: List[str] = field(default_factory=list)
+
+        pixel = Parser.validate_and_parse(Pixel, {'x': 1, 'y': 2, 'tags': ['a']})
+        self.assertEqual(pixel, Pixel(1, 2, ['a']))
+        self.assertEqual(Parser.compile(Pixel)({'x': 1, 'y': 2, 'tags': []}), Pixel(1, 2))
+        mirror = slotted_dataclass(Pixel)
+        self.assertEqual(mirror(1, 2).tags, [])
+
+    def test_slotted_mirror_bases(self):
+        mirror = Parser.slotted(Sub)
+        sub = Parser.validate_and_parse(mirror, {'name': "a", 'size': 2})
+        self.assertEqual(sub.describe(), "base a of size 2")
+        self.assertEqual((sub.label(), sub.title, mirror.kind()), ("<a>", "<A>", "sub of a base"))
+        self.assertIsInstance(sub, Parser.slotted(Base))
+        self.assertIsInstance(sub, Labelled)
+        self.assertNotIsInstance(sub, Sub)
+        self.assertFalse(hasattr(sub, '__dict__'))
+        self.assertEqual(Parser.compile(mirror)({'name': "b", 'size': 1}), mirror("b", 1))
+        self.assertEqual(Sub("a", 2).describe(), "base a of size 2")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,131 @@
+import threading
+import unittest
+from dataclasses import dataclass
+from typing import List, Optional
+
+from object_serializer.exceptions import InvalidDataTypeError, NotADataclassError
+from object_serializer.serializer import decoder_plan
+from object_serializer.serializer.decoder_plan import PlanCache, PlanKind, get_plan
+from object_serializer.serializer.json_parser import Parser
+
+
+@dataclass
+class Inner:
+    born_in: str
+    city_cap: int
+
+
+@dataclass
+class Outer:
+    name: str
+    tags: List[str]
+    info: Inner
+    history: List[Inner]
+    extra: Optional[Inner]
+
+
+class TestDecoderPlan(unittest.TestCase):
+    test_case_ids = {
+        "test_plan_kinds": "TCL_01",
+        "test_nested_plans_are_shared": "TCL_02",
+        "test_cache_hits": "TCL_03",
+        "test_cache_is_bounded": "TCL_04",
+        "test_clear_cache": "TCL_05",
+        "test_concurrent_access": "TCL_06",
+        "test_invalid_type": "TCL_07",
+        "test_not_a_dataclass": "TCL_08",
+        "test_optional_dataclass": "TCL_09"
+    }
+
+    def setUp(self):
+        Parser.clear_plan_cache()
+
+    def test_plan_kinds(self):
+        plan = get_plan(Outer)
+        kinds = {field.name: field.plan.kind for field in plan.fields}
+
+        self.assertIs(plan.kind, PlanKind.DATACLASS)
+        self.assertEqual(kinds, {
+            'name': PlanKind.PRIMITIVE,
+            'tags': PlanKind.LIST,
+            'info': PlanKind.DATACLASS,
+            'history': PlanKind.LIST,
+            'extra': PlanKind.OPTIONAL
+        })
+        self.assertIs(plan.fields[1].plan.inner.tp, str)
+
+    def test_nested_plans_are_shared(self):
+        plan = get_plan(Outer)
+        info, history, extra = plan.fields[2].plan, plan.fields[3].plan, plan.fields[4].plan
+
+        self.assertIs(info, get_plan(Inner))
+        self.assertIs(history.inner, info)
+        self.assertIs(extra.inner, info)
+
+    def test_cache_hits(self):
+        data = {'name': 'a', 'tags': [], 'info': {'born_in': 'x', 'city_cap': 1},
+                'history': [{'born_in': 'y', 'city_cap': 2}] * 10, 'extra': None}
+        Parser.validate_and_parse(Outer, data)
+        before = Parser.plan_cache_info()
+
+        for _ in range(5):
+            Parser.validate_and_parse(Outer, data)
+        after = Parser.plan_cache_info()
+
+        self.assertEqual(after.misses, before.misses)
+        self.assertEqual(after.hits, before.hits + 5)
+
+    def test_cache_is_bounded(self):
+        cache = PlanCache(maxsize=2)
+        cache.get(int)
+        cache.get(str)
+        cache.get(int)
+        cache.get(float)
+
+        self.assertEqual(cache.types(), (int, float))
+        self.assertEqual(cache.info().currsize, 2)
+
+    def test_clear_cache(self):
+        get_plan(Outer)
+        self.assertIn(Outer, decoder_plan.cached_plan_types())
+
+        Parser.clear_plan_cache()
+        info = Parser.plan_cache_info()
+        self.assertEqual((info.hits, info.misses, info.currsize), (0, 0, 0))
+
+    def test_concurrent_access(self):
+        plans = []
+
+        def worker():
+            plans.append(get_plan(Outer))
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len({id(plan) for plan in plans}), 1)
+
+    def test_invalid_type(self):
+        class NotDataclass:
+            pass
+
+        @dataclass
+        class ErrorDataClass:
+            sign: NotDataclass
+
+        with self.assertRaises(InvalidDataTypeError):
+            get_plan(ErrorDataClass)
+
+    def test_not_a_dataclass(self):
+        with self.assertRaises(NotADataclassError):
+            Parser.validate_and_parse(int, {})
+
+    def test_optional_dataclass(self):
+        data = {'name': 'a', 'tags': ['t'], 'info': {'born_in': 'x', 'city_cap': 1},
+                'history': [], 'extra': {'born_in': 'z', 'city_cap': 3}}
+
+        result = Parser.validate_and_parse(Outer, data)
+        self.assertIsInstance(result.extra, Inner)
+        self.assertEqual(result.extra.city_cap, 3)
@@ -0,0 +1,87 @@
+import json
+import unittest
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+from object_serializer.exceptions import TypeValueMismatchError, UnresolvedAttributeError
+from object_serializer.serializer.json_parser import Parser
+
+
+@dataclass
+class Settings:
+    theme: str = "light"
+    tags: List[str] = field(default_factory=list)
+
+
+@dataclass
+class Account:
+    id: int
+    name: str
+    nickname: Optional[str]
+    settings: Settings = field(default_factory=Settings)
+    limit: int = None
+    roles: List[str] = field(default_factory=lambda: ["user"])
+
+
+class TestDefaults(unittest.TestCase):
+    test_case_ids = {
+        "test_missing_fields_use_defaults": "TCL_01",
+        "test_default_factory_is_called_per_instance": "TCL_02",
+        "test_missing_required_field": "TCL_03",
+        "test_present_values_are_validated": "TCL_04",
+        "test_every_path_agrees": "TCL_05"
+    }
+
+    def decoders(self):
+        return {
+            'generic': lambda data: Parser.validate_and_parse(Account, data),
+            'compiled': Parser.compile(Account),
+            'lazy': lambda data: Parser.materialize(Parser.validate_and_parse(Account, data, lazy=True)),
+            'projected': lambda data: Parser.validate_and_parse(Account, data, exclude=['settings.theme'])
+        }
+
+    def test_missing_fields_use_defaults(self):
+        account = Parser.validate_and_parse(Account, {'id': 1, 'name': "a"})
+        self.assertEqual(account, Account(1, "a", None))
+        self.assertEqual(account.settings, Settings("light", []))
+        self.assertIsNone(account.limit)
+        self.assertEqual(account.roles, ["user"])
+
+    def test_default_factory_is_called_per_instance(self):
+        for name, decode in self.decoders().items():
+            with self.subTest(decoder=name):
+                first, second = decode({'id': 1, 'name': "a"}), decode({'id': 2, 'name': "b"})
+                self.assertIsNot(first.roles, second.roles)
+                self.assertIsNot(first.settings, second.settings)
+
+    def test_missing_required_field(self):
+        for name, decode in self.decoders().items():
+            with self.subTest(decoder=name):
+                with self.assertRaises(UnresolvedAttributeError) as context:
+                    decode({'id': 1})
+                self.assertEqual(context.exception.field_name, 'name')
+                self.assertIs(context.exception.cls, Account)
+        with self.assertRaises(UnresolvedAttributeError):
+            Parser.validate_and_parse(Account, json.dumps({'name': "a"}))
+
+    def test_present_values_are_validated(self):
+        for name, decode in self.decoders().items():
+            for data in ({'id': 1, 'name': "a", 'limit': "1"}, {'id': 1, 'name': "a", 'settings': None},
+                         {'id': 1, 'name': "a", 'roles': [1]}, {'id': 1, 'name': None}):
+                with self.subTest(decoder=name, data=data):
+                    with self.assertRaises(TypeValueMismatchError):
+                        decode(data)
+
+    def test_every_path_agrees(self):
+        data = {'id': 1, 'name': "a", 'nickname': "n", 'settings': {'tags': ["x"]}, 'limit': 5}
+        expected = Account(1, "a", "n", Settings("light", ["x"]), 5, ["user"])
+        for name, decode in self.decoders().items():
+            with self.subTest(decoder=name):
+                self.assertEqual(decode(data), expected)
+        result = Parser.validate_and_parse_many(Account, [json.dumps(data), '{"id": 2}'], fail_fast=False)
+        self.assertEqual(result.values, [expected])
+        self.assertIsInstance(result.errors[0].error, UnresolvedAttributeError)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,125 @@
+import json
+import unittest
+import uuid
+from dataclasses import dataclass, asdict
+from datetime import datetime
+from decimal import Decimal
+from enum import Enum
+from typing import List, Optional
+
+from object_serializer.exceptions import NotADataclassError
+from object_serializer.serializer.json_parser import Parser
+
+
+class Status(Enum):
+    ACTIVE = 'active'
+    DISABLED = 'disabled'
+
+
+@dataclass
+class Review:
+    rating: int
+    comment: str
+
+
+@dataclass
+class Dimensions:
+    width: float
+    height: float
+
+
+@dataclass
+class Product:
+    id: int
+    price: float
+    tags: List[str]
+    dimensions: Dimensions
+    reviews: List[Review]
+    matrix: List[List[int]]
+    note: Optional[str]
+    related: Optional[List[Review]]
+    extra: Optional[Dimensions]
+
+
+@dataclass
+class Account:
+    id: uuid.UUID
+    created_at: datetime
+    balance: Decimal
+    status: Status
+    history: List[Status]
+    closed_at: Optional[datetime]
+
+
+def product_data():
+    return {
+        'id': 1,
+        'price': 10.5,
+        'tags': ['a', 'b'],
+        'dimensions': {'width': 1.5, 'height': 2.0},
+        'reviews': [{'rating': 5, 'comment': 'ok'}, {'rating': 3, 'comment': 'meh'}],
+        'matrix': [[1, 2], [3]],
+        'note': None,
+        'related': [{'rating': 1, 'comment': 'bad'}],
+        'extra': None
+    }
+
+
+class TestEncoder(unittest.TestCase):
+    test_case_ids = {
+        "test_dump_matches_asdict": "TCL_01",
+        "test_round_trip": "TCL_02",
+        "test_round_trip_json": "TCL_03",
+        "test_round_trip_optionals": "TCL_04",
+        "test_scalars_round_trip": "TCL_05",
+        "test_dumps_kwargs": "TCL_06",
+        "test_not_a_dataclass": "TCL_07"
+    }
+
+    def test_dump_matches_asdict(self):
+        product = Parser.validate_and_parse(Product, product_data())
+        self.assertEqual(Parser.dump(product), asdict(product))
+
+    def test_round_trip(self):
+        product = Parser.validate_and_parse(Product, product_data())
+        self.assertEqual(Parser.dump(product), product_data())
+        self.assertEqual(Parser.validate_and_parse(Product, Parser.dump(product)), product)
+
+    def test_round_trip_json(self):
+        product = Parser.validate_and_parse(Product, product_data())
+        text = Parser.dumps(product)
+
+        self.assertEqual(json.loads(text), product_data())
+        self.assertEqual(Parser.validate_and_parse(Product, text), product)
+
+    def test_round_trip_optionals(self):
+        data = product_data()
+        data['note'] = 'fragile'
+        data['related'] = None
+        data['extra'] = {'width': 3.0, 'height': 4.0}
+
+        product = Parser.validate_and_parse(Product, data)
+        self.assertEqual(Parser.dump(product), data)
+
+    def test_scalars_round_trip(self):
+        account = Account(uuid.uuid4(), datetime(2024, 5, 23, 8, 56, 21), Decimal('10.50'),
+                          Status.ACTIVE, [Status.DISABLED, Status.ACTIVE], None)
+        data = Parser.dump(account)
+
+        self.assertEqual(data['id'], str(account.id))
+        self.assertEqual(data['created_at'], '2024-05-23T08:56:21')
+        self.assertEqual(data['balance'], '10.50')
+        self.assertEqual(data['status'], 'active')
+        self.assertEqual(data['history'], ['disabled', 'active'])
+        self.assertEqual(Parser.validate_and_parse(Account, Parser.dumps(account)), account)
+
+    def test_dumps_kwargs(self):
+        review = Review(5, 'ok')
+        self.assertEqual(Parser.dumps(review, backend='json', sort_keys=True, indent=None),
+                         '{"comment": "ok", "rating": 5}')
+
+    def test_not_a_dataclass(self):
+        with self.assertRaises(NotADataclassError):
+            Parser.dump({'rating': 5})
+        with self.assertRaises(NotADataclassError):
+            Parser.dump(Review)
@@ -0,0 +1,190 @@
+import json
+import sys
+import unittest
+from dataclasses import dataclass, field
+from datetime import date
+from decimal import Decimal
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple, Union
+
+from object_serializer.exceptions import InvalidDataTypeError, TypeValueMismatchError, UnresolvedAttributeError
+from object_serializer.serializer.dataclass_serializer import serialize
+from object_serializer.serializer.decoder_plan import PlanKind, get_plan
+from object_serializer.serializer.json_parser import Parser
+
+
+@dataclass
+class Product:
+    id: int
+    price: float
+
+
+@dataclass
+class Bundle:
+    name: str
+    products: List[Product]
+
+
+@dataclass
+class Inventory:
+    stock: Dict[str, Product]
+    counts: Dict[str, int]
+    position: Tuple[float, float]
+    history: Tuple[int, ...]
+    tags: Set[str]
+    codes: FrozenSet[int]
+    item: Union[Product, Bundle]
+    value: Union[int, str, date]
+    note: Optional[Union[int, List[Product]]] = None
+    nested: Dict[str, List[Tuple[str, int]]] = field(default_factory=dict)
+
+
+def inventory_data(**changes):
+    data = {'stock': {'a': {'id': 1, 'price': 2.5}}, 'counts': {'a': 3, 'b': 0}, 'position': [1, 2.5],
+            'history': [1, 2, 3], 'tags': ["x", "y", "x"], 'codes': [1, 2], 'item': {'name': "b", 'products': []},
+            'value': "2024-01-02", 'note': [{'id': 2, 'price': 1}], 'nested': {'k': [["a", 1]]}}
+    data.update(changes)
+    return data
+
+
+EXPECTED = Inventory({'a': Product(1, 2.5)}, {'a': 3, 'b': 0}, (1, 2.5), (1, 2, 3), {"x", "y"}, frozenset({1, 2}),
+                     Bundle("b", []), "2024-01-02", [Product(2, 1)], {'k': [("a", 1)]})
+
+
+class TestGenericTypes(unittest.TestCase):
+    test_case_ids = {
+        "test_plans": "TCL_01",
+        "test_decode": "TCL_02",
+        "test_compiled_decoder_agrees": "TCL_03",
+        "test_union_dispatch": "TCL_04",
+        "test_mismatches": "TCL_05",
+        "test_invalid_types": "TCL_06",
+        "test_encode_round_trip": "TCL_07",
+        "test_report": "TCL_08",
+        "test_slotted_mirror": "TCL_09",
+        "test_pep604_unions": "TCL_10"
+    }
+
+    def test_plans(self):
+        self.assertEqual(set(serialize(Inventory)), set(Inventory.__dataclass_fields__))
+        kinds = {name: get_plan(tp).kind for name, tp in serialize(Inventory).items()}
+        self.assertEqual(kinds['stock'], PlanKind.DICT)
+        self.assertEqual(kinds['position'], PlanKind.TUPLE)
+        self.assertEqual(kinds['codes'], PlanKind.SET)
+        self.assertEqual(kinds['item'], PlanKind.UNION)
+        self.assertEqual(get_plan(Optional[Union[int, List[Product]]]).inner.kind, PlanKind.UNION)
+
+    def test_decode(self):
+        inventory = Parser.validate_and_parse(Inventory, json.dumps(inventory_data()))
+        self.assertEqual(inventory, EXPECTED)
+        self.assertIsInstance(inventory.position, tuple)
+        self.assertIsInstance(inventory.codes, frozenset)
+        cases = [({'item': {'id': 1, 'price': 1.0}}, 'item', Product(1, 1.0)), ({'value': 3}, 'value', 3),
+                 ({'value': True}, 'value', True), ({'value': 2.5}, 'value', 2.5), ({'note': 7}, 'note', 7),
+                 ({'note': None}, 'note', None)]
+        for changes, name, expected in cases:
+            with self.subTest(changes=changes):
+                self.assertEqual(getattr(Parser.validate_and_parse(Inventory, inventory_data(**changes)), name),
+                                 expected)
+
+    def test_compiled_decoder_agrees(self):
+        decode = Parser.compile(Inventory)
+        self.assertEqual(decode(inventory_data()), EXPECTED)
+        self.assertEqual(decode(inventory_data(item={'id': 1, 'price': 1})).item, Product(1, 1))
+        self.assertEqual(decode(inventory_data(value=4)).value, 4)
+        for changes in ({'stock': {'a': {'id': "1", 'price': 1.0}}}, {'counts': {'a': "1"}}, {'counts': []},
+                        {'value': None}, {'item': []}):
+            with self.subTest(changes=changes):
+                with self.assertRaises(TypeValueMismatchError):
+                    decode(inventory_data(**changes))
+
+    def test_union_dispatch(self):
+        plan = get_plan(Union[Product, Bundle, int, str, date, Decimal])
+        self.assertEqual([member.tp for member in plan.dispatch[str]], [str])
+        self.assertEqual([member.tp for member in plan.dispatch[dict]], [Product, Bundle, date, Decimal])
+        self.assertEqual([member.tp for member in plan.dispatch[float]], [date, Decimal, int])
+        self.assertEqual(plan.dispatch[type(None)], ())
+        self.assertEqual(Parser.validate_and_parse(Inventory, inventory_data(value=date(2024, 1, 2))).value,
+                         date(2024, 1, 2))
+        with self.assertRaises(UnresolvedAttributeError):
+            # neither member fits, the error of the last candidate is raised
+            Parser.validate_and_parse(Inventory, inventory_data(item={'id': 1}))
+
+    def test_mismatches(self):
+        invalid = [{'stock': []}, {'stock': {'a': 1}}, {'counts': {'a': 1.5}}, {'position': [1]},
+                   {'position': "1,2"}, {'history': [1, "2"]}, {'tags': ["a", 1]}, {'codes': {}}, {'value': None},
+                   {'value': []}, {'note': "x"}, {'nested': {'k': [["a", "b"]]}}]
+        for changes in invalid:
+            with self.subTest(changes=changes):
+                with self.assertRaises(TypeValueMismatchError):
+                    Parser.validate_and_parse(Inventory, inventory_data(**changes))
+        with self.assertRaises(TypeValueMismatchError) as context:
+            Parser.validate_and_parse(Inventory, inventory_data(counts={'a': 1, 'b': "2"}))
+        self.assertIn("key 'b' is str", str(context.exception))
+        with self.assertRaises(TypeValueMismatchError) as context:
+            Parser.validate_and_parse(Inventory, inventory_data(position=[1, 2, 3]))
+        self.assertIn("Expected 2 items at field position, found 3", str(context.exception))
+
+    def test_invalid_types(self):
+        for tp in (Dict[int, str], Set[List[int]], Set[Product], Tuple[()], Dict[str, complex],
+                   Union[int, complex]):
+            with self.subTest(tp=tp):
+                @dataclass
+                class Invalid:
+                    value: tp
+                with self.assertRaises(InvalidDataTypeError):
+                    serialize(Invalid)
+
+    def test_encode_round_trip(self):
+        inventory = Parser.validate_and_parse(Inventory, inventory_data(value=date(2024, 1, 2)))
+        encoded = Parser.dump(inventory)
+        self.assertEqual(encoded['position'], [1, 2.5])
+        self.assertEqual(sorted(encoded['tags']), ["x", "y"])
+        self.assertEqual(encoded['value'], "2024-01-02")
+        self.assertEqual(encoded['item'], {'name': "b", 'products': []})
+        self.assertEqual(Parser.validate_and_parse(Inventory, Parser.dumps(inventory)),
+                         Parser.validate_and_parse(Inventory, inventory_data()))
+
+    def test_report(self):
+        data = inventory_data(stock={'a': {'id': "1", 'price': 1}}, position=[1], value=None,
+                              nested={'k': [["a", "b"]]})
+        report = Parser.validate_and_report(Inventory, data)
+        self.assertEqual([error.location for error in report.errors],
+                         ['stock.a.id', 'position', 'value', 'nested.k[0][1]'])
+
+    @unittest.skipIf(sys.version_info < (3, 10), "slots=True needs Python 3.10")
+    def test_slotted_mirror(self):
+        mirror = Parser.slotted(Inventory)
+        inventory = Parser.validate_and_parse(mirror, inventory_data(item={'id': 1, 'price': 1.0}))
+        self.assertFalse(hasattr(inventory, '__dict__'))
+        self.assertEqual(type(inventory.item).__name__, 'Product')
+        self.assertFalse(hasattr(inventory.item, '__dict__'))
+        self.assertFalse(hasattr(inventory.stock['a'], '__dict__'))
+
+
+    @unittest.skipIf(sys.version_info < (3, 10), "X | Y unions need Python 3.10")
+    def test_pep604_unions(self):
+        @dataclass
+        class Listing:
+            item: Product | Bundle
+            value: int | str
+            note: int | List[Product] | None = None
+            parent: Product | None = None
+
+        self.assertEqual(get_plan(int | str).kind, PlanKind.UNION)
+        self.assertEqual(get_plan(Product | None).kind, PlanKind.OPTIONAL)
+        self.assertEqual(get_plan(int | List[Product] | None).inner.kind, PlanKind.UNION)
+        data = {'item': {'name': "b", 'products': []}, 'value': "v", 'note': [{'id': 2, 'price': 1}]}
+        expected = Listing(Bundle("b", []), "v", [Product(2, 1)])
+        self.assertEqual(Parser.validate_and_parse(Listing, data), expected)
+        self.assertEqual(Parser.compile(Listing)(data), expected)
+        self.assertEqual(Parser.dump(expected), dict(data, parent=None))
+        listing = Parser.validate_and_parse(Parser.slotted(Listing), data)
+        self.assertIs(type(listing.note[0]), Parser.slotted(Product))
+        with self.assertRaises(TypeValueMismatchError):
+            Parser.validate_and_parse(Listing, dict(data, value=None))
+        with self.assertRaises(InvalidDataTypeError):
+            get_plan(int | complex)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,144 @@
+import sys
+import unittest
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple, Union
+
+from object_serializer import TaggedUnion
+from object_serializer.exceptions import TypeValueMismatchError, UnresolvedAttributeError
+from object_serializer.serializer.json_parser import Parser
+
+
+@dataclass
+class Comment:
+    text: str
+    replies: List['Comment'] = field(default_factory=list)
+
+
+@dataclass
+class Point:
+    x: float
+    y: float
+
+
+@dataclass
+class Line:
+    start: Point
+    end: Point
+
+
+@dataclass
+class Shape:
+    name: str
+    kind: str = 'shape'
+
+
+Figure = TaggedUnion('kind', {'line': Line, 'shape': Shape})
+
+
+@dataclass
+class Drawing:
+    points: List[Point]
+    grid: List[List[Optional[Point]]]
+    named: Dict[str, Point]
+    corners: Tuple[Point, Point]
+    path: Tuple[Point, ...]
+    tags: Set[str]
+    layers: FrozenSet[int]
+    item: Union[Point, Line, int]
+    figures: List[Figure]
+    created: date
+    cursor: Optional[Point] = None
+    counts: Dict[str, int] = field(default_factory=dict)
+
+
+DRAWING = {'points': [{'x': 1, 'y': 2.5}], 'grid': [[None, {'x': 0, 'y': 0}], []], 'named': {'a': {'x': 1, 'y': 1}},
+           'corners': [{'x': 0, 'y': 0}, {'x': 1, 'y': 1}], 'path': [{'x': 2, 'y': 2}], 'tags': ["a", "b"],
+           'layers': [1, 2], 'item': {'start': {'x': 0, 'y': 0}, 'end': {'x': 1, 'y': 1}},
+           'figures': [{'kind': 'shape', 'name': "s"}, {'kind': 'line', 'start': {'x': 0, 'y': 0},
+                                                          'end': {'x': 0, 'y': 1}}],
+           'created': "2024-05-01", 'counts': {'a': 1}}
+
+
+def thread(depth: int) -> dict:
+    root = node = {'text': "0"}
+    for index in range(1, depth + 1):
+        child = {'text': str(index)}
+        node['replies'] = [child]
+        node = child
+    return root
+
+
+class TestIterativeDecoder(unittest.TestCase):
+    test_case_ids = {
+        "test_agrees_with_recursive": "TCL_01",
+        "test_same_errors": "TCL_02",
+        "test_beyond_recursion_limit": "TCL_03",
+        "test_batch": "TCL_04",
+        "test_invalid_options": "TCL_05"
+    }
+
+    def test_agrees_with_recursive(self):
+        expected = Parser.validate_and_parse(Drawing, DRAWING)
+        self.assertEqual(Parser.validate_and_parse(Drawing, DRAWING, iterative=True), expected)
+        cases = [{'item': 3}, {'item': {'x': 1, 'y': 2}}, {'cursor': {'x': 1, 'y': 1}}, {'grid': []},
+                 {'figures': []}]
+        for changes in cases:
+            with self.subTest(changes=changes):
+                data = dict(DRAWING, **changes)
+                self.assertEqual(Parser.validate_and_parse(Drawing, data, iterative=True),
+                                 Parser.validate_and_parse(Drawing, data))
+        self.assertEqual(Parser.validate_and_parse(Figure, {'kind': 'shape', 'name': "s"}, iterative=True), Shape("s"))
+
+    def test_same_errors(self):
+        cases = [{'points': [{'x': "1", 'y': 2}]}, {'points': {}}, {'grid': [[3]]}, {'grid': [None]},
+                 {'named': {'a': 1}}, {'named': {1: {'x': 1, 'y': 1}}}, {'corners': [{'x': 0, 'y': 0}]},
+                 {'path': [1]}, {'tags': ["a", 1]}, {'layers': "1"}, {'item': "x"}, {'item': {'x': 1}},
+                 {'figures': [{'kind': 'circle'}]}, {'figures': [{'name': "s"}]}, {'created': 5},
+                 {'cursor': 3}, {'counts': {'a': "1"}}, {'points': [{'x': 1}]}]
+        for changes in cases:
+            with self.subTest(changes=changes):
+                data = dict(DRAWING, **changes)
+                with self.assertRaises((TypeValueMismatchError, UnresolvedAttributeError)) as recursive:
+                    Parser.validate_and_parse(Drawing, data)
+                with self.assertRaises(type(recursive.exception)) as iterative:
+                    Parser.validate_and_parse(Drawing, data, iterative=True)
+                self.assertEqual(str(iterative.exception), str(recursive.exception))
+
+    def test_beyond_recursion_limit(self):
+        depth = sys.getrecursionlimit() * 3
+        data = thread(depth)
+        with self.assertRaises(RecursionError):
+            Parser.validate_and_parse(Comment, data)
+        comment = Parser.validate_and_parse(Comment, data, iterative=True)
+        count = 0
+        while comment.replies:
+            comment = comment.replies[0]
+            count += 1
+        self.assertEqual((count, comment.text), (depth, str(depth)))
+
+        node = data
+        while 'replies' in node:
+            node = node['replies'][0]
+        node['text'] = 5
+        with self.assertRaises(TypeValueMismatchError):
+            Parser.validate_and_parse(Comment, data, iterative=True)
+
+    def test_batch(self):
+        records = ['{"text": "a", "replies": [{"text": "b"}]}', thread(3), {'text': 1}]
+        result = Parser.validate_and_parse_many(Comment, records, fail_fast=False, iterative=True)
+        self.assertEqual(result.values, [Comment("a", [Comment("b")]),
+                                         Comment("0", [Comment("1", [Comment("2", [Comment("3")])])])])
+        self.assertEqual([error.index for error in result.errors], [2])
+
+    def test_invalid_options(self):
+        with self.assertRaises(ValueError):
+            Parser.validate_and_parse(Comment, {'text': "a"}, iterative=True, lazy=True)
+        with self.assertRaises(ValueError):
+            Parser.validate_and_parse(Comment, {'text': "a"}, iterative=True, include=['text'])
+        with self.assertRaises(ValueError):
+            Parser.validate_and_parse_many(Comment, [], iterative=True, exclude=['replies'])
+
+
+if __name__ == '__main__':
+    unittest.main()
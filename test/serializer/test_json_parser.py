@@ -1,9 +1,13 @@
 import unittest
 from dataclasses import dataclass
+from datetime import datetime
+from decimal import Decimal
+from enum import Enum
 from typing import List, Optional
 
 from object_serializer.exceptions import TypeValueMismatchError
 from object_serializer.serializer.json_parser import Parser
+from object_serializer.utils.type_registry import register_scalar, unregister_scalar
 
 
 class MyTestCase(unittest.TestCase):
@@ -20,7 +24,10 @@ class MyTestCase(unittest.TestCase):
         "test_type_mismatch_error_list": "TCL_10",
         "test_type_mismatch_error_nested_list": "TCL_11",
         "test_type_mismatch_in_optional": "TCL_12",
-        "test_type_mismatch_in_nested_object": "TCL_13"
+        "test_type_mismatch_in_nested_object": "TCL_13",
+        "test_scalar_types": "TCL_14",
+        "test_scalar_mismatch": "TCL_15",
+        "test_custom_scalar": "TCL_16"
     }
 
     def test_simple(self):
@@ -400,4 +407,55 @@ class MyTestCase(unittest.TestCase):
         }
 
         with self.assertRaises(TypeValueMismatchError):
-            Parser.validate_and_parse(NestedObject, json_data)
\ No newline at end of file
+            Parser.validate_and_parse(NestedObject, json_data)
+
+    def test_scalar_types(self):
+        class Status(Enum):
+            ACTIVE = 'active'
+            DISABLED = 'disabled'
+
+        @dataclass
+        class ScalarClass:
+            created_at: datetime
+            price: Decimal
+            status: Status
+            history: List[Status]
+            updated_at: Optional[datetime]
+
+        json_data = {
+            'created_at': '2024-05-23T08:56:21',
+            'price': '19.99',
+            'status': 'active',
+            'history': ['disabled', 'active']
+        }
+
+        result = Parser.validate_and_parse(ScalarClass, json_data)
+        self.assertEqual(result.created_at, datetime(2024, 5, 23, 8, 56, 21))
+        self.assertEqual(result.price, Decimal('19.99'))
+        self.assertIs(result.status, Status.ACTIVE)
+        self.assertEqual(result.history, [Status.DISABLED, Status.ACTIVE])
+        self.assertIsNone(result.updated_at)
+
+    def test_scalar_mismatch(self):
+        @dataclass
+        class ScalarClass:
+            created_at: datetime
+
+        with self.assertRaises(TypeValueMismatchError):
+            Parser.validate_and_parse(ScalarClass, {'created_at': 'yesterday'})
+
+    def test_custom_scalar(self):
+        class Money:
+            def __init__(self, cents):
+                self.cents = cents
+
+        @dataclass
+        class Order:
+            total: Money
+
+        register_scalar(Money, lambda tp, value: tp(int(value * 100)))
+        try:
+            result = Parser.validate_and_parse(Order, {'total': 12.5})
+        finally:
+            unregister_scalar(Money)
+        self.assertEqual(result.total.cents, 1250)
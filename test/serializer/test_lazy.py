@@ -0,0 +1,151 @@
+import copy
+import json
+import pickle
+import unittest
+from dataclasses import asdict, astuple, dataclass
+from typing import List, Optional
+
+from object_serializer.exceptions import TypeValueMismatchError
+from object_serializer.serializer.json_parser import Parser
+from object_serializer.serializer.lazy import LazyProxy
+
+
+@dataclass
+class Dimensions:
+    width: float
+    height: float
+
+
+@dataclass(frozen=True)
+class Review:
+    rating: int
+    comment: str
+
+
+@dataclass
+class Product:
+    id: int
+    price: float
+    tags: List[str]
+    dimensions: Dimensions
+    reviews: List[Review]
+    parent: Optional[Dimensions]
+
+
+def product_data(**changes):
+    data = {'id': 1, 'price': 9.5, 'tags': ['a'], 'dimensions': {'width': 1.0, 'height': 2.0},
+            'reviews': [{'rating': 5, 'comment': 'ok'}, {'rating': 3, 'comment': 'meh'}], 'parent': None}
+    data.update(changes)
+    return data
+
+
+class TestLazy(unittest.TestCase):
+    test_case_ids = {
+        "test_nested_fields_are_deferred": "TCL_01",
+        "test_proxy_replaces_itself": "TCL_02",
+        "test_errors_are_deferred": "TCL_03",
+        "test_shallow_checks_are_eager": "TCL_04",
+        "test_materialize": "TCL_05",
+        "test_equality_and_dump": "TCL_06",
+        "test_frozen_and_slotted_owners": "TCL_07",
+        "test_copy_and_pickle": "TCL_08",
+        "test_list_proxy_is_a_list": "TCL_09"
+    }
+
+    def test_nested_fields_are_deferred(self):
+        product = Parser.validate_and_parse(Product, json.dumps(product_data()), lazy=True)
+        self.assertEqual(product.id, 1)
+        self.assertTrue(issubclass(type(product.dimensions), LazyProxy))
+        self.assertTrue(issubclass(type(product.reviews), LazyProxy))
+        self.assertIsNone(product.parent)
+        self.assertEqual(product.tags, ['a'])
+
+    def test_proxy_replaces_itself(self):
+        product = Parser.validate_and_parse(Product, product_data(), lazy=True)
+        self.assertEqual(product.dimensions.width, 1.0)
+        self.assertIs(type(product.dimensions), Dimensions)
+        self.assertEqual(len(product.reviews), 2)
+        self.assertIs(type(product.reviews), list)
+        self.assertIsInstance(product.reviews[0], Review)
+
+    def test_errors_are_deferred(self):
+        product = Parser.validate_and_parse(Product, product_data(dimensions={'width': "1", 'height': 2}),
+                                            lazy=True)
+        self.assertEqual(product.price, 9.5)
+        with self.assertRaises(TypeValueMismatchError):
+            product.dimensions.width
+
+    def test_shallow_checks_are_eager(self):
+        invalid = [product_data(dimensions=[1, 2]), product_data(reviews={'rating': 1}), product_data(id="1"),
+                   product_data(tags=[1]), product_data(parent=3)]
+        for data in invalid:
+            with self.subTest(data=data):
+                with self.assertRaises(TypeValueMismatchError):
+                    Parser.validate_and_parse(Product, data, lazy=True)
+
+    def test_materialize(self):
+        product = Parser.validate_and_parse(Product, product_data(), lazy=True)
+        self.assertIs(Parser.materialize(product), product)
+        self.assertIs(type(product.dimensions), Dimensions)
+        self.assertIs(type(product.reviews), list)
+        invalid = Parser.validate_and_parse(Product, product_data(reviews=[{'rating': 1, 'comment': 2}]), lazy=True)
+        with self.assertRaises(TypeValueMismatchError):
+            Parser.materialize(invalid)
+
+    def test_equality_and_dump(self):
+        eager = Parser.validate_and_parse(Product, product_data())
+        self.assertEqual(Parser.validate_and_parse(Product, product_data(), lazy=True), eager)
+        self.assertEqual(eager, Parser.validate_and_parse(Product, product_data(), lazy=True))
+        self.assertEqual(Parser.dump(Parser.validate_and_parse(Product, product_data(), lazy=True)), product_data())
+        self.assertIsInstance(Parser.validate_and_parse(Product, product_data(), lazy=True).dimensions, Dimensions)
+
+    def test_frozen_and_slotted_owners(self):
+        mirror = Parser.slotted(Product)
+        product = Parser.validate_and_parse(mirror, product_data(), lazy=True)
+        self.assertEqual(product.reviews[1].comment, 'meh')
+        self.assertIs(type(product.reviews), list)
+        self.assertEqual(product.dimensions.height, 2.0)
+        self.assertIs(type(product.dimensions), Parser.slotted(Dimensions))
+
+    def test_copy_and_pickle(self):
+        eager = Parser.validate_and_parse(Product, product_data())
+        copies = {
+            'asdict': asdict,
+            'astuple': astuple,
+            'copy': copy.copy,
+            'deepcopy': copy.deepcopy,
+            'pickle': lambda product: pickle.loads(pickle.dumps(product)),
+        }
+        expected = {'asdict': asdict(eager), 'astuple': astuple(eager)}
+        for name, function in copies.items():
+            with self.subTest(copy=name):
+                product = Parser.validate_and_parse(Product, product_data(), lazy=True)
+                self.assertEqual(function(product), expected.get(name, eager))
+                self.assertEqual(product, eager)
+        product = Parser.validate_and_parse(Product, product_data(), lazy=True)
+        self.assertIs(type(copy.deepcopy(product).reviews), list)
+        self.assertIs(type(pickle.loads(pickle.dumps(product.dimensions))), Dimensions)
+        invalid = Parser.validate_and_parse(Product, product_data(dimensions={'width': "1"}), lazy=True)
+        with self.assertRaises(TypeValueMismatchError):
+            copy.deepcopy(invalid)
+
+
+    def test_list_proxy_is_a_list(self):
+        # asdict dispatches on the type of the value on Python 3.13, the proxy must be a list subclass
+        product = Parser.validate_and_parse(Product, product_data(), lazy=True)
+        self.assertTrue(issubclass(type(product.reviews), list))
+        self.assertEqual(asdict(product)['reviews'], product_data()['reviews'])
+        extra = Review(4, 'fine')
+        self.assertEqual([extra] + Parser.validate_and_parse(Product, product_data(), lazy=True).reviews,
+                         [extra, Review(5, 'ok'), Review(3, 'meh')])
+        product = Parser.validate_and_parse(Product, product_data(), lazy=True)
+        product.reviews.append(extra)
+        self.assertIs(type(product.reviews), list)
+        self.assertEqual(product.reviews[-1], extra)
+        product = Parser.validate_and_parse(Product, product_data(), lazy=True)
+        product.reviews.sort(key=lambda review: review.rating)
+        self.assertEqual([review.rating for review in product.reviews], [3, 5])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,153 @@
+import json
+import unittest
+from array import array
+from dataclasses import dataclass
+from typing import List, Optional
+
+from object_serializer.exceptions import TypeValueMismatchError
+from object_serializer.serializer.json_parser import Parser
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+@dataclass
+class Reading:
+    sensor: str
+    samples: List[float]
+    counts: List[int]
+    embedding: Optional[List[float]]
+    flags: List[bool]
+
+
+@dataclass
+class Measure:
+    value: Optional[float]
+    values: List[Optional[float]]
+    count: Optional[int] = None
+
+
+def reading_data(**changes):
+    data = {'sensor': "s1", 'samples': [1.5, 2, 3.25], 'counts': [1, 2, 3], 'embedding': [0.5, 1],
+            'flags': [True]}
+    data.update(changes)
+    return data
+
+
+class TestNumericLists(unittest.TestCase):
+    test_case_ids = {
+        "test_float_lists_accept_ints": "TCL_01",
+        "test_array_mode": "TCL_02",
+        "test_array_mode_errors": "TCL_03",
+        "test_numpy_mode": "TCL_04",
+        "test_numpy_mode_errors": "TCL_05",
+        "test_compiled_and_batch": "TCL_06",
+        "test_unknown_mode": "TCL_07",
+        "test_dump_arrays": "TCL_08",
+        "test_optional_floats_accept_ints": "TCL_09"
+    }
+
+    def test_float_lists_accept_ints(self):
+        reading = Parser.validate_and_parse(Reading, reading_data())
+        self.assertEqual(reading.samples, [1.5, 2, 3.25])
+        self.assertEqual(Parser.compile(Reading)(reading_data()), reading)
+        with self.assertRaises(TypeValueMismatchError):
+            Parser.validate_and_parse(Reading, reading_data(counts=[1, 2.5]))
+
+    def test_array_mode(self):
+        reading = Parser.validate_and_parse(Reading, reading_data(), numeric_lists='array')
+        self.assertEqual(reading.samples, array('d', [1.5, 2.0, 3.25]))
+        self.assertEqual(reading.counts, array('q', [1, 2, 3]))
+        self.assertEqual(reading.embedding, array('d', [0.5, 1.0]))
+        self.assertEqual(reading.flags, [True])
+        reading = Parser.validate_and_parse(Reading, reading_data(embedding=None, samples=[]), numeric_lists='array')
+        self.assertIsNone(reading.embedding)
+        self.assertEqual(reading.samples, array('d'))
+
+    def test_array_mode_errors(self):
+        invalid = [
+            reading_data(samples=[1.0, "2"]),
+            reading_data(samples=[1.0, None]),
+            reading_data(counts=[1, 2.5]),
+            reading_data(counts=[2 ** 70]),
+            reading_data(embedding="1, 2"),
+            reading_data(samples={'a': 1}),
+        ]
+        for data in invalid:
+            with self.subTest(data=data):
+                with self.assertRaises(TypeValueMismatchError):
+                    Parser.validate_and_parse(Reading, data, numeric_lists='array')
+                with self.assertRaises(TypeValueMismatchError):
+                    Parser.compile(Reading, numeric_lists='array')(data)
+
+    @unittest.skipIf(numpy is None, "NumPy is not installed")
+    def test_numpy_mode(self):
+        reading = Parser.validate_and_parse(Reading, reading_data(), numeric_lists='numpy')
+        self.assertIsInstance(reading.samples, numpy.ndarray)
+        self.assertEqual(reading.samples.dtype, numpy.float64)
+        self.assertEqual(reading.counts.dtype, numpy.int64)
+        self.assertEqual(reading.samples.tolist(), [1.5, 2.0, 3.25])
+        reading = Parser.validate_and_parse(Reading, reading_data(counts=[]), numeric_lists='numpy')
+        self.assertEqual(reading.counts.dtype, numpy.int64)
+        self.assertEqual(len(reading.counts), 0)
+
+    @unittest.skipIf(numpy is None, "NumPy is not installed")
+    def test_numpy_mode_errors(self):
+        invalid = [
+            reading_data(samples=[1.0, "2"]),
+            reading_data(samples=[1.0, None]),
+            reading_data(samples=[[1.0], [2.0]]),
+            reading_data(samples=[[1.0], 2.0]),
+            reading_data(counts=[1, 2.5]),
+            reading_data(counts=[2 ** 70]),
+            reading_data(counts=[2 ** 63]),
+            reading_data(counts=[1, 2 ** 64 - 1]),
+            reading_data(embedding="1, 2"),
+        ]
+        for data in invalid:
+            with self.subTest(data=data):
+                with self.assertRaises(TypeValueMismatchError):
+                    Parser.validate_and_parse(Reading, data, numeric_lists='numpy')
+        reading = Parser.validate_and_parse(Reading, reading_data(samples=[2 ** 63]), numeric_lists='numpy')
+        self.assertEqual(reading.samples.tolist(), [2.0 ** 63])
+
+    def test_compiled_and_batch(self):
+        records = [json.dumps(reading_data()), json.dumps(reading_data(counts=["1"]))]
+        result = Parser.validate_and_parse_many(Reading, records, fail_fast=False, numeric_lists='array')
+        self.assertEqual(len(result.values), 1)
+        self.assertIsInstance(result.values[0].samples, array)
+        self.assertEqual(result.errors[0].index, 1)
+        self.assertEqual(result.errors[0].field_name, 'counts')
+        self.assertIsNot(Parser.compile(Reading, numeric_lists='array'), Parser.compile(Reading))
+        self.assertIsInstance(Parser.compile(Reading)(reading_data()).samples, list)
+
+    def test_unknown_mode(self):
+        with self.assertRaises(ValueError):
+            Parser.validate_and_parse(Reading, reading_data(), numeric_lists='tensor')
+
+    def test_dump_arrays(self):
+        reading = Parser.validate_and_parse(Reading, reading_data(), numeric_lists='array')
+        self.assertEqual(Parser.dump(reading), reading_data(samples=[1.5, 2.0, 3.25], embedding=[0.5, 1.0]))
+        self.assertEqual(json.loads(Parser.dumps(reading))['counts'], [1, 2, 3])
+
+    def test_optional_floats_accept_ints(self):
+        decoders = {
+            'generic': lambda data: Parser.validate_and_parse(Measure, data),
+            'compiled': Parser.compile(Measure),
+            'iterative': lambda data: Parser.validate_and_parse(Measure, data, iterative=True),
+            'lazy': lambda data: Parser.validate_and_parse(Measure, data, lazy=True),
+        }
+        for name, decode in decoders.items():
+            with self.subTest(decoder=name):
+                self.assertEqual(decode({'value': 1, 'values': [1, None, 2.5], 'count': 3}),
+                                 Measure(1, [1, None, 2.5], 3))
+                with self.assertRaises(TypeValueMismatchError):
+                    decode({'value': 1, 'values': [], 'count': 1.5})
+                with self.assertRaises(TypeValueMismatchError):
+                    decode({'value': "1", 'values': []})
+
+
+if __name__ == '__main__':
+    unittest.main()
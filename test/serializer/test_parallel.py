@@ -0,0 +1,68 @@
+import json
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import List, Optional
+
+from object_serializer.exceptions import NotADataclassError, TypeValueMismatchError
+from object_serializer.serializer.json_parser import Parser
+
+
+@dataclass
+class Review:
+    rating: int
+    comment: str
+
+
+@dataclass
+class Product:
+    id: int
+    title: str
+    reviews: List[Review]
+    note: Optional[str]
+
+
+def product(index):
+    return {'id': index, 'title': f"product {index}", 'reviews': [{'rating': 5, 'comment': 'ok'}], 'note': None}
+
+
+class TestParallel(unittest.TestCase):
+    test_case_ids = {
+        "test_parallel_order": "TCL_01",
+        "test_parallel_bytes_and_dicts": "TCL_02",
+        "test_parallel_error": "TCL_03",
+        "test_parallel_custom_executor": "TCL_04",
+        "test_parallel_invalid_arguments": "TCL_05"
+    }
+
+    def test_parallel_order(self):
+        records = [json.dumps(product(i)) for i in range(100)]
+        result = Parser.validate_and_parse_parallel(Product, records, max_workers=2, chunk_size=7)
+
+        self.assertEqual([value.id for value in result], list(range(100)))
+        self.assertEqual(result[5], Parser.validate_and_parse(Product, records[5]))
+
+    def test_parallel_bytes_and_dicts(self):
+        records = [json.dumps(product(0)).encode('utf-8'), product(1)]
+        result = Parser.validate_and_parse_parallel(Product, iter(records), max_workers=1)
+
+        self.assertEqual([value.id for value in result], [0, 1])
+        self.assertIsInstance(result[1].reviews[0], Review)
+
+    def test_parallel_error(self):
+        records = [product(0), dict(product(1), id='one')]
+        with self.assertRaises(TypeValueMismatchError) as context:
+            Parser.validate_and_parse_parallel(Product, records, max_workers=2, chunk_size=1)
+        self.assertEqual(context.exception.field_name, 'id')
+
+    def test_parallel_custom_executor(self):
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            result = Parser.validate_and_parse_parallel(Product, [product(i) for i in range(10)],
+                                                        chunk_size=3, executor=executor)
+        self.assertEqual(len(result), 10)
+
+    def test_parallel_invalid_arguments(self):
+        with self.assertRaises(NotADataclassError):
+            Parser.validate_and_parse_parallel(dict, [])
+        with self.assertRaises(ValueError):
+            Parser.validate_and_parse_parallel(Product, [], chunk_size=0)
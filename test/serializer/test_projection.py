@@ -0,0 +1,114 @@
+import json
+import unittest
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+from object_serializer import EXCLUDED
+from object_serializer.exceptions import InvalidDataTypeError, TypeValueMismatchError, UnresolvedAttributeError
+from object_serializer.serializer.json_parser import Parser
+
+
+@dataclass
+class Dimensions:
+    width: float
+    height: float
+
+
+@dataclass
+class Review:
+    rating: int
+    comment: str
+
+
+@dataclass
+class Product:
+    id: int
+    price: float
+    dimensions: Dimensions
+    reviews: List[Review]
+    related: Optional[List[Optional[Review]]]
+    tags: List[str] = field(default_factory=list)
+    category: str = "none"
+
+
+def product_data(**changes):
+    data = {'id': 1, 'price': 9.5, 'dimensions': {'width': 1.0, 'height': 2.0},
+            'reviews': [{'rating': 5, 'comment': 'ok'}, {'rating': 3, 'comment': 'meh'}],
+            'related': [None, {'rating': 1, 'comment': 'x'}], 'tags': ['a'], 'category': "c"}
+    data.update(changes)
+    return data
+
+
+class TestProjection(unittest.TestCase):
+    test_case_ids = {
+        "test_include": "TCL_01",
+        "test_exclude": "TCL_02",
+        "test_dotted_paths": "TCL_03",
+        "test_skipped_fields_are_not_validated": "TCL_04",
+        "test_selected_fields_are_validated": "TCL_05",
+        "test_invalid_paths": "TCL_06",
+        "test_batch_and_dump": "TCL_07"
+    }
+
+    def test_include(self):
+        product = Parser.validate_and_parse(Product, json.dumps(product_data()), include=['id', 'price'])
+        self.assertEqual((product.id, product.price), (1, 9.5))
+        self.assertIs(product.dimensions, EXCLUDED)
+        self.assertIs(product.reviews, EXCLUDED)
+        self.assertEqual(product.tags, [])
+        self.assertEqual(product.category, "none")
+        self.assertEqual(Parser.validate_and_parse(Product, product_data(), include='id').id, 1)
+
+    def test_exclude(self):
+        product = Parser.validate_and_parse(Product, product_data(), exclude=['reviews', 'category'])
+        self.assertEqual(product.dimensions, Dimensions(1.0, 2.0))
+        self.assertIs(product.reviews, EXCLUDED)
+        self.assertEqual(product.category, "none")
+
+    def test_dotted_paths(self):
+        product = Parser.validate_and_parse(Product, product_data(), include=['reviews.rating', 'related.comment'])
+        self.assertEqual([review.rating for review in product.reviews], [5, 3])
+        self.assertIs(product.reviews[0].comment, EXCLUDED)
+        self.assertIsNone(product.related[0])
+        self.assertEqual(product.related[1], Review(EXCLUDED, 'x'))
+        product = Parser.validate_and_parse(Product, product_data(), exclude=['dimensions.height'])
+        self.assertEqual(product.dimensions, Dimensions(1.0, EXCLUDED))
+        product = Parser.validate_and_parse(Product, product_data(), include=['reviews', 'reviews.rating'])
+        self.assertEqual(product.reviews[1], Review(3, 'meh'))
+
+    def test_skipped_fields_are_not_validated(self):
+        data = product_data(dimensions="broken", reviews=[{'rating': "1", 'comment': 2}])
+        product = Parser.validate_and_parse(Product, data, include=['id'])
+        self.assertEqual(product.id, 1)
+        product = Parser.validate_and_parse(Product, data, exclude=['dimensions', 'reviews.comment', 'reviews.rating'])
+        self.assertEqual(product.reviews, [Review(EXCLUDED, EXCLUDED)])
+
+    def test_selected_fields_are_validated(self):
+        invalid = [product_data(id="1"), product_data(reviews={'rating': 1}), product_data(reviews=[{'rating': "1"}]),
+                   product_data(related=[3])]
+        for data in invalid:
+            with self.subTest(data=data):
+                with self.assertRaises(TypeValueMismatchError):
+                    Parser.validate_and_parse(Product, data, include=['id', 'reviews.rating', 'related.rating'])
+
+    def test_invalid_paths(self):
+        with self.assertRaises(UnresolvedAttributeError):
+            Parser.validate_and_parse(Product, product_data(), include=['name'])
+        with self.assertRaises(UnresolvedAttributeError):
+            Parser.validate_and_parse(Product, product_data(), exclude=['reviews.stars'])
+        with self.assertRaises(InvalidDataTypeError):
+            Parser.validate_and_parse(Product, product_data(), include=['tags.size'])
+        with self.assertRaises(ValueError):
+            Parser.validate_and_parse(Product, product_data(), include=['id'], lazy=True)
+
+    def test_batch_and_dump(self):
+        records = [json.dumps(product_data()), json.dumps(product_data(id="x"))]
+        result = Parser.validate_and_parse_many(Product, records, fail_fast=False, include=['id', 'reviews.rating'])
+        self.assertEqual(result.values[0].reviews[1].rating, 3)
+        self.assertEqual(result.errors[0].field_name, 'id')
+        self.assertEqual(Parser.dump(result.values[0]),
+                         {'id': 1, 'reviews': [{'rating': 5}, {'rating': 3}], 'tags': [], 'category': "none"})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import sys
+import unittest
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+from object_serializer import TaggedUnion
+from object_serializer.exceptions import InvalidDataTypeError, TypeValueMismatchError
+from object_serializer.serializer.dataclass_serializer import field_types, serialize
+from object_serializer.serializer.decoder_plan import PlanKind, cached_plan_types, get_plan
+from object_serializer.serializer.json_parser import Parser
+
+
+@dataclass
+class TreeNode:
+    value: int
+    children: List[TreeNode] = field(default_factory=list)
+
+
+@dataclass
+class Folder:
+    name: str
+    parent: Optional[File] = None
+
+
+@dataclass
+class File:
+    name: str
+    folders: Dict[str, Folder] = field(default_factory=dict)
+
+
+@dataclass
+class Num:
+    value: float
+    op: str = 'num'
+
+
+@dataclass
+class Add:
+    left: Expr
+    right: Expr
+    op: str = 'add'
+
+
+Expr = TaggedUnion('op', [Num, Add])
+
+
+@dataclass
+class Broken:
+    children: List[Broken]
+    value: complex
+
+
+@dataclass
+class Dangling:
+    value: Undefined  # noqa: F821
+
+
+def tree(depth: int) -> dict:
+    return {'value': depth, 'children': [tree(depth - 1), {'value': -1}] if depth else []}
+
+
+def expected_tree(depth: int) -> TreeNode:
+    return TreeNode(depth, [expected_tree(depth - 1), TreeNode(-1)] if depth else [])
+
+
+class TestRecursiveTypes(unittest.TestCase):
+    test_case_ids = {
+        "test_string_annotations": "TCL_01",
+        "test_recursive_plan": "TCL_02",
+        "test_decode_tree": "TCL_03",
+        "test_mutual_recursion": "TCL_04",
+        "test_recursive_tagged_union": "TCL_05",
+        "test_report": "TCL_06",
+        "test_failed_plan_not_cached": "TCL_07",
+        "test_unresolved_annotation": "TCL_08",
+        "test_slotted_mirror": "TCL_09"
+    }
+
+    def test_string_annotations(self):
+        self.assertEqual(serialize(TreeNode), {'value': int, 'children': List[TreeNode]})
+        self.assertEqual(serialize(Folder)['parent'], Optional[File])
+        self.assertIs(field_types(TreeNode), field_types(TreeNode))
+
+    def test_recursive_plan(self):
+        plan = get_plan(TreeNode)
+        self.assertEqual(plan.kind, PlanKind.DATACLASS)
+        self.assertIs(plan.fields[1].plan.inner, plan)
+        self.assertIs(get_plan(List[TreeNode]), plan.fields[1].plan)
+        expr = get_plan(Expr)
+        self.assertIs(expr.dispatch['add'].fields[0].plan, expr)
+
+    def test_decode_tree(self):
+        data = tree(40)
+        self.assertEqual(Parser.validate_and_parse(TreeNode, data), expected_tree(40))
+        self.assertEqual(Parser.compile(TreeNode)(data), expected_tree(40))
+        self.assertEqual(Parser.dump(expected_tree(3)), Parser.dump(Parser.validate_and_parse(TreeNode, tree(3))))
+        with self.assertRaises(TypeValueMismatchError):
+            Parser.compile(TreeNode)({'value': 1, 'children': [{'value': 2, 'children': [{'value': "3"}]}]})
+
+    def test_mutual_recursion(self):
+        data = {'name': "root", 'parent': {'name': "f", 'folders': {'a': {'name': "a"}}}}
+        expected = Folder("root", File("f", {'a': Folder("a")}))
+        self.assertEqual(Parser.validate_and_parse(Folder, data), expected)
+        self.assertEqual(Parser.compile(Folder)(data), expected)
+
+    def test_recursive_tagged_union(self):
+        data = {'op': 'add', 'left': {'op': 'num', 'value': 1},
+                'right': {'op': 'add', 'left': {'op': 'num', 'value': 2}, 'right': {'op': 'num', 'value': 3}}}
+        expected = Add(Num(1), Add(Num(2), Num(3)))
+        self.assertEqual(Parser.validate_and_parse(Expr, data), expected)
+        self.assertEqual(Parser.compile(Expr)(data), expected)
+        self.assertEqual(Parser.dump(expected), data)
+
+    def test_report(self):
+        report = Parser.validate_and_report(TreeNode, {'value': 1, 'children': [{'value': 2}, {'children': []}]})
+        self.assertEqual([error.location for error in report.errors], ['children[1].value'])
+
+    def test_failed_plan_not_cached(self):
+        with self.assertRaises(InvalidDataTypeError):
+            get_plan(Broken)
+        self.assertNotIn(List[Broken], cached_plan_types())
+        with self.assertRaises(InvalidDataTypeError):
+            get_plan(List[Broken])
+
+    def test_unresolved_annotation(self):
+        with self.assertRaises(InvalidDataTypeError):
+            serialize(Dangling)
+
+    @unittest.skipIf(sys.version_info < (3, 10), "slots=True needs Python 3.10")
+    def test_slotted_mirror(self):
+        mirror = Parser.slotted(TreeNode)
+        node = Parser.validate_and_parse(mirror, tree(3))
+        self.assertIs(type(node.children[0].children[0]), mirror)
+        self.assertFalse(hasattr(node, '__dict__'))
+        folder = Parser.validate_and_parse(Parser.slotted(Folder), {'name': "r", 'parent': {'name': "f"}})
+        self.assertIs(type(folder.parent), Parser.slotted(File))
+
+
+if __name__ == '__main__':
+    unittest.main()
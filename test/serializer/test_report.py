@@ -0,0 +1,160 @@
+import json
+import unittest
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import Dict, List, Optional, Tuple
+from unittest import mock
+
+from object_serializer import FieldError, ValidationReport
+from object_serializer.exceptions import TypeValueMismatchError
+from object_serializer.serializer.json_parser import Parser
+
+
+@dataclass
+class Review:
+    rating: int
+    comment: Optional[str]
+
+
+@dataclass
+class Product:
+    name: str
+    price: Decimal
+    reviews: List[Review]
+    sizes: Optional[List[List[int]]] = None
+    tags: List[str] = field(default_factory=list)
+
+
+@dataclass
+class Catalog:
+    owner: str
+    products: List[Product]
+
+
+@dataclass
+class Numbers:
+    ratio: Optional[float] = None
+    count: Optional[int] = None
+    ratios: List[Optional[float]] = field(default_factory=list)
+    counts: List[int] = field(default_factory=list)
+    totals: Dict[str, int] = field(default_factory=dict)
+    pair: Tuple[int, float] = (0, 0.0)
+    total: int = 0
+
+
+def catalog():
+    return {'owner': "o", 'products': [
+        {'name': "p0", 'price': "1.5", 'reviews': [{'rating': 5, 'comment': None}]},
+        {'name': "p1", 'price': "2", 'reviews': [], 'sizes': [[1, 2], [3]], 'tags': ["a"]}
+    ]}
+
+
+class TestReport(unittest.TestCase):
+    test_case_ids = {
+        "test_valid_document": "TCL_01",
+        "test_collects_every_error": "TCL_02",
+        "test_error_details": "TCL_03",
+        "test_missing_fields": "TCL_04",
+        "test_root_errors": "TCL_05",
+        "test_numeric_lists": "TCL_06",
+        "test_raised_errors_locate_values": "TCL_07",
+        "test_agrees_with_decoder": "TCL_08",
+        "test_failed_decode_is_never_ok": "TCL_09"
+    }
+
+    def test_valid_document(self):
+        report = Parser.validate_and_report(Catalog, json.dumps(catalog()))
+        self.assertIsInstance(report, ValidationReport)
+        self.assertTrue(report.ok)
+        self.assertEqual(report.value, Parser.validate_and_parse(Catalog, catalog()))
+
+    def test_collects_every_error(self):
+        data = catalog()
+        data['products'][0]['reviews'].append({'rating': "2", 'comment': 3})
+        data['products'][1]['price'] = "x"
+        data['products'][1]['sizes'][1].append("4")
+        data['products'].append(7)
+        report = Parser.validate_and_report(Catalog, data)
+        self.assertFalse(report.ok)
+        self.assertIsNone(report.value)
+        self.assertEqual([error.location for error in report.errors],
+                         ['products[0].reviews[1].rating', 'products[0].reviews[1].comment', 'products[1].price',
+                          'products[1].sizes[1][1]', 'products[2]'])
+
+    def test_error_details(self):
+        data = catalog()
+        data['products'][0]['reviews'][0]['rating'] = "5"
+        error, = Parser.validate_and_report(Catalog, data).errors
+        self.assertIsInstance(error, FieldError)
+        self.assertEqual(error.path, ('products', 0, 'reviews', 0, 'rating'))
+        self.assertIs(error.expected, int)
+        self.assertIs(error.actual, str)
+        self.assertFalse(error.missing)
+        self.assertEqual(str(error), "Expected type <class 'int'> at products[0].reviews[0].rating, "
+                                     "found str instead")
+
+    def test_missing_fields(self):
+        data = catalog()
+        del data['products'][0]['name']
+        del data['products'][1]['sizes']
+        del data['products'][0]['reviews'][0]['comment']
+        error, = Parser.validate_and_report(Catalog, data).errors
+        self.assertTrue(error.missing)
+        self.assertEqual(error.location, 'products[0].name')
+        self.assertEqual(error.message, "Missing mandatory field products[0].name")
+
+    def test_root_errors(self):
+        for data, location in (([], ''), ({'owner': "o", 'products': None}, 'products')):
+            with self.subTest(data=data):
+                error, = Parser.validate_and_report(Catalog, data).errors
+                self.assertEqual(error.location, location)
+        self.assertIn('<root>', Parser.validate_and_report(Catalog, []).errors[0].message)
+
+    def test_numeric_lists(self):
+        data = catalog()
+        data['products'][1]['sizes'] = [[1, "2", 3, None]]
+        report = Parser.validate_and_report(Catalog, data, numeric_lists='array')
+        self.assertEqual([error.location for error in report.errors], ['products[1].sizes[0][1]',
+                                                                       'products[1].sizes[0][3]'])
+        self.assertTrue(Parser.validate_and_report(Catalog, catalog(), numeric_lists='array').ok)
+
+    def test_raised_errors_locate_values(self):
+        data = catalog()
+        data['products'][1]['tags'] = ["a", 2]
+        with self.assertRaises(TypeValueMismatchError) as context:
+            Parser.validate_and_parse(Catalog, data)
+        self.assertIn("item 1 is int", str(context.exception))
+        data = catalog()
+        data['products'][0]['reviews'][0]['comment'] = 1
+        with self.assertRaises(TypeValueMismatchError) as context:
+            Parser.validate_and_parse(Catalog, data)
+        self.assertEqual(context.exception.field_name, 'comment')
+
+    def test_agrees_with_decoder(self):
+        cases = [({'ratio': 1}, []), ({'ratios': [1, None, 2.5]}, []), ({'pair': [1.5, 2]}, []), ({'total': 1.5}, []),
+                 ({'count': 1.5}, ['count']), ({'counts': [1, 2.5]}, ['counts[1]']),
+                 ({'totals': {'a': 1.5}}, ['totals.a']), ({'ratios': ["1"]}, ['ratios[0]'])]
+        for data, locations in cases:
+            with self.subTest(data=data):
+                report = Parser.validate_and_report(Numbers, data)
+                self.assertEqual([error.location for error in report.errors], locations)
+                self.assertEqual(report.ok, not locations)
+                if locations:
+                    self.assertIsNone(report.value)
+                    with self.assertRaises(TypeValueMismatchError):
+                        Parser.validate_and_parse(Numbers, data)
+                else:
+                    self.assertEqual(report.value, Parser.validate_and_parse(Numbers, data))
+
+    def test_failed_decode_is_never_ok(self):
+        with mock.patch.object(Parser, '_collect', staticmethod(lambda *args: None)):
+            report = Parser.validate_and_report(Numbers, {'count': 1.5})
+            self.assertFalse(report.ok)
+            self.assertEqual(report.errors, [FieldError(('count',), Optional[int], float)])
+            report = Parser.validate_and_report(Catalog, {'owner': "o"})
+            self.assertFalse(report.ok)
+            self.assertTrue(report.errors[0].missing)
+
+
+if __name__ == '__main__':
+    unittest.main()
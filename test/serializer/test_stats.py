@@ -0,0 +1,95 @@
+import json
+import unittest
+from dataclasses import dataclass
+from typing import List, Optional
+
+from object_serializer.exceptions import TypeValueMismatchError
+from object_serializer.serializer.json_parser import Parser
+from object_serializer.serializer.stats import ParserStats
+
+
+@dataclass
+class Inner:
+    born_in: str
+    city_cap: int
+
+
+@dataclass
+class Person:
+    name: str
+    age: int
+    tags: List[str]
+    info: Optional[Inner]
+
+
+PERSON = {'name': "a", 'age': 1, 'tags': ['x'], 'info': {'born_in': 'x', 'city_cap': 1}}
+
+
+class TestStats(unittest.TestCase):
+    test_case_ids = {
+        "test_disabled_by_default": "TCL_01",
+        "test_validate_and_parse_phases": "TCL_02",
+        "test_batch_counts_and_errors": "TCL_03",
+        "test_cache_info": "TCL_04",
+        "test_callback_and_report": "TCL_05"
+    }
+
+    def setUp(self):
+        self.stats = Parser.enable_stats()
+
+    def tearDown(self):
+        Parser.disable_stats()
+
+    def test_disabled_by_default(self):
+        self.assertIs(Parser.disable_stats(), self.stats)
+        self.assertIsNone(Parser.get_stats())
+        Parser.validate_and_parse(Person, PERSON)
+        self.assertEqual(self.stats.classes, {})
+
+    def test_validate_and_parse_phases(self):
+        Parser.validate_and_parse(Person, json.dumps(PERSON))
+        person = self.stats.classes[Person]
+        self.assertEqual(person.calls['parse'], 1)
+        self.assertEqual(person.calls['plan'], 1)
+        self.assertEqual(person.calls['decode'], 1)
+        self.assertEqual(person.objects, 1)
+        self.assertEqual(self.stats.classes[Inner].objects, 1)
+        self.assertGreater(person.seconds['decode'], 0.0)
+        self.assertGreaterEqual(person.seconds['decode'], person.seconds['construct'])
+
+    def test_batch_counts_and_errors(self):
+        records = [json.dumps(PERSON), '{"name": ', json.dumps(dict(PERSON, age="1"))]
+        result = Parser.validate_and_parse_many(Person, records, fail_fast=False)
+        self.assertEqual(len(result.errors), 2)
+        person = self.stats.classes[Person]
+        self.assertEqual(person.calls['parse'], 3)
+        self.assertEqual(person.calls['decode'], 2)
+        self.assertEqual(person.errors, 2)
+        with self.assertRaises(TypeValueMismatchError):
+            Parser.validate_and_parse(Person, dict(PERSON, age="1"))
+        self.assertEqual(person.errors, 3)
+
+    def test_cache_info(self):
+        Parser.validate_and_parse(Person, PERSON)
+        Parser.validate_and_parse(Person, PERSON)
+        info = self.stats.cache_info()
+        self.assertGreaterEqual(info.hits, 1)
+        self.stats.reset()
+        self.assertEqual(self.stats.cache_info().hits, 0)
+        self.assertEqual(self.stats.classes, {})
+
+    def test_callback_and_report(self):
+        events = []
+        Parser.enable_stats(ParserStats(lambda cls, phase, elapsed: events.append((cls, phase))))
+        Parser.validate_and_parse(Person, PERSON)
+        self.assertIn((Person, 'decode'), events)
+        self.assertIn((Inner, 'construct'), events)
+        stats = Parser.get_stats()
+        report = stats.report()
+        self.assertIn('Person', report)
+        self.assertIn('plan cache', report)
+        self.assertEqual(json.loads(json.dumps(stats.as_dict()))['classes']['Person']['objects'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
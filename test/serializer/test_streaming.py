@@ -0,0 +1,231 @@
+import io
+import json
+import os
+import tempfile
+import time
+import unittest
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+from object_serializer.exceptions import (StreamDecodeError, TypeValueMismatchError, UnresolvedAttributeError,
+                                          InvalidDataTypeError)
+from object_serializer.serializer.json_parser import Parser
+from object_serializer.serializer.streaming import DEFAULT_CHUNK_SIZE
+
+
+@dataclass
+class Review:
+    rating: int
+    comment: str
+
+
+@dataclass
+class Event:
+    id: int
+    name: str
+    tags: List[str]
+    review: Optional[Review]
+
+
+@dataclass
+class EventPage:
+    total: int
+    source: Review
+    events: List[Event]
+    ids: Optional[List[int]]
+
+
+@dataclass
+class Catalog:
+    name: str
+    events: List[Event] = field(default_factory=list)
+    ids: List[int] = field(default_factory=lambda: [1, 2])
+
+
+def event(index):
+    return {'id': index, 'name': f"événement {index}", 'tags': ['a', 'b'],
+            'review': {'rating': index % 5, 'comment': 'ok'}}
+
+
+def page(**members):
+    return json.dumps(dict({'total': 0, 'source': {'rating': 1, 'comment': 'c'}, 'events': []}, **members))
+
+
+class TestStreaming(unittest.TestCase):
+    test_case_ids = {
+        "test_ndjson_text": "TCL_01",
+        "test_ndjson_path": "TCL_02",
+        "test_ndjson_is_lazy": "TCL_03",
+        "test_ndjson_error_location": "TCL_04",
+        "test_json_array_small_chunks": "TCL_05",
+        "test_json_array_binary": "TCL_06",
+        "test_json_array_empty": "TCL_07",
+        "test_json_array_error_location": "TCL_08",
+        "test_json_array_syntax_error": "TCL_09",
+        "test_field_stream": "TCL_10",
+        "test_field_stream_primitives": "TCL_11",
+        "test_field_stream_error_location": "TCL_12",
+        "test_field_stream_null_and_missing": "TCL_13",
+        "test_field_stream_invalid_field": "TCL_14",
+        "test_large_chunks": "TCL_15",
+        "test_field_stream_defaults": "TCL_16",
+        "test_byte_order_mark": "TCL_17",
+        "test_field_stream_validates_document": "TCL_18"
+    }
+
+    def test_ndjson_text(self):
+        text = '\n'.join(json.dumps(event(i)) for i in range(5)) + '\n\n'
+        result = list(Parser.iter_ndjson(Event, io.StringIO(text)))
+
+        self.assertEqual([value.id for value in result], list(range(5)))
+        self.assertIsInstance(result[0].review, Review)
+
+    def test_ndjson_path(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'events.ndjson')
+            with open(path, 'w', encoding='utf-8') as fp:
+                for i in range(3):
+                    fp.write(json.dumps(event(i), ensure_ascii=False) + '\n')
+
+            result = list(Parser.iter_ndjson(Event, path))
+        self.assertEqual(result[2].name, 'événement 2')
+
+    def test_ndjson_is_lazy(self):
+        lines = iter([json.dumps(event(0)) + '\n', '{"broken\n'])
+        stream = Parser.iter_ndjson(Event, lines)
+
+        self.assertEqual(next(stream).id, 0)
+        with self.assertRaises(StreamDecodeError):
+            next(stream)
+
+    def test_ndjson_error_location(self):
+        bad = dict(event(2), id='two')
+        lines = [json.dumps(event(0)), json.dumps(event(1)), json.dumps(bad)]
+        text = '\n'.join(lines) + '\n'
+
+        with self.assertRaises(StreamDecodeError) as context:
+            list(Parser.iter_ndjson(Event, io.StringIO(text)))
+        self.assertEqual(context.exception.line, 3)
+        self.assertEqual(context.exception.offset, len(lines[0]) + len(lines[1]) + 2)
+        self.assertIsInstance(context.exception.error, TypeValueMismatchError)
+
+    def test_json_array_small_chunks(self):
+        text = json.dumps([event(i) for i in range(50)], indent=2)
+        result = list(Parser.iter_json_array(Event, io.StringIO(text), chunk_size=7))
+
+        self.assertEqual([value.id for value in result], list(range(50)))
+
+    def test_json_array_binary(self):
+        data = json.dumps([event(i) for i in range(20)], ensure_ascii=False).encode('utf-8')
+        result = list(Parser.iter_json_array(Event, io.BytesIO(data), chunk_size=5))
+
+        self.assertEqual([value.name for value in result], [f"événement {i}" for i in range(20)])
+
+    def test_json_array_empty(self):
+        self.assertEqual(list(Parser.iter_json_array(Event, io.StringIO(' [ ] '))), [])
+
+    def test_json_array_error_location(self):
+        text = '[\n' + json.dumps(event(0)) + ',\n' + json.dumps(dict(event(1), tags=[1])) + '\n]'
+
+        with self.assertRaises(StreamDecodeError) as context:
+            list(Parser.iter_json_array(Event, io.StringIO(text), chunk_size=16))
+        self.assertEqual(context.exception.line, 3)
+        self.assertEqual(context.exception.offset, text.index(',\n') + 2)
+
+    def test_json_array_syntax_error(self):
+        for text in ('{"id": 1}', '[' + json.dumps(event(0)) + ' ' + json.dumps(event(1)) + ']',
+                     '[' + json.dumps(event(0)), '[] []'):
+            with self.assertRaises(StreamDecodeError):
+                list(Parser.iter_json_array(Event, io.StringIO(text), chunk_size=4))
+
+    def test_field_stream(self):
+        page = {'total': 30, 'source': {'rating': 1, 'comment': '{[}]'},
+                'events': [event(i) for i in range(30)], 'ids': [1, 2]}
+        text = json.dumps(page, indent=2)
+        stream = Parser.iter_field(EventPage, io.StringIO(text), 'events', chunk_size=11)
+
+        result = list(stream)
+        self.assertEqual([value.id for value in result], list(range(30)))
+        self.assertIsInstance(result[0], Event)
+
+    def test_field_stream_primitives(self):
+        text = page(ids=[3, 4, 5])
+        self.assertEqual(list(Parser.iter_field(EventPage, io.StringIO(text), 'ids')), [3, 4, 5])
+
+    def test_field_stream_error_location(self):
+        text = '{"total": 2,\n "events": [\n' + json.dumps(event(0)) + ',\n{"id": "x"}]}'
+
+        with self.assertRaises(StreamDecodeError) as context:
+            list(Parser.iter_field(EventPage, io.StringIO(text), 'events', chunk_size=8))
+        self.assertEqual(context.exception.line, 4)
+        self.assertIsInstance(context.exception.error, TypeValueMismatchError)
+
+    def test_field_stream_null_and_missing(self):
+        self.assertEqual(list(Parser.iter_field(EventPage, io.StringIO(page(ids=None)), 'ids')), [])
+        self.assertEqual(list(Parser.iter_field(EventPage, io.StringIO(page()), 'ids')), [])
+        with self.assertRaises(StreamDecodeError):
+            list(Parser.iter_field(EventPage, io.StringIO(page(events=1)), 'events'))
+        with self.assertRaises(UnresolvedAttributeError):
+            list(Parser.iter_field(EventPage, io.StringIO('{}'), 'events'))
+
+    def test_field_stream_invalid_field(self):
+        with self.assertRaises(UnresolvedAttributeError):
+            Parser.iter_field(EventPage, io.StringIO('{}'), 'missing')
+        with self.assertRaises(InvalidDataTypeError):
+            Parser.iter_field(EventPage, io.StringIO('{}'), 'total')
+
+    def test_large_chunks(self):
+        # the line of every element is counted incrementally: with a buffer holding the whole document,
+        # counting from the start of the buffer for each element made streaming quadratic
+        records = [event(i) for i in range(10000)]
+        text = json.dumps(records, indent=1)
+        start = time.perf_counter()
+        expected = [Parser.validate_and_parse(Event, record) for record in json.loads(text)]
+        eager = time.perf_counter() - start
+        start = time.perf_counter()
+        result = list(Parser.iter_json_array(Event, io.StringIO(text), chunk_size=len(text) * 2))
+        streamed = time.perf_counter() - start
+        self.assertEqual(result, expected)
+        self.assertLess(streamed, eager * 4 + 0.1)
+
+        text = text[:-2] + ',\n' + json.dumps(dict(event(0), id='x'), indent=1) + ']'
+        with self.assertRaises(StreamDecodeError) as context:
+            list(Parser.iter_json_array(Event, io.StringIO(text), chunk_size=len(text) * 2))
+        self.assertEqual(context.exception.line, text.count('\n', 0, text.rindex('\n{')) + 2)
+
+    def test_field_stream_defaults(self):
+        self.assertEqual(list(Parser.iter_field(Catalog, io.StringIO('{"name": "c"}'), 'events')), [])
+        self.assertEqual(list(Parser.iter_field(Catalog, io.StringIO('{"name": "c"}'), 'ids')), [1, 2])
+        self.assertEqual(list(Parser.iter_field(Catalog, io.StringIO('{"name": "c", "ids": [3]}'), 'ids')), [3])
+        self.assertEqual(len(Parser.field_columns(Catalog, io.StringIO('{"name": "c"}'), 'events')), 0)
+        with self.assertRaises(StreamDecodeError):
+            list(Parser.iter_field(Catalog, io.StringIO('{"name": "c", "events": null}'), 'events'))
+
+    def test_byte_order_mark(self):
+        bom = '\ufeff'.encode('utf-8')
+        data = json.dumps([event(i) for i in range(3)]).encode('utf-8')
+        for chunk_size in (1, 2, DEFAULT_CHUNK_SIZE):
+            with self.subTest(chunk_size=chunk_size):
+                result = list(Parser.iter_json_array(Event, io.BytesIO(bom + data), chunk_size=chunk_size))
+                self.assertEqual([value.id for value in result], [0, 1, 2])
+        document = page(ids=[1, 2]).encode('utf-8')
+        self.assertEqual(list(Parser.iter_field(EventPage, io.BytesIO(bom + document), 'ids')), [1, 2])
+        with self.assertRaises(StreamDecodeError) as context:
+            list(Parser.iter_json_array(Event, io.BytesIO(bom + b'[{"id": "x"}]')))
+        self.assertEqual(context.exception.offset, 1)
+
+    def test_field_stream_validates_document(self):
+        # the members around the streamed field are validated and the object is read up to its end
+        events = [event(0), event(1)]
+        for text in (page(events=events, total='x'), page(events=events, source={'rating': 1}),
+                     page(events=events) + ' x', page(events=events)[:-1] + ' x}', page(events=events)[:-1]):
+            with self.subTest(text=text), self.assertRaises(StreamDecodeError):
+                list(Parser.iter_field(EventPage, io.StringIO(text), 'events', chunk_size=8))
+        with self.assertRaises(UnresolvedAttributeError):
+            list(Parser.iter_field(EventPage, io.StringIO(json.dumps({'events': events})), 'events'))
+        with self.assertRaises(StreamDecodeError):
+            Parser.field_columns(EventPage, io.StringIO(page(events=events, total='x')), 'events')
+        with self.assertRaises(StreamDecodeError):
+            Parser.field_columns(EventPage, io.StringIO(page(events=events) + ' x'), 'events')
+        with self.assertRaises(UnresolvedAttributeError):
+            Parser.field_columns(EventPage, io.StringIO('{"events": []}'), 'events')
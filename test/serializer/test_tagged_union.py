@@ -0,0 +1,159 @@
+import json
+import pickle
+import unittest
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+from object_serializer import TaggedUnion
+from object_serializer.exceptions import NotADataclassError, TypeValueMismatchError, UnresolvedAttributeError
+from object_serializer.serializer.decoder_plan import PlanKind, get_plan
+from object_serializer.serializer.json_parser import Parser
+
+
+@dataclass
+class Click:
+    x: int
+    y: int
+    type: str = 'click'
+
+
+@dataclass
+class View:
+    page: str
+    type: str = 'view'
+
+
+@dataclass
+class Purchase:
+    amount: float
+    items: List[str] = field(default_factory=list)
+
+
+Event = TaggedUnion('type', [Click, View])
+Action = TaggedUnion('kind', {'click': Click, 'purchase': Purchase}, name='Action')
+
+
+@dataclass
+class Session:
+    id: int
+    events: List[Event]
+    last: Optional[Action] = None
+
+
+SESSION = {'id': 1, 'events': [{'type': 'click', 'x': 1, 'y': 2}, {'type': 'view', 'page': "/"}],
+           'last': {'kind': 'purchase', 'amount': 9.5}}
+
+
+class TestTaggedUnion(unittest.TestCase):
+    test_case_ids = {
+        "test_declaration": "TCL_01",
+        "test_invalid_declaration": "TCL_02",
+        "test_plan": "TCL_03",
+        "test_decode_field": "TCL_04",
+        "test_decode_root": "TCL_05",
+        "test_compiled_decoder_agrees": "TCL_06",
+        "test_mismatches": "TCL_07",
+        "test_report": "TCL_08",
+        "test_encode_round_trip": "TCL_09",
+        "test_batch_and_stream": "TCL_10",
+        "test_root_options": "TCL_11"
+    }
+
+    def test_declaration(self):
+        self.assertEqual(Event.tags, ('click', 'view'))
+        self.assertEqual(Event.classes, (Click, View))
+        self.assertEqual(Action.tag_of(Purchase), 'purchase')
+        self.assertEqual(repr(Action), "Action('kind', {'click': Click, 'purchase': Purchase})")
+        self.assertEqual(TaggedUnion('type', [Click, View]), Event)
+        self.assertIs(get_plan(TaggedUnion('type', [Click, View])), get_plan(Event))
+        self.assertEqual(pickle.loads(pickle.dumps(Action)), Action)
+
+    def test_invalid_declaration(self):
+        with self.assertRaises(ValueError):
+            TaggedUnion('type', [Click, Purchase])
+        with self.assertRaises(ValueError):
+            TaggedUnion('type', [Click, Click])
+        with self.assertRaises(NotADataclassError):
+            TaggedUnion('type', {'a': int})
+
+    def test_plan(self):
+        plan = get_plan(Event)
+        self.assertEqual(plan.kind, PlanKind.TAGGED)
+        self.assertIs(plan.dispatch['click'], get_plan(Click))
+        self.assertIs(plan.dispatch['view'], get_plan(View))
+
+    def test_decode_field(self):
+        session = Parser.validate_and_parse(Session, json.dumps(SESSION))
+        self.assertEqual(session, Session(1, [Click(1, 2), View("/")], Purchase(9.5)))
+        self.assertIsNone(Parser.validate_and_parse(Session, {'id': 1, 'events': []}).last)
+
+    def test_decode_root(self):
+        self.assertEqual(Parser.validate_and_parse(Event, '{"type": "view", "page": "/a"}'), View("/a"))
+        self.assertEqual(Event({'type': 'click', 'x': 3, 'y': 4}), Click(3, 4))
+        self.assertEqual(Parser.compile(Action)({'kind': 'click', 'x': 1, 'y': 1}), Click(1, 1))
+
+    def test_compiled_decoder_agrees(self):
+        decode = Parser.compile(Session)
+        self.assertEqual(decode(SESSION), Parser.validate_and_parse(Session, SESSION))
+        invalid = [{'id': 1, 'events': [{'type': 'scroll'}]}, {'id': 1, 'events': [{'x': 1, 'y': 2}]},
+                   {'id': 1, 'events': [{'type': ['click'], 'x': 1, 'y': 2}]}, {'id': 1, 'events': [3]},
+                   {'id': 1, 'events': [{'type': 'click', 'x': "1", 'y': 2}]}, {'id': 1, 'events': [], 'last': "x"}]
+        for data in invalid:
+            with self.subTest(data=data):
+                with self.assertRaises((TypeValueMismatchError, UnresolvedAttributeError)) as generic:
+                    Parser.validate_and_parse(Session, data)
+                with self.assertRaises(type(generic.exception)) as compiled:
+                    decode(data)
+                self.assertEqual(str(compiled.exception), str(generic.exception))
+
+    def test_mismatches(self):
+        with self.assertRaises(TypeValueMismatchError) as context:
+            Parser.validate_and_parse(Session, {'id': 1, 'events': [{'type': 'scroll'}]})
+        self.assertEqual(str(context.exception), "Unknown type 'scroll' at field events, expected one of "
+                                                 "('click', 'view')")
+        with self.assertRaises(UnresolvedAttributeError) as context:
+            Parser.validate_and_parse(Action, {'amount': 1.0})
+        self.assertEqual(context.exception.field_name, 'kind')
+        with self.assertRaises(TypeValueMismatchError):
+            Parser.validate_and_parse(Event, {'type': 'click', 'x': "1", 'y': 2})
+        with self.assertRaises(TypeValueMismatchError):
+            Parser.compile(Event)([])
+
+    def test_report(self):
+        report = Parser.validate_and_report(Session, {'id': 1, 'events': [{'type': 'click', 'x': 1, 'y': "2"},
+                                                                          {'type': 'scroll'}, {'page': "/"}]})
+        self.assertEqual([error.location for error in report.errors],
+                         ['events[0].y', 'events[1].type', 'events[2].type'])
+        self.assertEqual([error.missing for error in report.errors], [False, False, True])
+
+    def test_encode_round_trip(self):
+        session = Parser.validate_and_parse(Session, SESSION)
+        data = Parser.dump(session)
+        self.assertEqual(data['events'], SESSION['events'])
+        # Purchase does not declare the tag field, the encoder writes it
+        self.assertEqual(data['last'], {'amount': 9.5, 'items': [], 'kind': 'purchase'})
+        self.assertEqual(Parser.validate_and_parse(Session, data), session)
+
+    def test_batch_and_stream(self):
+        records = ['{"type": "click", "x": 1, "y": 2}', {'type': 'view', 'page': "/"}, {'type': 'other'}]
+        result = Parser.validate_and_parse_many(Event, records, fail_fast=False)
+        self.assertEqual(result.values, [Click(1, 2), View("/")])
+        self.assertEqual([error.index for error in result.errors], [2])
+        stats = Parser.enable_stats()
+        try:
+            self.assertEqual(Parser.validate_and_parse(Event, {'type': 'view', 'page': "/"}), View("/"))
+        finally:
+            Parser.disable_stats()
+        self.assertIn('TaggedUnion', stats.report())
+
+    def test_root_options(self):
+        with self.assertRaises(ValueError):
+            Parser.validate_and_parse(Event, {'type': 'view', 'page': "/"}, lazy=True)
+        with self.assertRaises(ValueError):
+            Parser.validate_and_parse_many(Event, [], include=['page'])
+        with self.assertRaises(NotADataclassError):
+            Parser.compile(List[int])
+
+
+if __name__ == '__main__':
+    unittest.main()
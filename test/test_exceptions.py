@@ -0,0 +1,72 @@
+import pickle
+import unittest
+
+from typing import List
+
+from object_serializer.exceptions import (JSON_EXCERPT_LENGTH, NotADataclassError, NotAJsonError, StreamDecodeError,
+                                          TypeValueMismatchError, UnresolvedAttributeError)
+
+
+class Product:
+    pass
+
+
+class TestExceptions(unittest.TestCase):
+    test_case_ids = {
+        "test_type_mismatch_messages": "TCL_01",
+        "test_unresolved_attribute_messages": "TCL_02",
+        "test_json_excerpt": "TCL_03",
+        "test_stream_error_message": "TCL_04",
+        "test_pickle": "TCL_05",
+        "test_not_a_dataclass_message": "TCL_06"
+    }
+
+    def test_type_mismatch_messages(self):
+        error = TypeValueMismatchError('id', int, str)
+        self.assertEqual(error.args, ('id', int, str))
+        self.assertEqual(str(error), "Expected type <class 'int'> at field id, found <class 'str'> instead")
+        error = TypeValueMismatchError('tags', list, list, template=TypeValueMismatchError.LIST_ITEM, index=2,
+                                       item_type=int, expected=str)
+        self.assertEqual(str(error), "List items at field tags do not match the expected type: item 2 is int, "
+                                     "expected str")
+        self.assertEqual(str(TypeValueMismatchError('id', int, str, "custom {message}")), "custom {message}")
+
+    def test_unresolved_attribute_messages(self):
+        error = UnresolvedAttributeError(Product, {}, 'name')
+        self.assertEqual(str(error), "Missing mandatory field name in class Product")
+        self.assertEqual(str(UnresolvedAttributeError(None, {}, 'name')), "Missing mandatory field name")
+        self.assertEqual(str(UnresolvedAttributeError(Product, {}, 'name', "Class Product has no field name")),
+                         "Class Product has no field name")
+
+    def test_json_excerpt(self):
+        payload = '{"a": ' + '1' * 1000
+        message = str(NotAJsonError(payload))
+        self.assertIn(payload[:JSON_EXCERPT_LENGTH], message)
+        self.assertNotIn(payload[:JSON_EXCERPT_LENGTH + 1], message)
+        self.assertIn(f"({len(payload)} characters)", message)
+        self.assertIn("(1006 bytes)", str(NotAJsonError(payload.encode())))
+        self.assertEqual(str(NotAJsonError('{')), "The provided JSON string is not valid: {")
+
+    def test_stream_error_message(self):
+        error = StreamDecodeError(3, 42, TypeValueMismatchError('id', int, str))
+        self.assertEqual(str(error), "Invalid record at line 3, offset 42: Expected type <class 'int'> at field id, "
+                                     "found <class 'str'> instead")
+
+    def test_pickle(self):
+        errors = [TypeValueMismatchError('tags', list, list, template=TypeValueMismatchError.LIST_ITEM, index=0,
+                                         item_type=int, expected=str),
+                  UnresolvedAttributeError(None, {'id': 1}, 'name'), NotAJsonError('{'),
+                  StreamDecodeError(1, 0, UnresolvedAttributeError(None, {}, 'id'))]
+        for error in errors:
+            with self.subTest(error=type(error).__name__):
+                self.assertEqual(str(pickle.loads(pickle.dumps(error))), str(error))
+
+    def test_not_a_dataclass_message(self):
+        self.assertEqual(str(NotADataclassError(Product)), "The class Product is not a dataclass.")
+        # values without a __name__ (generic aliases before Python 3.10) are shown through their repr
+        self.assertEqual(str(NotADataclassError(3)), "The class 3 is not a dataclass.")
+        self.assertIn("List", str(NotADataclassError(List[int])))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,170 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+from pathlib import Path
+from dataclasses import dataclass
+from typing import List
+
+from object_serializer.serializer.json_parser import Parser
+from object_serializer.utils import json_backend
+from object_serializer.utils.json_backend import JsonBackend, available_backends, get_backend, set_default_backend
+from object_serializer.utils.validations import Validator
+
+
+@dataclass
+class Point:
+    x: int
+    tags: List[str]
+
+
+DOCUMENT = '{"x": 1, "tags": ["a", "è"]}'
+
+
+class TestJsonBackend(unittest.TestCase):
+    test_case_ids = {
+        "test_stdlib_is_always_available": "TCL_01",
+        "test_binary_input": "TCL_02",
+        "test_errors_are_normalized": "TCL_03",
+        "test_dumps_round_trip": "TCL_04",
+        "test_unknown_backend": "TCL_05",
+        "test_set_default_backend": "TCL_06",
+        "test_parser_backend_argument": "TCL_07",
+        "test_load_path": "TCL_08",
+        "test_parser_binary_and_path_input": "TCL_09",
+        "test_default_is_stdlib": "TCL_10",
+        "test_invalid_utf8": "TCL_11"
+    }
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = Path(directory.name)
+
+    def write(self, name: str, content: bytes) -> Path:
+        path = self.directory / name
+        path.write_bytes(content)
+        return path
+
+    def test_stdlib_is_always_available(self):
+        self.assertIn('json', available_backends())
+        self.assertIsInstance(get_backend(), JsonBackend)
+        self.assertIs(get_backend('json'), get_backend(get_backend('json')))
+
+    def test_binary_input(self):
+        expected = json.loads(DOCUMENT)
+        encoded = DOCUMENT.encode('utf-8')
+        for name in available_backends():
+            backend = get_backend(name)
+            for data in (DOCUMENT, encoded, bytearray(encoded), memoryview(encoded)):
+                with self.subTest(backend=name, type=type(data).__name__):
+                    self.assertEqual(backend.loads(data), expected)
+
+    def test_errors_are_normalized(self):
+        for name in available_backends():
+            with self.subTest(backend=name):
+                with self.assertRaises(json.JSONDecodeError):
+                    get_backend(name).loads('{"x": ')
+                self.assertFalse(Validator.validate_json(b'[1, 2', backend=name))
+
+    def test_dumps_round_trip(self):
+        value = {"b": [1, 2.5, None, True], "a": "è"}
+        for name in available_backends():
+            with self.subTest(backend=name):
+                backend = get_backend(name)
+                self.assertEqual(json.loads(backend.dumps(value)), value)
+                self.assertEqual(json.loads(backend.dumps(value, sort_keys=True, indent=2)), value)
+                self.assertEqual(json.loads(backend.dumps({"n": 2 ** 70})), {"n": 2 ** 70})
+
+    def test_unknown_backend(self):
+        with self.assertRaises(ValueError):
+            get_backend('simplejson2')
+        with self.assertRaises(ValueError):
+            set_default_backend('simplejson2')
+
+    def test_set_default_backend(self):
+        previous = get_backend()
+        try:
+            self.assertIs(set_default_backend('json'), get_backend('json'))
+            self.assertIs(get_backend(), get_backend('json'))
+        finally:
+            json_backend._default_backend = previous
+
+    def test_parser_backend_argument(self):
+        for name in available_backends():
+            with self.subTest(backend=name):
+                point = Parser.validate_and_parse(Point, DOCUMENT, backend=name)
+                self.assertEqual(point, Point(1, ["a", "è"]))
+                result = Parser.validate_and_parse_many(Point, [DOCUMENT.encode('utf-8'), '{"x": '],
+                                                        fail_fast=False, backend=name)
+                self.assertEqual(result.values, [point])
+                self.assertIsInstance(result.errors[0].error, json.JSONDecodeError)
+                self.assertEqual(json.loads(Parser.dumps(point, backend=name)), json.loads(DOCUMENT))
+
+    def test_load_path(self):
+        expected = json.loads(DOCUMENT)
+        paths = [self.write('utf8.json', DOCUMENT.encode('utf-8')), self.write('utf16.json', DOCUMENT.encode('utf-16'))]
+        for name in available_backends():
+            backend = get_backend(name)
+            with self.subTest(backend=name):
+                self.assertEqual(backend.load_path(paths[0]), expected)
+                if name == 'json':
+                    self.assertEqual(backend.load_path(paths[1]), expected)
+                with self.assertRaises(json.JSONDecodeError):
+                    backend.load_path(self.write('empty.json', b''))
+                with self.assertRaises(json.JSONDecodeError):
+                    backend.load_path(self.write('invalid.json', b'{"x": '))
+                with self.assertRaises(OSError):
+                    backend.load_path(self.directory / 'missing.json')
+
+    def test_parser_binary_and_path_input(self):
+        encoded = DOCUMENT.encode('utf-8')
+        path = self.write('point.json', encoded)
+        expected = Point(1, ["a", "è"])
+        for name in available_backends():
+            for data in (encoded, bytearray(encoded), memoryview(encoded), path, os.fsencode(path)):
+                if isinstance(data, bytes) and data is not encoded:
+                    # a bytes path is JSON bytes, only os.PathLike objects are paths
+                    continue
+                with self.subTest(backend=name, type=type(data).__name__):
+                    self.assertEqual(Parser.validate_and_parse(Point, data, backend=name), expected)
+                    self.assertEqual(Parser.validate_and_parse(Point, data, backend=name, iterative=True), expected)
+                    self.assertEqual(Parser.validate_and_report(Point, data, backend=name).value, expected)
+            with self.subTest(backend=name, call='batch'):
+                result = Parser.validate_and_parse_many(Point, [path, memoryview(encoded), {'x': 2, 'tags': []}],
+                                                        backend=name)
+                self.assertEqual(result.values, [expected, expected, Point(2, [])])
+                self.assertEqual(len(Parser.validate_columns(Point, [path, bytearray(encoded)], backend=name)), 2)
+        self.assertEqual(Parser.parse_json(path), json.loads(DOCUMENT))
+
+    def test_default_is_stdlib(self):
+        with mock.patch.dict(os.environ, {json_backend.BACKEND_ENVIRON: ''}):
+            self.assertIs(json_backend._initial_backend(), get_backend('json'))
+        for name in available_backends():
+            with self.subTest(backend=name), mock.patch.dict(os.environ, {json_backend.BACKEND_ENVIRON: name}):
+                self.assertIs(json_backend._initial_backend(), get_backend(name))
+        # documents the standard library accepts and some other backends do not, or read differently
+        self.assertEqual(get_backend('json').loads('{"a": 123456789012345678901234567890}'),
+                         {'a': 123456789012345678901234567890})
+        self.assertEqual(str(get_backend('json').loads('[NaN, Infinity]')), '[nan, inf]')
+
+    def test_invalid_utf8(self):
+        for name in available_backends():
+            backend = get_backend(name)
+            for data in (b'\xff', bytearray(b'"\xff"'), memoryview(b'["\xc3"]')):
+                with self.subTest(backend=name, type=type(data).__name__):
+                    with self.assertRaises(json.JSONDecodeError):
+                        backend.loads(data)
+                    self.assertFalse(Validator.validate_json(data, backend=name))
+            with self.subTest(backend=name, call='batch'):
+                result = Parser.validate_and_parse_many(Point, [b'\xff', DOCUMENT], fail_fast=False, backend=name)
+                self.assertEqual(result.values, [Point(1, ["a", "è"])])
+                self.assertIsInstance(result.errors[0].error, json.JSONDecodeError)
+                with self.assertRaises(json.JSONDecodeError):
+                    backend.load_path(self.write('latin1.json', '["è"]'.encode('latin-1')))
+
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+import unittest
+import uuid
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from enum import Enum
+from pathlib import PurePosixPath
+
+from object_serializer.utils import type_registry
+from object_serializer.utils.type_registry import ScalarRegistry, JSON_PRIMITIVE_TYPES
+
+
+class Color(Enum):
+    RED = 'red'
+    GREEN = 'green'
+
+
+class TestTypeRegistry(unittest.TestCase):
+    test_case_ids = {
+        "test_primitive_types": "TCL_01",
+        "test_builtin_scalars": "TCL_02",
+        "test_enum_subclasses": "TCL_03",
+        "test_coercers": "TCL_04",
+        "test_coercer_errors": "TCL_05",
+        "test_custom_scalar": "TCL_06",
+        "test_primitive_cannot_be_registered": "TCL_07"
+    }
+
+    def test_primitive_types(self):
+        self.assertEqual(JSON_PRIMITIVE_TYPES, frozenset({str, int, float, bool, dict, list}))
+        self.assertTrue(type_registry.is_primitive_type(int))
+        self.assertFalse(type_registry.is_primitive_type(bytes))
+        self.assertFalse(type_registry.is_primitive_type(object))
+
+    def test_builtin_scalars(self):
+        for tp in (datetime, date, Decimal, uuid.UUID):
+            self.assertTrue(type_registry.is_scalar_type(tp), tp)
+        self.assertFalse(type_registry.is_scalar_type(bytes))
+
+    def test_enum_subclasses(self):
+        self.assertTrue(type_registry.is_scalar_type(Color))
+        coercer = type_registry.get_scalar_coercer(Color)
+        self.assertIs(coercer(Color, 'red'), Color.RED)
+
+    def test_coercers(self):
+        def coerce(tp, value):
+            return type_registry.get_scalar_coercer(tp)(tp, value)
+
+        self.assertEqual(coerce(datetime, '2024-05-23T08:56:21.618Z'),
+                         datetime(2024, 5, 23, 8, 56, 21, 618000, tzinfo=timezone.utc))
+        self.assertEqual(coerce(date, '2024-05-23'), date(2024, 5, 23))
+        self.assertEqual(coerce(Decimal, 0.1), Decimal('0.1'))
+        self.assertEqual(coerce(Decimal, '12.50'), Decimal('12.50'))
+        value = uuid.uuid4()
+        self.assertEqual(coerce(uuid.UUID, str(value)), value)
+        self.assertIs(coerce(uuid.UUID, value), value)
+
+    def test_coercer_errors(self):
+        def coerce(tp, value):
+            return type_registry.get_scalar_coercer(tp)(tp, value)
+
+        for tp, value in ((datetime, 10), (datetime, 'yesterday'), (Decimal, True),
+                          (Decimal, 'abc'), (uuid.UUID, 'not-a-uuid'), (Color, 'blue')):
+            with self.assertRaises((TypeError, ValueError)):
+                coerce(tp, value)
+
+    def test_custom_scalar(self):
+        registry = ScalarRegistry()
+        registry.register(PurePosixPath, lambda tp, value: tp(value))
+
+        self.assertEqual(registry.get_coercer(PurePosixPath)(PurePosixPath, '/tmp'), PurePosixPath('/tmp'))
+        registry.unregister(PurePosixPath)
+        self.assertIsNone(registry.get_coercer(PurePosixPath))
+
+    def test_primitive_cannot_be_registered(self):
+        with self.assertRaises(ValueError):
+            ScalarRegistry().register(int, lambda tp, value: value)